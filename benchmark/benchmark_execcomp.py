@@ -0,0 +1,38 @@
+import unittest
+
+from openmdao.api import Problem, Group, ExecComp, IndepVarComp, NonlinearBlockGS
+
+
+def _build_cycle(ncomps):
+    """Build a cycle of ExecComps converged with NonlinearBlockGS."""
+    p = Problem()
+    model = p.model
+    model.add_subsystem('px', IndepVarComp('x', 1.0))
+
+    cycle = model.add_subsystem('cycle', Group())
+    for i in range(ncomps):
+        cycle.add_subsystem('c%d' % i, ExecComp(['y = 0.5 * x + 0.1 * sin(z) + 1.0',
+                                                 'w = y * y - 0.25 * z']))
+
+    model.connect('px.x', 'cycle.c0.x')
+    for i in range(1, ncomps):
+        cycle.connect('c%d.y' % (i - 1), 'c%d.x' % i)
+    for i in range(ncomps):
+        cycle.connect('c%d.y' % ((i + 1) % ncomps), 'c%d.z' % i)
+
+    cycle.nonlinear_solver = NonlinearBlockGS(maxiter=50, atol=1e-10, rtol=1e-10)
+    p.set_solver_print(level=-1)
+    p.setup(check=False)
+    return p
+
+
+class BM(unittest.TestCase):
+    """ExecComp evaluation inside a NonlinearBlockGS loop"""
+
+    def benchmark_execcomp_cycle_100(self):
+        p = _build_cycle(100)
+        p.run_model()
+
+    def benchmark_execcomp_cycle_500(self):
+        p = _build_cycle(500)
+        p.run_model()
@@ -0,0 +1,33 @@
+import unittest
+
+import numpy as np
+
+from openmdao.drivers.genetic_algorithm_driver import GeneticAlgorithm
+
+
+def _setup_ga(pop_size, lchrom, num_desvar):
+    """Build a GeneticAlgorithm and a random population of bit strings."""
+    np.random.seed(0)
+    ga = GeneticAlgorithm(None)
+    ga.npop = pop_size
+    ga.lchrom = lchrom
+
+    bits = np.full(num_desvar, lchrom // num_desvar, dtype=int)
+    gen = np.random.rand(pop_size, lchrom) < 0.5
+    fitness = np.random.rand(pop_size)
+    return ga, bits, gen, fitness
+
+
+class BM(unittest.TestCase):
+    """GA operators applied to a whole population of 10000 points with 200 bits"""
+
+    def benchmark_ga_generation_10k_200bits(self):
+        ga, bits, gen, fitness = _setup_ga(10000, 200, 10)
+        vlb = np.zeros(len(bits))
+        vub = np.ones(len(bits))
+
+        for i in range(10):
+            x = ga.decode(gen, vlb, vub, bits)
+            gen = ga.tournament(gen, fitness)
+            gen = ga.crossover(gen, 0.5)
+            gen = ga.mutate(gen, 0.005)
@@ -25,3 +25,9 @@ class BM(unittest.TestCase):
         create_dyncomps(p.model, 1000, 10, 10, 5)
         p.setup(check=False)
         p.final_setup()
+
+    def benchmark_2K_20K_conns(self):
+        p = Problem()
+        create_dyncomps(p.model, 2000, 10, 10, 10)
+        p.setup(check=False)
+        p.final_setup()
@@ -1,14 +1,31 @@
 """Base class used to define the interface for derivative approximation schemes."""
 from __future__ import print_function, division
 
+from copy import deepcopy
+
+import numpy as np
+
+from openmdao.utils.coloring import get_col_coloring
+from openmdao.utils.concurrent import concurrent_eval, concurrent_eval_local, _can_fork
 from openmdao.utils.options_dictionary import OptionsDictionary
 
 
 class ApproximationScheme(object):
     """
     Base class used to define the interface for derivative approximation schemes.
+
+    Attributes
+    ----------
+    _colorings : dict
+        Cached column colorings, keyed by approximation group key.
     """
 
+    def __init__(self):
+        """
+        Initialize the ApproximationScheme.
+        """
+        self._colorings = {}
+
     def add_approximation(self, abs_key, kwargs):
         """
         Use this approximation scheme to approximate the derivative d(of)/d(wrt).
@@ -43,7 +60,130 @@ class ApproximationScheme(object):
         """
         Perform any necessary setup for the approximation scheme.
         """
-        pass
+        self._colorings = {}
+
+    def _get_coloring(self, system, key, approximations):
+        """
+        Return the groups of 'wrt' indices that can be perturbed together, if any.
+
+        Coloring is only possible when every 'of' in the group declares sparse (rows/cols)
+        partials with respect to the full 'wrt' variable.
+
+        Parameters
+        ----------
+        system : System
+            System on which the execution is run.
+        key : tuple
+            Approximation group key; the first entry is the absolute 'wrt' name.
+        approximations : list of (str, str, dict)
+            The (of, wrt, options) tuples in the group.
+
+        Returns
+        -------
+        list or None
+            List of (cols, entries) tuples, one per color, where cols are the 'wrt' indices to
+            perturb together and entries contains, for each approximation, the positions in the
+            declared rows/cols and the corresponding 'of' indices.  None if coloring is not
+            possible or gives no savings.
+        """
+        if key in self._colorings:
+            return self._colorings[key]
+
+        self._colorings[key] = coloring = None
+
+        wrt = key[0]
+        if wrt in system._owns_approx_wrt_idx:
+            return None
+
+        all_rows = []
+        all_cols = []
+        offset = 0
+        for of, _, options in approximations:
+            if of in system._owns_approx_of_idx or options.get('rows') is None:
+                return None
+            all_rows.append(np.asarray(options['rows'], dtype=int) + offset)
+            all_cols.append(np.asarray(options['cols'], dtype=int))
+            offset += system._var_abs2meta[of]['size']
+
+        in_size = system._var_abs2meta[wrt]['size']
+        groups = get_col_coloring(np.concatenate(all_rows), np.concatenate(all_cols),
+                                  (offset, in_size))
+
+        if len(groups) < in_size:
+            coloring = []
+            for group in groups:
+                entries = []
+                for of, _, options in approximations:
+                    ks = np.nonzero(np.in1d(options['cols'], group))[0]
+                    entries.append((ks, np.asarray(options['rows'], dtype=int)[ks]))
+                coloring.append((group, entries))
+            self._colorings[key] = coloring
+
+        return coloring
+
+    def _get_num_procs(self):
+        """
+        Return the largest number of processes requested by any approximation.
+
+        Returns
+        -------
+        int
+            Number of processes to use when evaluating perturbation points.
+        """
+        return max([options.get('num_procs', 1) for _, _, options in self._exec_list] or [1])
+
+    def _run_points(self, system, run_point, points, deriv_type='partial'):
+        """
+        Evaluate all perturbation points, concurrently if requested.
+
+        When 'num_procs' is greater than 1, the points are evaluated by a pool of forked worker
+        processes, each of which inherits a copy of the current model state.  Under MPI, the
+        points of a duplicated (non-distributed) component are instead spread across the ranks
+        of its communicator.  Otherwise the points are evaluated lazily, one at a time.
+
+        Parameters
+        ----------
+        system : System
+            The system having its derivs approximated.
+        run_point : function
+            Function that takes a list of (input name, indices, delta) tuples, runs the
+            perturbed system and returns the results.
+        points : list
+            List of input_deltas, one per perturbation point.
+        deriv_type : str
+            One of 'total' or 'partial', indicating if total or partial derivatives are being
+            approximated.
+
+        Returns
+        -------
+        iterator
+            The results for each point, in order.
+        """
+        num_procs = self._get_num_procs()
+
+        if num_procs > 1 and len(points) > 1:
+            if system.comm.size > 1:
+                if deriv_type == 'partial' and not getattr(system, 'distributed', True):
+                    cases = [((i, point), None) for i, point in enumerate(points)]
+                    results = concurrent_eval(lambda i, point: (i, deepcopy(run_point(point))),
+                                              cases, system.comm, allgather=True)
+                    ordered = [None] * len(points)
+                    for retval, err in results:
+                        if err is not None:
+                            raise RuntimeError(err)
+                        ordered[retval[0]] = retval[1]
+                    return iter(ordered)
+
+            elif _can_fork():
+                # run_point reuses its result array, so only evaluate eagerly in other processes
+                results = concurrent_eval_local(run_point, [((point,), None) for point in points],
+                                                num_procs)
+                for retval, err in results:
+                    if err is not None:
+                        raise RuntimeError(err)
+                return (retval for retval, err in results)
+
+        return (run_point(point) for point in points)
 
     def _run_point(self, system, input_deltas, out_tmp, in_tmp, result_array, deriv_type='partial'):
         """
@@ -70,8 +210,6 @@ class ApproximationScheme(object):
         ndarray
             The results from running the perturbed system.
         """
-        # TODO: MPI
-
         inputs = system._inputs
         outputs = system._outputs
 
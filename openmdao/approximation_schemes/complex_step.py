@@ -14,6 +14,7 @@ from openmdao.utils.name_maps import abs_key2rel_key
 DEFAULT_CS_OPTIONS = {
     'step': 1e-15,
     'form': 'forward',
+    'num_procs': 1,
 }
 
 
@@ -86,7 +87,7 @@ class ComplexStep(ApproximationScheme):
         # group adjacent items with identical keys.
         self._exec_list.sort(key=self._key_fun)
 
-        # TODO: Automatic sparse FD by constructing a graph of variable dependence?
+        super(ComplexStep, self)._init_approximations()
 
     def compute_approximations(self, system, jac=None, deriv_type='partial'):
         """
@@ -120,6 +121,11 @@ class ComplexStep(ApproximationScheme):
         out_tmp = system._outputs.get_data()
         results_clone = current_vec._clone(True)
 
+        # Gather the perturbation points of every approximation group first so that they can be
+        # evaluated concurrently if requested.
+        approx_groups = []
+        points = []
+
         for key, approximations in groupby(self._exec_list, self._key_fun):
             # groupby (along with this key function) will group all 'of's that have the same wrt and
             # step size.
@@ -140,13 +146,19 @@ class ComplexStep(ApproximationScheme):
 
                 in_idx = range(in_size)
 
+            # Note: The groupby iterator only works once, so keep the approximations in a list.
+            approximations = list(approximations)
+
+            # With sparse partials, columns with no rows in common are perturbed together and the
+            # results are stored directly in the declared (rows, cols) form.
+            coloring = self._get_coloring(system, key, approximations)
+
             outputs = []
+            for of, _, options in approximations:
+                if coloring is not None:
+                    outputs.append((of, np.zeros(len(options['rows']))))
+                    continue
 
-            # Note: If access to `approximations` is required again in the future, we will need to
-            # throw it in a list first. The groupby iterator only works once.
-            for approx_tuple in approximations:
-                of = approx_tuple[0]
-                # TODO: Sparse derivatives
                 if of in system._owns_approx_of_idx:
                     out_idx = system._owns_approx_of_idx[of]
                     out_size = len(out_idx)
@@ -155,20 +167,43 @@ class ComplexStep(ApproximationScheme):
 
                 outputs.append((of, np.zeros((out_size, in_size))))
 
-            for i_count, idx in enumerate(in_idx):
-                # Run the Finite Difference
-                input_delta = [(wrt, idx, delta)]
-                result = self._run_point_complex(system, input_delta, out_tmp, results_clone,
-                                                 deriv_type)
+            if coloring is None:
+                perturbations = list(in_idx)
+            else:
+                perturbations = [cols for cols, _ in coloring]
+
+            for idx in perturbations:
+                points.append([(wrt, idx, delta)])
+
+            approx_groups.append((wrt, fact, approximations, coloring, outputs,
+                                  len(perturbations)))
+
+        def run_point(input_delta):
+            result = self._run_point_complex(system, input_delta, out_tmp, results_clone,
+                                             deriv_type)
+            return result._imag_views_flat
+
+        results = self._run_points(system, run_point, points, deriv_type)
+
+        for wrt, fact, approximations, coloring, outputs, npts in approx_groups:
+            for i_count in range(npts):
+                imag_views = next(results)
+
+                if coloring is not None:
+                    for (of, subjac), (ks, rows) in zip(outputs, coloring[i_count][1]):
+                        subjac[ks] = imag_views[of][rows] * fact
+                    continue
 
                 for of, subjac in outputs:
                     if of in system._owns_approx_of_idx:
                         out_idx = system._owns_approx_of_idx[of]
-                        subjac[:, i_count] = result._imag_views_flat[of][out_idx] * fact
+                        subjac[:, i_count] = imag_views[of][out_idx] * fact
                     else:
-                        subjac[:, i_count] = result._imag_views_flat[of] * fact
+                        subjac[:, i_count] = imag_views[of] * fact
 
-            for of, subjac in outputs:
+            for (of, subjac), (_, _, options) in zip(outputs, approximations):
+                if coloring is None and options.get('rows') is not None:
+                    subjac = subjac[options['rows'], options['cols']]
                 rel_key = abs_key2rel_key(system, (of, wrt))
                 jac[rel_key] = subjac
 
@@ -198,8 +233,6 @@ class ComplexStep(ApproximationScheme):
         Vector
             Copy of the results from running the perturbed system.
         """
-        # TODO: MPI
-
         inputs = system._inputs
         outputs = system._outputs
 
@@ -18,6 +18,7 @@ DEFAULT_FD_OPTIONS = {
     'form': 'forward',
     'order': None,
     'step_calc': 'abs',
+    'num_procs': 1,
 }
 
 DEFAULT_ORDER = {
@@ -136,7 +137,7 @@ class FiniteDifference(ApproximationScheme):
         # group adjacent items with identical keys.
         self._exec_list.sort(key=self._key_fun)
 
-        # TODO: Automatic sparse FD by constructing a graph of variable dependence?
+        super(FiniteDifference, self)._init_approximations()
 
     def compute_approximations(self, system, jac=None, deriv_type='partial'):
         """
@@ -168,6 +169,11 @@ class FiniteDifference(ApproximationScheme):
         out_tmp = current_vec.get_data()
         in_tmp = system._inputs.get_data()
 
+        # Gather the perturbation points of every approximation group first so that they can be
+        # evaluated concurrently if requested.
+        approx_groups = []
+        points = []
+
         for key, approximations in groupby(self._exec_list, self._key_fun):
             # groupby (along with this key function) will group all 'of's that have the same wrt and
             # step size.
@@ -201,15 +207,19 @@ class FiniteDifference(ApproximationScheme):
                 in_size = system._var_abs2meta[wrt]['size']
                 in_idx = range(in_size)
 
-            result.set_vec(system._outputs)
+            # Note: The groupby iterator only works once, so keep the approximations in a list.
+            approximations = list(approximations)
+
+            # With sparse partials, columns with no rows in common are perturbed together and the
+            # results are stored directly in the declared (rows, cols) form.
+            coloring = self._get_coloring(system, key, approximations)
 
             outputs = []
+            for of, _, options in approximations:
+                if coloring is not None:
+                    outputs.append((of, np.zeros(len(options['rows']))))
+                    continue
 
-            # Note: If access to `approximations` is required again in the future, we will need to
-            # throw it in a list first. The groupby iterator only works once.
-            for approx_tuple in approximations:
-                of = approx_tuple[0]
-                # TODO: Sparse derivatives
                 if of in system._owns_approx_of_idx:
                     out_idx = system._owns_approx_of_idx[of]
                     out_size = len(out_idx)
@@ -217,19 +227,36 @@ class FiniteDifference(ApproximationScheme):
                     out_size = system._var_abs2meta[of]['size']
                 outputs.append((of, np.zeros((out_size, in_size))))
 
-            for i_count, idx in enumerate(in_idx):
+            if coloring is None:
+                perturbations = list(in_idx)
+            else:
+                perturbations = [cols for cols, _ in coloring]
+
+            for idx in perturbations:
+                for delta in deltas:
+                    points.append([(wrt, idx, delta)])
+
+            approx_groups.append((wrt, coeffs, current_coeff, approximations, coloring, outputs,
+                                  len(perturbations)))
+
+        def run_point(input_delta):
+            return self._run_point(system, input_delta, out_tmp, in_tmp, result_array, deriv_type)
+
+        results = self._run_points(system, run_point, points, deriv_type)
+
+        for wrt, coeffs, current_coeff, approximations, coloring, outputs, npts in approx_groups:
+            for i_count in range(npts):
                 if current_coeff:
                     result.set_vec(current_vec)
                     result *= current_coeff
                 else:
                     result.set_const(0.)
 
-                # Run the Finite Difference
-                for delta, coeff in zip(deltas, coeffs):
-                    input_delta = [(wrt, idx, delta)]
-                    self._run_point(system, input_delta, out_tmp, in_tmp, result_array, deriv_type)
-                    result_array *= coeff
-                    result.iadd_data(result_array)
+                # Accumulate the Finite Difference
+                for coeff in coeffs:
+                    point_result = next(results)
+                    point_result *= coeff
+                    result.iadd_data(point_result)
 
                 if deriv_type == 'total':
                     # Sign difference between output and resids. This arises from the definitions
@@ -238,6 +265,11 @@ class FiniteDifference(ApproximationScheme):
                     # so dresid/d* = - doutput/d*
                     result *= -1.0
 
+                if coloring is not None:
+                    for (of, subjac), (ks, rows) in zip(outputs, coloring[i_count][1]):
+                        subjac[ks] = result._views_flat[of][rows]
+                    continue
+
                 for of, subjac in outputs:
 
                     if of in system._owns_approx_of_idx:
@@ -246,6 +278,8 @@ class FiniteDifference(ApproximationScheme):
                     else:
                         subjac[:, i_count] = result._views_flat[of]
 
-            for of, subjac in outputs:
+            for (of, subjac), (_, _, options) in zip(outputs, approximations):
+                if coloring is None and options.get('rows') is not None:
+                    subjac = subjac[options['rows'], options['cols']]
                 rel_key = abs_key2rel_key(system, (of, wrt))
                 jac[rel_key] = subjac
@@ -1,4 +1,5 @@
 """Define the ExecComp class, a component that evaluates an expression."""
+import ast
 import math
 import re
 from collections import OrderedDict
@@ -11,6 +12,7 @@ from six import string_types
 from six.moves import range
 
 from openmdao.core.explicitcomponent import ExplicitComponent
+from openmdao.vectors.vector import Vector
 
 # regex to check for variable names.
 VAR_RGX = re.compile('([.]*[_a-zA-Z]\w*[ ]*\(?)')
@@ -20,6 +22,54 @@ _allowed_meta = {'value', 'shape', 'units', 'res_units', 'desc', 'var_set',
                  'ref', 'ref0', 'res_ref', 'lower', 'upper', 'src_indices',
                  'flat_src_indices'}
 
+# Functions that operate independently on each array element.
+_elementwise_funcs = {'abs', 'acos', 'acosh', 'arccos', 'arccosh', 'arcsin', 'arcsinh',
+                      'arctan', 'asin', 'asinh', 'atan', 'cos', 'cosh', 'erf', 'erfc', 'exp',
+                      'expm1', 'fmax', 'fmin', 'log', 'log10', 'log1p', 'maximum', 'minimum',
+                      'power', 'sin', 'sinh', 'tan', 'tanh'}
+
+_elementwise_ops = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.USub, ast.UAdd)
+
+_num_nodes = tuple(getattr(ast, n) for n in ('Num', 'Constant') if hasattr(ast, n))
+
+
+def _is_elementwise(expr):
+    """
+    Return True if the given assignment applies only elementwise operations to its variables.
+
+    Parameters
+    ----------
+    expr : str
+        An assignment statement.
+
+    Returns
+    -------
+    bool
+        True if each element of the result depends only on the same element of each array.
+    """
+    try:
+        tree = ast.parse(expr)
+    except SyntaxError:
+        return False
+
+    if len(tree.body) != 1 or not isinstance(tree.body[0], ast.Assign):
+        return False
+
+    assign = tree.body[0]
+    if len(assign.targets) != 1 or not isinstance(assign.targets[0], ast.Name):
+        return False
+
+    for node in ast.walk(assign.value):
+        if isinstance(node, (ast.BinOp, ast.UnaryOp, ast.Name, ast.Load) + _elementwise_ops +
+                      _num_nodes):
+            continue
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and \
+           node.func.id in _elementwise_funcs and not node.keywords:
+            continue
+        return False
+
+    return True
+
 
 def array_idx_iter(shape):
     """
@@ -44,8 +94,20 @@ class ExecComp(ExplicitComponent):
         Initial values of variables.
     _exprs : list
         List of expressions.
-    _codes : list
-        List of code objects.
+    _codes : function
+        Function generated from all of the expressions.  It takes the values of the variables
+        in _kernel_vars as arguments and returns the values of the outputs in _kernel_outs.
+    _kernel_vars : list of str
+        Names of all variables, in the order they are passed to _codes.
+    _kernel_outs : list of str
+        Names of the outputs, in the order they are returned from _codes.
+    _kernel_abs : list of (str, bool)
+        Absolute name of each variable in _kernel_vars and whether it is an output.
+    _kernel_out_abs : list of str
+        Absolute name of each output in _kernel_outs.
+    _elementwise_inputs : set
+        Names of array inputs whose partials are diagonal, so that all of their elements can be
+        complex stepped in a single evaluation.
     complex_stepsize : double
         Step size used for complex step which is used for derivatives.
     """
@@ -168,7 +230,12 @@ class ExecComp(ExplicitComponent):
 
         self._exprs = exprs[:]
         self._codes = None
+        self._kernel_vars = []
+        self._kernel_outs = []
+        self._kernel_abs = []
+        self._kernel_out_abs = []
         self._kwargs = kwargs
+        self._elementwise_inputs = set()
 
     def setup(self):
         """
@@ -209,6 +276,7 @@ class ExecComp(ExplicitComponent):
             else:
                 init_vals[arg] = val
 
+        shapes = {}
         for var in sorted(allvars):
             # if user supplied an initial value, use it, otherwise set to 0.0
             val = init_vals.get(var, 0.0)
@@ -219,20 +287,77 @@ class ExecComp(ExplicitComponent):
             else:
                 self.add_input(var, val, **meta)
 
+            shapes[var] = self._var_rel2data_io[var]['metadata']['shape']
+
+        self._kernel_vars = sorted(allvars)
+        self._kernel_outs = sorted(outs)
+        prefix = self.pathname + '.' if self.pathname else ''
+        self._kernel_abs = [(prefix + var, var in outs) for var in self._kernel_vars]
+        self._kernel_out_abs = [prefix + var for var in self._kernel_outs]
+
         self._codes = self._compile_exprs(self._exprs)
 
-        # All derivatives are defined.
-        self.declare_partials(of='*', wrt='*')
+        self._elementwise_inputs = set()
+
+        # If every expression is elementwise and all outputs share a shape, then each output
+        # element depends only on the matching element of same-shaped inputs.
+        out_shapes = set(shapes[var] for var in outs)
+        if len(out_shapes) == 1 and all(_is_elementwise(expr) for expr in exprs):
+            shape = out_shapes.pop()
+            size = int(np.prod(shape))
+            ins = sorted(allvars - outs)
+            if size > 1 and all(shapes[var] == shape or np.prod(shapes[var]) == 1
+                                for var in ins):
+                self._elementwise_inputs = set(var for var in ins if shapes[var] == shape)
+
+        if self._elementwise_inputs:
+            ar = np.arange(size)
+            for var in ins:
+                if var in self._elementwise_inputs:
+                    self.declare_partials(of='*', wrt=var, rows=ar, cols=ar)
+                else:
+                    self.declare_partials(of='*', wrt=var)
+        else:
+            # All derivatives are defined.
+            self.declare_partials(of='*', wrt='*')
 
     def _compile_exprs(self, exprs):
-        compiled = []
-        for i, expr in enumerate(exprs):
+        for expr in exprs:
             try:
-                compiled.append(compile(expr, expr, 'exec'))
+                compile(expr, expr, 'exec')
             except Exception:
                 raise RuntimeError("%s: failed to compile expression '%s'." %
-                                   (self.pathname, exprs[i]))
-        return compiled
+                                   (self.pathname, expr))
+
+        # Outputs that are partially assigned (e.g. 'y[0]=x[1]') must own their data, so any
+        # plain assignment to them is copied rather than aliasing another variable.
+        owned = set()
+        assigned = []
+        for expr in exprs:
+            names = set()
+            for node in ast.walk(ast.parse(expr.strip())):
+                if isinstance(node, ast.Assign):
+                    for target in node.targets:
+                        if isinstance(target, ast.Subscript) and \
+                           isinstance(target.value, ast.Name):
+                            owned.add(target.value.id)
+                        elif isinstance(target, ast.Name):
+                            names.add(target.id)
+            assigned.append(names)
+
+        # Generate a single function that evaluates all of the expressions in order, so that
+        # compute does not have to exec each expression through a name-resolving dict wrapper.
+        args = self._kernel_vars + ['__copy=__copy']
+        lines = ['def _exec_comp_kernel(%s):' % ', '.join(args)]
+        for expr, names in zip(exprs, assigned):
+            lines.append('    %s' % expr.strip())
+            lines.extend('    %s = __copy(%s)' % (name, name) for name in sorted(names & owned))
+        lines.append('    return (%s)' % ''.join('%s, ' % name for name in self._kernel_outs))
+
+        namespace = {'__copy': np.array}
+        exec(compile('\n'.join(lines), self.pathname or '<ExecComp>', 'exec'), _expr_dict,
+             namespace)
+        return namespace['_exec_comp_kernel']
 
     def _parse_for_out_vars(self, s):
         vnames = set([x.strip() for x in re.findall(VAR_RGX, s)
@@ -296,8 +421,27 @@ class ExecComp(ExplicitComponent):
         outputs : `Vector`
             `Vector` containing outputs.
         """
-        for expr in self._codes:
-            exec(expr, _expr_dict, _IODict(outputs, inputs))
+        if isinstance(outputs, Vector) and outputs._icol is None and \
+           not outputs._vector_info._under_complex_step:
+            # bind directly to the views of the vectors.
+            in_views = inputs._views
+            out_views = outputs._views
+            args = [out_views[abs_name] if is_out else in_views[abs_name]
+                    for abs_name, is_out in self._kernel_abs]
+            values = self._codes(*args)
+            for name, abs_name, val in zip(self._kernel_outs, self._kernel_out_abs, values):
+                view = out_views[abs_name]
+                if val is not view:
+                    try:
+                        view[:] = val
+                    except ValueError:
+                        # let the vector report the mismatched shape
+                        outputs[name] = val
+        else:
+            iodict = _IODict(outputs, inputs)
+            values = self._codes(*[iodict[name] for name in self._kernel_vars])
+            for name, val in zip(self._kernel_outs, values):
+                iodict[name] = val
 
     def compute_partials(self, inputs, partials):
         """
@@ -320,6 +464,19 @@ class ExecComp(ExplicitComponent):
             pwrap = _TmpDict(inputs)
 
             pval = inputs[param]
+            if param in self._elementwise_inputs:
+                # all elements are independent, so step them all at once.
+                pwrap[param] = np.asarray(pval, npcomplex) + step
+
+                uwrap = _TmpDict(self._outputs, return_complex=True)
+
+                self._residuals.set_const(0.0)
+                self.compute(pwrap, uwrap)
+
+                for u in out_names:
+                    partials[(u, param)] = imag(uwrap[u] / self.complex_stepsize).flatten()
+                continue
+
             if isinstance(pval, ndarray):
                 # replace the param array with a complex copy
                 pwrap[param] = np.asarray(pval, npcomplex)
@@ -8,7 +8,7 @@ from six.moves import range
 
 from scipy import __version__ as scipy_version
 try:
-    from scipy.interpolate._bsplines import make_interp_spline
+    from scipy.interpolate._bsplines import make_interp_spline, BSpline
 except ImportError:
     make_interp_spline = False
 
@@ -104,11 +104,15 @@ class _RegularGridInterp(object):
         Default is `np.nan`.
     grid : tuple
         Collection of points that determine the regular grid.
+    _splines : dict
+        Cache of the B-spline coefficients of the data and the polynomial pieces of the basis
+        functions, keyed on the spline orders.
 
     Methods
     -------
     __call__
     gradient
+    training_gradients
     methods
 
     """
@@ -245,6 +249,7 @@ class _RegularGridInterp(object):
         self._all_gradients = None
         self._spline_dim_error = spline_dim_error
         self._gmethod = None
+        self._splines = {}
 
     def __call__(self, xi, method=None, compute_gradients=True):
         """
@@ -298,32 +303,16 @@ class _RegularGridInterp(object):
 
         if np.iscomplexobj(self.values[:]):
             raise ValueError("method '%s' does not support complex values.")
-        ki = self._ki
-        if method != self.method:
-            # re-validate dimensions vs spline order
-
-            ki = []
-            for i, p in enumerate(self.grid):
-                n_p = len(p)
-                k = self._interp_config[method]
-                ki.append(k)
-                if n_p <= k:
-                    if not self._spline_dim_error:
-                        ki[-1] = n_p - 1
-                    else:
-                        raise ValueError("There are %d points in dimension"
-                                         " %d, but method %s requires at "
-                                         "least % d points per dimension."
-                                         "" % (n_p, i, method, k + 1))
-
-        interpolator = make_interp_spline
-        result = self._evaluate_splines(self.values[:].T,
-                                        xi,
-                                        indices,
-                                        interpolator,
-                                        method,
-                                        ki,
-                                        compute_gradients=compute_gradients)
+        ki = self._get_orders(method)
+
+        result, gradients = self._evaluate_splines(xi.astype(np.float), ki,
+                                                   compute_gradients=compute_gradients)
+
+        # Cache the computed gradients for return by the gradient method
+        if compute_gradients:
+            self._all_gradients = gradients
+            # indicate what method was used to compute these
+            self._gmethod = method
 
         if not self.bounds_error and self.fill_value is not None:
             result[out_of_bounds] = self.fill_value
@@ -331,171 +320,202 @@ class _RegularGridInterp(object):
         return result.reshape(xi_shape[:-1] +
                               self.values.shape[ndim:])
 
-    def _evaluate_splines(self, data_values, xi, indices, interpolator, method,
-                          ki, compute_gradients=True,
-                          first_dim_gradient=False):
+    def _get_orders(self, method):
         """
-        Perform interpolation using the given interpolator.
+        Return the spline order to use in each dimension for the given method.
+
+        Parameters
+        ----------
+        method : str
+            The method of interpolation.
+
+        Returns
+        -------
+        list
+            List of spline interpolation orders.
+        """
+        if method == self.method:
+            return self._ki
+
+        # re-validate dimensions vs spline order
+        ki = []
+        for i, p in enumerate(self.grid):
+            n_p = len(p)
+            k = self._interp_config[method]
+            ki.append(k)
+            if n_p <= k:
+                if not self._spline_dim_error:
+                    ki[-1] = n_p - 1
+                else:
+                    raise ValueError("There are %d points in dimension"
+                                     " %d, but method %s requires at "
+                                     "least % d points per dimension."
+                                     "" % (n_p, i, method, k + 1))
+        return ki
+
+    def _get_splines(self, ki):
+        """
+        Return the tensor-product B-spline representation of the data for the given orders.
+
+        The B-spline coefficients of the data and the polynomial coefficients of the basis
+        functions on each knot interval are computed on the first call for a set of orders
+        and cached.
 
         Parameters
         ----------
-        data_values : array_like
-            The data on the regular grid in n dimensions.
-        xi : ndarray
-            The coordinates to sample the gridded data at
-        indices : list
-            Indices for search lookup
-        interpolator : <scipy.interpolate.BSpline>
-            A BSpline object that is used for interpolation.
-        method : str, optional
-            The method of interpolation to perform. Supported are 'slinear', 'cubic', and
-            'quintic'. Default is None, which will use the method defined at the construction
-            of the interpolation object instance.
         ki : list
             List of spline interpolation orders.
-        compute_gradients : bool, optional
-            If a spline interpolation method is chosen, this determines whether gradient
-            calculations should be made and cached. Default is True.
-        first_dim_gradient : bool, optional
-            Set to True to calculate first dimension gradients. Default is False.
 
         Returns
         -------
-        array_like
-            Value of interpolant at all sample points.
+        ndarray
+            B-spline coefficients of the data, with one axis per dimension.
+        list of tuple
+            For each dimension, the left ends of the knot intervals, the index of the first
+            nonzero basis function on each interval, the polynomial coefficients of the nonzero
+            basis functions on each interval, and the B-spline coefficients of the identity.
         """
-        # for spline based methods
+        key = tuple(ki)
+        if key in self._splines:
+            return self._splines[key]
+
+        coefs = self.values
+        axes = []
+        for i, (grid, k) in enumerate(zip(self.grid, ki)):
+            # interpolation is linear in the data, so the coefficients are found one axis at a
+            # time, and the spline through the identity gives the weights of the data points
+            spline = make_interp_spline(grid, coefs, k=k, axis=i)
+            coefs = np.moveaxis(spline.c, 0, i)
+            t = spline.t
+            ncoef = spline.c.shape[0]
+            eye = make_interp_spline(grid, np.eye(grid.size), k=k, axis=0).c
+
+            # polynomial pieces of the k + 1 basis functions that are nonzero on each interval
+            cells = np.array([j for j in range(k, ncoef) if t[j] < t[j + 1]])
+            breaks = t[cells]
+            basis = BSpline(t, np.eye(ncoef), k)
+            poly = np.empty((cells.size, k + 1, k + 1))
+            cols = cells[:, np.newaxis] + np.arange(-k, 1)
+            factorial = 1.0
+            for m in range(k + 1):
+                if m > 0:
+                    factorial *= m
+                derivs = basis(breaks, m)
+                poly[:, m, :] = derivs[np.arange(cells.size)[:, np.newaxis], cols] / factorial
+
+            axes.append((breaks, cells - k, poly, eye))
+
+        self._splines[key] = coefs, axes
+        return coefs, axes
+
+    def _evaluate_splines(self, xi, ki, compute_gradients=True):
+        """
+        Perform spline interpolation at all sample points at once.
 
-        # requires floating point input
-        xi = xi.astype(np.float)
+        Parameters
+        ----------
+        xi : ndarray of shape (m, ndim)
+            The coordinates to sample the gridded data at.
+        ki : list
+            List of spline interpolation orders.
+        compute_gradients : bool, optional
+            If True, the gradients are computed and cached. Default is True.
 
-        # ensure xi is 2D list of points to evaluate
-        if xi.ndim == 1:
-            xi = xi.reshape((1, xi.size))
+        Returns
+        -------
+        ndarray of shape (m, )
+            Value of interpolant at all sample points.
+        ndarray of shape (m, ndim) or None
+            Gradients of the interpolant at all sample points.
+        """
+        coefs, axes = self._get_splines(ki)
         m, n = xi.shape
 
-        # create container arrays for output and gradients
-        result = np.empty(m)
+        starts = []
+        weights = []
+        dweights = []
+        for i, (breaks, first, poly, eye) in enumerate(axes):
+            cell = np.searchsorted(breaks, xi[:, i], side='right') - 1
+            np.clip(cell, 0, breaks.size - 1, out=cell)
+            dx = xi[:, i] - breaks[cell]
+            k = ki[i]
+
+            # evaluate the polynomial pieces of the nonzero basis functions, and their slopes
+            coef = poly[cell]
+            w = coef[:, k, :].copy()
+            dw = np.zeros_like(w)
+            for p in range(k - 1, -1, -1):
+                dw = dw * dx[:, np.newaxis] + w
+                w = w * dx[:, np.newaxis] + coef[:, p, :]
+
+            starts.append(first[cell])
+            weights.append(w)
+            dweights.append(dw)
+
+        # gather the (k + 1)**ndim coefficients that are nonzero at each point
+        index = []
+        for i, start in enumerate(starts):
+            shape = [m] + [1] * n
+            shape[i + 1] = ki[i] + 1
+            index.append((start[:, np.newaxis] + np.arange(ki[i] + 1)).reshape(shape))
+        local = coefs[tuple(index)]
+
+        letters = 'abcdefghijklmnopqrstuvwxy'[:n]
+        subscripts = 'z%s,%s->z' % (letters, ','.join(['z' + c for c in letters]))
+
+        result = np.einsum(subscripts, local, *weights)
+
+        gradients = None
         if compute_gradients:
-            all_gradients = np.empty_like(xi)
-
-        # Non-stationary procedure: difficult to vectorize this part entirely
-        # into numpy-level operations. Unfortunately this requires explicit
-        # looping over each point in xi.
-
-        # can at least vectorize the first pass across all points in the
-        # last variable of xi. This provides one dimension of the entire
-        # gradient output array.
-        i = n - 1
-        first_values, first_derivs = self._do_spline_fit(interpolator,
-                                                         self.grid[i],
-                                                         data_values,
-                                                         xi[:, i],
-                                                         ki[i],
-                                                         compute_gradients)
-
-        if first_dim_gradient:
-            top_grad = self._evaluate_splines(first_derivs,
-                                              self.grid,
-                                              indices,
-                                              interpolator,
-                                              method,
-                                              ki,
-                                              compute_gradients=False,
-                                              first_dim_gradient=True)
-            all_gradients[:, -1] = top_grad[-1]
-
-        # the rest of the dimensions have to be on a per point-in-xi basis
-        for j, x in enumerate(xi):
-            gradient = np.empty_like(x)
-            values = data_values[:]
-
-            # Main process: Apply 1D interpolate in each dimension
-            # sequentially, starting with the last dimension. These are then
-            # "folded" into the next dimension in-place.
-            for i in range(n - 1, 0, -1):
-                if i == n - 1:
-                    values = first_values[j]
-                    if compute_gradients:
-                        local_derivs = first_derivs[j]
-                else:
-                    # Interpolate and collect gradients for each 1D in this
-                    # last dimensions. This collapses each 1D sequence into a
-                    # scalar.
-                    values, local_derivs = self._do_spline_fit(interpolator,
-                                                               self.grid[i],
-                                                               values,
-                                                               x[i],
-                                                               ki[i],
-                                                               compute_gradients)
-
-                # Chain rule: to compute gradients of the output w.r.t. xi
-                # across the dimensions, apply interpolation to the collected
-                # gradients. This is equivalent to multiplication by
-                # dResults/dValues at each level.
-                if compute_gradients:
-                    gradient[i] = self._evaluate_splines(local_derivs,
-                                                         x[: i],
-                                                         indices,
-                                                         interpolator,
-                                                         method,
-                                                         ki,
-                                                         compute_gradients=False)
-
-            # All values have been folded down to a single dimensional array
-            # compute the final interpolated results, and gradient w.r.t. the
-            # first dimension
-            output_value, gradient[0] = self._do_spline_fit(interpolator,
-                                                            self.grid[0],
-                                                            values,
-                                                            x[0],
-                                                            ki[0],
-                                                            compute_gradients)
+            gradients = np.empty((m, n))
+            for i in range(n):
+                operands = weights[:i] + [dweights[i]] + weights[i + 1:]
+                gradients[:, i] = np.einsum(subscripts, local, *operands)
 
-            if compute_gradients:
-                all_gradients[j] = gradient
-            result[j] = output_value
-
-        # Cache the computed gradients for return by the gradient method
-        if compute_gradients:
-            self._all_gradients = all_gradients
-            # indicate what method was used to compute these
-            self._gmethod = method
-        return result
+        return result, gradients
 
-    def _do_spline_fit(self, interpolator, x, y, pt, k, compute_gradients):
+    def training_gradients(self, xi, method=None):
         """
-        Do a single interpolant call, and compute the gradient if needed.
+        Return the derivatives of the interpolated values with respect to the data values.
 
         Parameters
         ----------
-        interpolator : <scipy.interpolate.BSpline>
-            A BSpline object that is used for interpolation.
-        x : array_like, shape (n,)
-            Abscissas.
-        y : array_like, shape (n, ...)
-            Ordinates.
-        pt : array_like
-            Points to evaluate the spline at.
-        k : float
-            Spline interpolation order.
-        compute_gradients : bool
-            If a spline interpolation method is chosen, this determines whether gradient
-            calculations should be made and cached.
+        xi : ndarray of shape (m, ndim)
+            The coordinates to sample the gridded data at.
+        method : str, optional
+            The method of interpolation to perform. Default is None, which will use the method
+            defined at the construction of the interpolation object instance.
 
         Returns
         -------
-        array_like
-            Value of interpolant at point of interest.
-        None or array_like, optional
-            Value of gradient of interpolant at point of interest.
+        ndarray of shape (m, m1, ..., mn)
+            Derivatives of the value at each sample point with respect to the data values.
         """
-        local_interp = interpolator(x, y, k=k, axis=0)
-        values = local_interp(pt)
-        local_derivs = None
-        if compute_gradients:
-            local_derivs = local_interp(pt, 1)
-        return values, local_derivs
+        ki = self._get_orders(self.method if method is None else method)
+        coefs, axes = self._get_splines(ki)
+        xi = np.asarray(xi, dtype=float).reshape(-1, len(self.grid))
+        m, n = xi.shape
+
+        result = np.ones((m,) + (1,) * n)
+        for i, (breaks, first, poly, eye) in enumerate(axes):
+            cell = np.searchsorted(breaks, xi[:, i], side='right') - 1
+            np.clip(cell, 0, breaks.size - 1, out=cell)
+            dx = xi[:, i] - breaks[cell]
+
+            coef = poly[cell]
+            w = coef[:, ki[i], :]
+            for p in range(ki[i] - 1, -1, -1):
+                w = w * dx[:, np.newaxis] + coef[:, p, :]
+
+            # weights of all the data points along this axis
+            rows = first[cell][:, np.newaxis] + np.arange(ki[i] + 1)
+            w = np.einsum('ij,ijk->ik', w, eye[rows])
+
+            shape = [m] + [1] * n
+            shape[i + 1] = w.shape[1]
+            result = result * w.reshape(shape)
+
+        return result
 
     def _find_indices(self, xi):
         """
@@ -736,27 +756,16 @@ class MetaModelStructured(ExplicitComponent):
             sub-jac components written to partials[output_name, input_name]
         """
         pt = np.array([inputs[pname].flatten() for pname in self.pnames]).T
-        if self.metadata['training_data_gradients']:
-            dy_ddata = np.zeros(self.sh)
-            for j in range(self.metadata['num_nodes']):
-                for i, axis in enumerate(self.params):
-                    e_i = np.eye(axis.size)
-                    interp = make_interp_spline(axis,
-                                                e_i,
-                                                k=self._ki[i],
-                                                axis=0)
-                    if i == 0:
-                        val = interp(pt[j, i])
-                    else:
-                        val = np.outer(val, interp(pt[j, i]))
-                dy_ddata[j] = val.reshape(self.sh[1:])
-
+        dy_ddata = None
         for out_name in self.interps:
             dval = self.interps[out_name].gradient(pt).T
             for i, p in enumerate(self.pnames):
                 partials[out_name, p] = dval[i]
 
             if self.metadata['training_data_gradients']:
+                # the weights of the data points only depend on the grid, so they are shared
+                if dy_ddata is None:
+                    dy_ddata = self.interps[out_name].training_gradients(pt)
                 partials[out_name, "%s_train" % out_name] = dy_ddata
 
 
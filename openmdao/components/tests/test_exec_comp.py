@@ -11,7 +11,7 @@ import scipy
 from parameterized import parameterized
 
 from openmdao.api import IndepVarComp, Group, Problem, ExecComp
-from openmdao.components.exec_comp import _expr_dict
+from openmdao.components.exec_comp import _expr_dict, _is_elementwise
 from openmdao.utils.assert_utils import assert_rel_error
 
 _ufunc_test_data = {'abs': {'str': 'f=abs(x)',
@@ -378,6 +378,23 @@ class TestExecComp(unittest.TestCase):
 
         assert_rel_error(self, C1._outputs['y'], np.array([2.,1.]), 0.00001)
 
+    def test_array_lhs_after_assign(self):
+        prob = Problem(model=Group())
+        prob.model.add_subsystem('p', IndepVarComp('x', np.array([1., 2., 3.])))
+        C1 = prob.model.add_subsystem('C1', ExecComp(['y=x*1.0', 'y[0]=-1.0', 'z=x', 'z[2]=y[1]'],
+                                                     x=np.ones(3), y=np.zeros(3),
+                                                     z=np.zeros(3)))
+        prob.model.connect('p.x', 'C1.x')
+
+        prob.setup(check=False)
+        prob.run_model()
+
+        assert_rel_error(self, C1._outputs['y'], np.array([-1., 2., 3.]), 1e-10)
+        assert_rel_error(self, C1._outputs['z'], np.array([1., 2., 2.]), 1e-10)
+
+        # the input is not modified through the output assignments.
+        assert_rel_error(self, C1._inputs['x'], np.array([1., 2., 3.]), 1e-10)
+
     def test_simple_array_model(self):
         prob = Problem()
         prob.model = Group()
@@ -498,18 +515,19 @@ class TestExecComp(unittest.TestCase):
 
         assert_rel_error(self, C1._outputs['y'], np.ones(3)*4.0, 0.00001)
 
+        # elementwise expressions declare diagonal partials, stored as a list of values.
         # any negative C1.x should give a 2.0 derivative for dy/dx
         C1._inputs['x'] = np.ones(3)*-1.0e-10
         C1._linearize()
-        assert_rel_error(self, C1.jacobian['y','x'], np.eye(3)*2.0, 0.00001)
+        assert_rel_error(self, C1.jacobian['y','x'], np.ones(3)*2.0, 0.00001)
 
         C1._inputs['x'] = np.ones(3)*3.0
         C1._linearize()
-        assert_rel_error(self, C1.jacobian['y','x'], np.eye(3)*-2.0, 0.00001)
+        assert_rel_error(self, C1.jacobian['y','x'], np.ones(3)*-2.0, 0.00001)
 
         C1._inputs['x'] = np.zeros(3)
         C1._linearize()
-        assert_rel_error(self, C1.jacobian['y','x'], np.eye(3)*-2.0, 0.00001)
+        assert_rel_error(self, C1.jacobian['y','x'], np.ones(3)*-2.0, 0.00001)
 
         C1._inputs['x'] = np.array([1.5, -0.6, 2.4])
         C1._linearize()
@@ -518,7 +536,54 @@ class TestExecComp(unittest.TestCase):
         expect[1,1] = 2.0
         expect[2,2] = -2.0
 
-        assert_rel_error(self, C1.jacobian['y','x'], expect, 0.00001)
+        assert_rel_error(self, C1.jacobian['y','x'], np.diag(expect), 0.00001)
+
+    def test_elementwise_detection(self):
+        self.assertTrue(_is_elementwise('y=2.0*x**2 + sin(x)*a - -z/3'))
+        self.assertTrue(_is_elementwise('y = maximum(x, power(z, 2))'))
+        self.assertFalse(_is_elementwise('y=sum(x)'))
+        self.assertFalse(_is_elementwise('y=x[0]*x'))
+        self.assertFalse(_is_elementwise('y=dot(x, z)'))
+        self.assertFalse(_is_elementwise('y[1]=x'))
+        self.assertFalse(_is_elementwise('y=x > 0.0'))
+
+    def test_elementwise_partials(self):
+        n = 100
+        x = np.linspace(0.5, 2.0, n)
+        prob = Problem(model=Group())
+        prob.model.add_subsystem('px', IndepVarComp('x', x))
+        prob.model.add_subsystem('pa', IndepVarComp('a', 3.0))
+        comp = prob.model.add_subsystem('comp', ExecComp(['y=2.0*x**2 + sin(x)*a', 'z=exp(x)/a'],
+                                                         x=np.ones(n), y=np.ones(n),
+                                                         z=np.ones(n)))
+        prob.model.connect('px.x', 'comp.x')
+        prob.model.connect('pa.a', 'comp.a')
+
+        prob.setup(check=False)
+        prob.run_model()
+
+        self.assertEqual(comp._elementwise_inputs, {'x'})
+
+        J = prob.compute_totals(of=['comp.y', 'comp.z'], wrt=['px.x', 'pa.a'])
+        assert_rel_error(self, J['comp.y', 'px.x'], np.diag(4.0 * x + 3.0 * np.cos(x)), 1e-8)
+        assert_rel_error(self, J['comp.z', 'px.x'], np.diag(np.exp(x) / 3.0), 1e-8)
+        assert_rel_error(self, J['comp.y', 'pa.a'], np.sin(x).reshape((n, 1)), 1e-8)
+        assert_rel_error(self, J['comp.z', 'pa.a'], (-np.exp(x) / 9.0).reshape((n, 1)), 1e-8)
+
+    def test_non_elementwise_partials(self):
+        prob = Problem(model=Group())
+        prob.model.add_subsystem('px', IndepVarComp('x', np.array([1.0, 2.0, 3.0])))
+        comp = prob.model.add_subsystem('comp', ExecComp('y=x[0]*x', x=np.ones(3), y=np.ones(3)))
+        prob.model.connect('px.x', 'comp.x')
+
+        prob.setup(check=False)
+        prob.run_model()
+
+        self.assertEqual(comp._elementwise_inputs, set())
+
+        J = prob.compute_totals(of=['comp.y'], wrt=['px.x'])
+        expected = np.array([[2.0, 0.0, 0.0], [2.0, 1.0, 0.0], [3.0, 0.0, 1.0]])
+        assert_rel_error(self, J['comp.y', 'px.x'], expected, 1e-8)
 
     def test_feature_simple(self):
         from openmdao.api import IndepVarComp, Group, Problem, ExecComp
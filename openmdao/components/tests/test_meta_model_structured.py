@@ -739,6 +739,25 @@ class TestRegularGridInterpolator(unittest.TestCase):
         self.assertRaises(ValueError, _RegularGridInterp,
                           (x, y), values, fill_value=1 + 2j)
 
+    def test_many_points(self):
+        # all points are evaluated at once; check them against one at a time
+        points, values = self._get_sample_4d_large()
+        np.random.seed(3)
+        test_pts = np.random.uniform(-11, 11, (50, 4))
+        for method in self.spline_methods:
+            interp = _RegularGridInterp(points, values, method, bounds_error=False,
+                                        fill_value=None, spline_dim_error=False)
+            computed = interp(test_pts)
+            gradients = interp.gradient(test_pts)
+            for pt, val, grad in zip(test_pts, computed, gradients):
+                assert_allclose(interp(pt), val, rtol=1e-12)
+                assert_allclose(interp.gradient(pt), grad, rtol=1e-10, atol=1e-10)
+
+            # the value is linear in the data, with the training gradients as the weights
+            weights = interp.training_gradients(test_pts)
+            self.assertEqual(weights.shape, (50,) + values.shape)
+            assert_allclose(np.einsum('iabcd,abcd->i', weights, values), computed, rtol=1e-10)
+
 @unittest.skipIf(not scipy_gte_019, "only run if scipy>=0.19.")
 class TestRegularGridMap(unittest.TestCase):
     """
@@ -624,9 +624,9 @@ class Component(System):
             if method not in self._approx_schemes:
                 self._approx_schemes[method] = supported_methods[method]()
 
-            # If rows/cols is specified
-            if rows is not None or cols is not None:
-                raise ValueError('Sparse FD specification not supported yet.')
+            # If only one of rows/cols is specified
+            if (rows is None) ^ (cols is None):
+                raise ValueError('If one of rows/cols is specified, then both must be specified')
 
             # Need to declare the Jacobian element too.
             self._declared_partials.append((of, wrt, True, rows, cols, val))
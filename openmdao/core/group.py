@@ -195,6 +195,7 @@ class Group(System):
 
         # Perform recursion
         for subsys in self._subsystems_myproc:
+            subsys._setup_cache = self._setup_cache
             if self.pathname:
                 subsys._setup_procs('.'.join((self.pathname, subsys.name)), sub_comm)
             else:
@@ -966,153 +967,22 @@ class Group(System):
         """
         super(Group, self)._setup_transfers()
 
-        def merge(indices_list):
-            if len(indices_list) > 0:
-                return np.concatenate(indices_list)
-            else:
-                return np.array([], int)
-
         if recurse:
             for subsys in self._subsystems_myproc:
                 subsys._setup_transfers(recurse)
 
-        # Pre-compute map from abs_names to the index of the containing subsystem
-        abs2isub = {'input': {}, 'output': {}}
-        for subsys, isub in zip(self._subsystems_myproc, self._subsystems_myproc_inds):
-            for type_ in ['input', 'output']:
-                for abs_name in subsys._var_allprocs_abs_names[type_]:
-                    abs2isub[type_][abs_name] = isub
-
-        abs2meta = self._var_abs2meta
-        allprocs_abs2meta = self._var_allprocs_abs2meta
-
+        setup_cache = self._setup_cache
         transfers = self._transfers
         vectors = self._vectors
         for vec_name in self._lin_rel_vec_name_list:
-            relvars, _ = self._relevant[vec_name]['@all']
-
-            # Initialize empty lists for the transfer indices
-            nsub_allprocs = len(self._subsystems_allprocs)
-            xfer_in = {}
-            xfer_out = {}
-            fwd_xfer_in = [{} for i in range(nsub_allprocs)]
-            fwd_xfer_out = [{} for i in range(nsub_allprocs)]
-            rev_xfer_in = [{} for i in range(nsub_allprocs)]
-            rev_xfer_out = [{} for i in range(nsub_allprocs)]
-            for set_name_in in self._num_var_byset[vec_name]['input']:
-                for set_name_out in self._num_var_byset[vec_name]['output']:
-                    key = (set_name_in, set_name_out)
-                    xfer_in[key] = []
-                    xfer_out[key] = []
-                    for isub in range(nsub_allprocs):
-                        fwd_xfer_in[isub][key] = []
-                        fwd_xfer_out[isub][key] = []
-                        rev_xfer_in[isub][key] = []
-                        rev_xfer_out[isub][key] = []
-
-            allprocs_abs2idx_byset = self._var_allprocs_abs2idx_byset[vec_name]
-            sizes_byset_in = self._var_sizes_byset[vec_name]['input']
-            sizes_byset_out = self._var_sizes_byset[vec_name]['output']
-
-            # Loop through all explicit / implicit connections owned by this system
-            for abs_in, abs_out in iteritems(self._conn_abs_in2out):
-                if abs_out not in relvars['output']:
-                    continue
-
-                # Only continue if the input exists on this processor
-                if abs_in in abs2meta and abs_in in relvars['input']:
-
-                    # Get meta
-                    meta_in = abs2meta[abs_in]
-                    meta_out = allprocs_abs2meta[abs_out]
-
-                    # Get varset info
-                    set_name_in = meta_in['var_set']
-                    set_name_out = meta_out['var_set']
-                    idx_byset_in = allprocs_abs2idx_byset[abs_in]
-                    idx_byset_out = allprocs_abs2idx_byset[abs_out]
-
-                    # Get the sizes (byset) array
-                    sizes_in = sizes_byset_in[set_name_in]
-                    sizes_out = sizes_byset_out[set_name_out]
-
-                    # Read in and process src_indices
-                    shape_in = meta_in['shape']
-                    shape_out = meta_out['shape']
-                    global_shape_out = meta_out['global_shape']
-                    global_size_out = meta_out['global_size']
-                    src_indices = meta_in['src_indices']
-                    if src_indices is None:
-                        src_indices = np.arange(meta_in['size'], dtype=int)
-                    elif src_indices.ndim == 1:
-                        src_indices = convert_neg(src_indices, global_size_out)
-                    else:
-                        if len(shape_out) == 1 or shape_in == src_indices.shape:
-                            src_indices = src_indices.flatten()
-                            src_indices = convert_neg(src_indices, global_size_out)
-                        else:
-                            # TODO: this duplicates code found
-                            # in System._setup_scaling.
-                            entries = [list(range(x)) for x in shape_in]
-                            cols = np.vstack(src_indices[i] for i in product(*entries))
-                            dimidxs = [convert_neg(cols[:, i], global_shape_out[i])
-                                       for i in range(cols.shape[1])]
-                            src_indices = np.ravel_multi_index(dimidxs, global_shape_out)
-
-                    # 1. Compute the output indices
-                    output_inds = np.zeros(src_indices.shape[0], int)
-                    ind1 = ind2 = 0
-                    for iproc in range(self.comm.size):
-                        ind2 += sizes_out[iproc, idx_byset_out]
-
-                        # The part of src on iproc
-                        on_iproc = np.logical_and(ind1 <= src_indices, src_indices < ind2)
-
-                        # This converts from iproc-then-ivar to ivar-then-iproc ordering
-                        # Subtract off part of previous procs
-                        # Then add all variables on previous procs
-                        # Then all previous variables on this proc
-                        # - np.sum(out_sizes[:iproc, idx_byset_out])
-                        # + np.sum(out_sizes[:iproc, :])
-                        # + np.sum(out_sizes[iproc, :idx_byset_out])
-                        # + inds
-                        offset = -ind1
-                        offset += np.sum(sizes_out[:iproc, :])
-                        offset += np.sum(sizes_out[iproc, :idx_byset_out])
-                        output_inds[on_iproc] = src_indices[on_iproc] + offset
-
-                        ind1 += sizes_out[iproc, idx_byset_out]
-
-                    # 2. Compute the input indices
-                    iproc = self.comm.rank
-                    ind1 = ind2 = np.sum(sizes_in[:iproc, :])
-                    ind1 += np.sum(sizes_in[iproc, :idx_byset_in])
-                    ind2 += np.sum(sizes_in[iproc, :idx_byset_in + 1])
-                    input_inds = np.arange(ind1, ind2)
-
-                    # Now the indices are ready - input_inds, output_inds
-                    key = (set_name_in, set_name_out)
-                    xfer_in[key].append(input_inds)
-                    xfer_out[key].append(output_inds)
-
-                    isub = abs2isub['input'][abs_in]
-                    fwd_xfer_in[isub][key].append(input_inds)
-                    fwd_xfer_out[isub][key].append(output_inds)
-                    if abs_out in abs2isub['output']:
-                        isub = abs2isub['output'][abs_out]
-                        rev_xfer_in[isub][key].append(input_inds)
-                        rev_xfer_out[isub][key].append(output_inds)
-
-            for set_name_in in self._num_var_byset[vec_name]['input']:
-                for set_name_out in self._num_var_byset[vec_name]['output']:
-                    key = (set_name_in, set_name_out)
-                    xfer_in[key] = merge(xfer_in[key])
-                    xfer_out[key] = merge(xfer_out[key])
-                    for isub in range(nsub_allprocs):
-                        fwd_xfer_in[isub][key] = merge(fwd_xfer_in[isub][key])
-                        fwd_xfer_out[isub][key] = merge(fwd_xfer_out[isub][key])
-                        rev_xfer_in[isub][key] = merge(rev_xfer_in[isub][key])
-                        rev_xfer_out[isub][key] = merge(rev_xfer_out[isub][key])
+            cache_key = ('transfers', self.pathname, vec_name)
+            indices = None if setup_cache is None else setup_cache.get(cache_key)
+            if indices is None:
+                indices = self._get_transfer_indices(vec_name)
+                if setup_cache is not None:
+                    setup_cache.set(cache_key, indices)
+
+            xfer_in, xfer_out, fwd_xfer_in, fwd_xfer_out, rev_xfer_in, rev_xfer_out = indices
 
             out_vec = vectors['output'][vec_name]
             transfer_class = out_vec.TRANSFER
@@ -1122,7 +992,7 @@ class Group(System):
                                       xfer_in, xfer_out, self.comm)
             transfers[vec_name]['fwd', None] = xfer_all
             transfers[vec_name]['rev', None] = xfer_all
-            for isub in range(nsub_allprocs):
+            for isub in range(len(self._subsystems_allprocs)):
                 transfers[vec_name]['fwd', isub] = transfer_class(
                     vectors['input'][vec_name], vectors['output'][vec_name],
                     fwd_xfer_in[isub], fwd_xfer_out[isub], self.comm)
@@ -1132,6 +1002,175 @@ class Group(System):
 
         transfers['nonlinear'] = transfers['linear']
 
+    def _get_transfer_indices(self, vec_name):
+        """
+        Compute the input and output indices of all transfers owned by this system.
+
+        Parameters
+        ----------
+        vec_name : str
+            Name of the vector.
+
+        Returns
+        -------
+        tuple of dict
+            Input and output indices of the full transfer, keyed on the pair of input and
+            output set names, followed by lists of the same for the forward and reverse
+            transfers to or from each subsystem among allprocs subsystems.
+        """
+        def merge(indices_list):
+            if len(indices_list) > 0:
+                return np.concatenate(indices_list)
+            else:
+                return np.array([], int)
+
+        def get_offsets(sizes):
+            # Start of each variable on each proc, ordered by proc, then variable.
+            offsets = np.cumsum(sizes, axis=1) - sizes
+            offsets[1:, :] += np.cumsum(np.sum(sizes, axis=1))[:-1, np.newaxis]
+            return offsets
+
+        def split_by_isub(isubs, input_inds, output_inds, xfer_in, xfer_out, key):
+            # Stable sort, so every subsystem keeps the connection order.
+            order = np.argsort(isubs, kind='mergesort')
+            bounds = np.cumsum(np.bincount(isubs, minlength=nsub_allprocs))
+            input_inds = input_inds[order]
+            output_inds = output_inds[order]
+            ind1 = 0
+            for isub, ind2 in enumerate(bounds):
+                xfer_in[isub][key] = input_inds[ind1:ind2]
+                xfer_out[isub][key] = output_inds[ind1:ind2]
+                ind1 = ind2
+
+        # Pre-compute map from abs_names to the index of the containing subsystem
+        abs2isub = {'input': {}, 'output': {}}
+        for subsys, isub in zip(self._subsystems_myproc, self._subsystems_myproc_inds):
+            for type_ in ['input', 'output']:
+                for abs_name in subsys._var_allprocs_abs_names[type_]:
+                    abs2isub[type_][abs_name] = isub
+
+        abs2meta = self._var_abs2meta
+        allprocs_abs2meta = self._var_allprocs_abs2meta
+        nproc = self.comm.size
+        rank = self.comm.rank
+
+        relvars, _ = self._relevant[vec_name]['@all']
+
+        nsub_allprocs = len(self._subsystems_allprocs)
+        keys = [(set_name_in, set_name_out)
+                for set_name_in in self._num_var_byset[vec_name]['input']
+                for set_name_out in self._num_var_byset[vec_name]['output']]
+
+        # Per connection: input start, input size, output indices and the indices of
+        # the subsystems containing the input and the output (-1 if not local).
+        conns = {key: ([], [], [], [], []) for key in keys}
+
+        allprocs_abs2idx_byset = self._var_allprocs_abs2idx_byset[vec_name]
+        sizes_byset_in = self._var_sizes_byset[vec_name]['input']
+        sizes_byset_out = self._var_sizes_byset[vec_name]['output']
+
+        # Cumulative offset tables, so that no connection needs to sum over the sizes
+        offsets_byset_in = {set_name: get_offsets(sizes)
+                            for set_name, sizes in iteritems(sizes_byset_in)}
+        offsets_byset_out = {}
+        for set_name, sizes in iteritems(sizes_byset_out):
+            # This converts from iproc-then-ivar to ivar-then-iproc ordering:
+            # subtract off the part of the variable on previous procs, then add the
+            # offset of the variable on this proc.
+            proc_ends = np.cumsum(sizes, axis=0)
+            offsets_byset_out[set_name] = (proc_ends,
+                                           get_offsets(sizes) - (proc_ends - sizes))
+
+        # Loop through all explicit / implicit connections owned by this system
+        for abs_in, abs_out in iteritems(self._conn_abs_in2out):
+            if abs_out not in relvars['output']:
+                continue
+
+            # Only continue if the input exists on this processor
+            if abs_in in abs2meta and abs_in in relvars['input']:
+
+                # Get meta
+                meta_in = abs2meta[abs_in]
+                meta_out = allprocs_abs2meta[abs_out]
+
+                # Get varset info
+                set_name_in = meta_in['var_set']
+                set_name_out = meta_out['var_set']
+                idx_byset_in = allprocs_abs2idx_byset[abs_in]
+                idx_byset_out = allprocs_abs2idx_byset[abs_out]
+
+                # Read in and process src_indices
+                shape_in = meta_in['shape']
+                shape_out = meta_out['shape']
+                global_shape_out = meta_out['global_shape']
+                global_size_out = meta_out['global_size']
+                src_indices = meta_in['src_indices']
+                if src_indices is None:
+                    src_indices = np.arange(meta_in['size'], dtype=int)
+                elif src_indices.ndim == 1:
+                    src_indices = convert_neg(src_indices, global_size_out)
+                else:
+                    if len(shape_out) == 1 or shape_in == src_indices.shape:
+                        src_indices = src_indices.flatten()
+                        src_indices = convert_neg(src_indices, global_size_out)
+                    else:
+                        # TODO: this duplicates code found
+                        # in System._setup_scaling.
+                        entries = [list(range(x)) for x in shape_in]
+                        cols = np.vstack(src_indices[i] for i in product(*entries))
+                        dimidxs = [convert_neg(cols[:, i], global_shape_out[i])
+                                   for i in range(cols.shape[1])]
+                        src_indices = np.ravel_multi_index(dimidxs, global_shape_out)
+
+                # 1. Compute the output indices
+                proc_ends, offsets = offsets_byset_out[set_name_out]
+                if nproc == 1:
+                    output_inds = src_indices + offsets[0, idx_byset_out]
+                else:
+                    # The proc that owns each part of src
+                    iprocs = np.searchsorted(proc_ends[:, idx_byset_out], src_indices,
+                                             side='right')
+                    output_inds = src_indices + offsets[iprocs, idx_byset_out]
+
+                # 2. Compute the input indices, which are a contiguous range
+                key = (set_name_in, set_name_out)
+                in_starts, in_sizes, out_list, isubs_in, isubs_out = conns[key]
+                in_starts.append(offsets_byset_in[set_name_in][rank, idx_byset_in])
+                in_sizes.append(sizes_byset_in[set_name_in][rank, idx_byset_in])
+                out_list.append(output_inds)
+                isubs_in.append(abs2isub['input'][abs_in])
+                isubs_out.append(abs2isub['output'].get(abs_out, -1))
+
+        # Build the index arrays of all connections at once, then split them by subsystem
+        xfer_in = {}
+        xfer_out = {}
+        fwd_xfer_in = [{} for i in range(nsub_allprocs)]
+        fwd_xfer_out = [{} for i in range(nsub_allprocs)]
+        rev_xfer_in = [{} for i in range(nsub_allprocs)]
+        rev_xfer_out = [{} for i in range(nsub_allprocs)]
+        for key in keys:
+            in_starts, in_sizes, out_list, isubs_in, isubs_out = conns[key]
+            in_sizes = np.array(in_sizes, dtype=int)
+            ncon_inds = np.sum(in_sizes)
+
+            # concatenation of np.arange(start, start + size) over all connections
+            input_inds = np.arange(ncon_inds) + np.repeat(
+                np.array(in_starts, dtype=int) - (np.cumsum(in_sizes) - in_sizes), in_sizes)
+            output_inds = merge(out_list)
+
+            xfer_in[key] = input_inds
+            xfer_out[key] = output_inds
+
+            isubs_in = np.repeat(np.array(isubs_in, dtype=int), in_sizes)
+            split_by_isub(isubs_in, input_inds, output_inds, fwd_xfer_in, fwd_xfer_out, key)
+
+            isubs_out = np.repeat(np.array(isubs_out, dtype=int), in_sizes)
+            local = isubs_out >= 0
+            split_by_isub(isubs_out[local], input_inds[local], output_inds[local],
+                          rev_xfer_in, rev_xfer_out, key)
+
+        return xfer_in, xfer_out, fwd_xfer_in, fwd_xfer_out, rev_xfer_in, rev_xfer_out
+
     def add(self, name, subsys, promotes=None):
         """
         Add a subsystem (deprecated version of <Group.add_subsystem>).
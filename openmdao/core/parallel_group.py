@@ -20,3 +20,12 @@ class ParallelGroup(Group):
         """
         super(ParallelGroup, self).__init__(**kwargs)
         self._mpi_proc_allocator.parallel = True
+
+    def initialize(self):
+        """
+        Declare metadata.
+        """
+        self.metadata.declare('num_threads', types=int, default=1, lower=1,
+                              desc='Number of threads used to run the subsystems when they are '
+                                   'not distributed over MPI procs. Only pays off for subsystems '
+                                   'that release the GIL.')
@@ -25,6 +25,7 @@ from openmdao.recorders.recording_iteration_stack import recording_iteration
 from openmdao.utils.general_utils import warn_deprecation, ContainsAll
 from openmdao.utils.mpi import MPI, FakeComm
 from openmdao.utils.name_maps import prom_name2abs_name
+from openmdao.utils.setup_cache import SetupCache
 from openmdao.vectors.default_vector import DefaultVector
 
 try:
@@ -359,8 +360,33 @@ class Problem(object):
         """
         self.driver.cleanup()
 
+        # close the recorders attached to systems and solvers, so that buffered recorders
+        # finish writing their queued cases
+        for rec_mgr in self._get_recording_managers(include_driver=False):
+            rec_mgr.close()
+
+    def _get_recording_managers(self, include_driver=True):
+        """
+        Yield the recording managers of the driver and of every system and solver in the model.
+
+        Parameters
+        ----------
+        include_driver : bool
+            If True, include the recording manager of the driver.
+
+        Yields
+        ------
+        RecordingManager
+            A recording manager.
+        """
+        if include_driver:
+            yield self.driver._rec_mgr
+
+        for rec_mgr in self.model._get_recording_managers():
+            yield rec_mgr
+
     def setup(self, vector_class=DefaultVector, check=False, logger=None, mode='rev',
-              force_alloc_complex=False):
+              force_alloc_complex=False, setup_cache=None):
         """
         Set up the model hierarchy.
 
@@ -384,6 +410,10 @@ class Problem(object):
             Force allocation of imaginary part in nonlinear vectors. OpenMDAO can generally
             detect when you need to do this, but in some cases (e.g., complex step is used
             after a reconfiguration) you may need to set this to True.
+        setup_cache : str or None
+            Directory in which setup data that only depends on the structure of the model is saved
+            at the end of final_setup. Later setups of a model with the same structure reload it
+            from there instead of recomputing it.
 
         Returns
         -------
@@ -406,6 +436,7 @@ class Problem(object):
 
         self._mode = mode
 
+        model._setup_cache = None if setup_cache is None else SetupCache(setup_cache)
         model._setup(comm, 'full', mode)
 
         # Cache all args for final setup.
@@ -451,6 +482,9 @@ class Problem(object):
             self._setup_status = 2
             self._set_initial_conditions()
 
+            if self.model._setup_cache is not None:
+                self.model._setup_cache.save()
+
         # check for post-setup hook
         if Problem._post_setup_func is not None:
             Problem._post_setup_func(self)
@@ -1391,14 +1425,15 @@ class Problem(object):
 
                 # this sets dinputs for the current parallel_deriv_color to 0
                 # dinputs is dresids in fwd, doutouts in rev
-                if fwd:
-                    vec_dresid['linear'].set_const(0.0)
-                    if use_rel_reduction:
-                        vec_doutput['linear'].set_const(0.0)
-                else:  # rev
-                    vec_doutput['linear'].set_const(0.0)
-                    if use_rel_reduction:
-                        vec_dinput['linear'].set_const(0.0)
+                for vec_name in lin_vec_names:
+                    if fwd:
+                        vec_dresid[vec_name].set_const(0.0)
+                        if use_rel_reduction:
+                            vec_doutput[vec_name].set_const(0.0)
+                    else:  # rev
+                        vec_doutput[vec_name].set_const(0.0)
+                        if use_rel_reduction:
+                            vec_dinput[vec_name].set_const(0.0)
 
                 for input_name, old_input_name, pd_color, matmat, simul in vois:
                     dinputs, doutputs, idxs, _, max_i, min_i, loc_size, start, end, dup, _ = \
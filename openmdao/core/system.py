@@ -220,6 +220,11 @@ class System(object):
         Indicates derivative direction for the model, either 'fwd' or 'rev'.
     _scope_cache : dict
         Cache for variables in the scope of various mat-vec products.
+    _matvec_names_cache : dict
+        Cache of the names of the variables of each vector in the scope of a mat-vec product,
+        keyed on the vector name and the identity of the scope sets.
+    _setup_cache : <SetupCache> or None
+        Persistent cache of setup data shared by all systems in the model, if one is used.
     _has_guess : bool
         True if this system has or contains a system with a `guess_nonlinear` method defined.
     _has_output_scaling : bool
@@ -362,6 +367,8 @@ class System(object):
         self._mode = None
 
         self._scope_cache = {}
+        self._matvec_names_cache = {}
+        self._setup_cache = None
 
         self.initialize()
         self.metadata.update(kwargs)
@@ -691,6 +698,12 @@ class System(object):
             recurse = False
             resize = False
 
+        # Cached setup data is only valid for the structure it was computed from.
+        if setup_mode != 'full':
+            for system in self.system_iter(include_self=True, recurse=True):
+                system._setup_cache = None
+        setup_cache = self._setup_cache
+
         self._mode = mode
 
         # If we're only updating and not recursing, processors don't need to be redistributed
@@ -707,7 +720,12 @@ class System(object):
         self._setup_var_data(recurse=recurse)
         self._setup_vec_names(mode, self._vec_names, self._vois)
         self._setup_global_connections(recurse=recurse)
+        if setup_cache is not None:
+            setup_cache.load(self, mode)
+            self._relevant = setup_cache.get('relevant')
         self._setup_relevance(mode, self._relevant)
+        if setup_cache is not None:
+            setup_cache.set('relevant', self._relevant)
         self._setup_vars(recurse=recurse)
         self._setup_var_index_ranges(self._get_initial_var_indices(initial), recurse=recurse)
         self._setup_var_index_maps(recurse=recurse)
@@ -1135,6 +1153,7 @@ class System(object):
         self._vectors = vectors = {'input': OrderedDict(),
                                    'output': OrderedDict(),
                                    'residual': OrderedDict()}
+        self._matvec_names_cache = {}
 
         # Allocate complex if root vector was allocated complex.
         alloc_complex = root_vectors['output']['nonlinear']._alloc_complex
@@ -1744,10 +1763,24 @@ class System(object):
         if scope_out is None and scope_in is None:
             yield d_inputs, d_outputs, d_residuals
         else:
+            # The same name sets are returned for the same scope, so the jacobian can cache
+            # anything that depends on them.  The scopes are kept in the cache so their ids stay
+            # unique.
+            key = (vec_name, id(scope_out), id(scope_in))
+            try:
+                names = self._matvec_names_cache[key]
+            except KeyError:
+                names = self._matvec_names_cache[key] = (
+                    scope_out, scope_in,
+                    None if scope_out is None else frozenset(
+                        scope_out.intersection(d_outputs._views)),
+                    None if scope_in is None else frozenset(
+                        scope_in.intersection(d_inputs._views)))
+
             if scope_out is not None:
-                d_outputs._names = scope_out.intersection(d_outputs._views)
+                d_outputs._names = names[2]
             if scope_in is not None:
-                d_inputs._names = scope_in.intersection(d_inputs._views)
+                d_inputs._names = names[3]
 
             yield d_inputs, d_outputs, d_residuals
 
@@ -3129,6 +3162,24 @@ class System(object):
         for s in self.system_iter(include_self=True, recurse=recurse):
             s._rec_mgr.append(recorder)
 
+    def _get_recording_managers(self):
+        """
+        Yield the recording managers of this system, its descendants, and all of their solvers.
+
+        Yields
+        ------
+        RecordingManager
+            A recording manager.
+        """
+        for system in self.system_iter(include_self=True, recurse=True):
+            yield system._rec_mgr
+            for solver in (system._nonlinear_solver, system._linear_solver):
+                if solver is not None:
+                    yield solver._rec_mgr
+                    linesearch = getattr(solver, 'linesearch', None)
+                    if linesearch is not None:
+                        yield linesearch._rec_mgr
+
     def record_iteration(self):
         """
         Record an iteration of the current System.
@@ -8,6 +8,7 @@ import numpy as np
 
 from openmdao.api import Problem, Group, IndepVarComp, ScipyKrylov, ExecComp, NewtonSolver, \
      ExplicitComponent, DefaultVector, NonlinearBlockGS, LinearRunOnce, DenseJacobian
+from openmdao.approximation_schemes.approximation_scheme import _can_fork
 from openmdao.utils.assert_utils import assert_rel_error
 from openmdao.test_suite.components.impl_comp_array import TestImplCompArray, TestImplCompArrayDense
 from openmdao.test_suite.components.paraboloid import Paraboloid
@@ -1061,6 +1062,161 @@ class TestComponentComplexStep(unittest.TestCase):
         assert_rel_error(self, derivs['comp.y1', 'px.x'][3][3], 1.0/2.34, 1e-6)
 
 
+class SparseApproxComp(ExplicitComponent):
+    """Vectorized component with diagonal and banded sparse partials."""
+
+    def initialize(self):
+        self.metadata.declare('size', types=int, default=50)
+        self.metadata.declare('method', values=('fd', 'cs'))
+
+    def setup(self):
+        n = self.metadata['size']
+        method = self.metadata['method']
+        self.add_input('x', np.ones(n))
+        self.add_output('y', np.ones(n))
+        self.add_output('z', np.ones(n - 1))
+
+        ar = np.arange(n)
+        self.declare_partials('y', 'x', rows=ar, cols=ar, method=method)
+
+        # z[i] depends on x[i] and x[i + 1]
+        rows = np.repeat(np.arange(n - 1), 2)
+        cols = np.arange(n - 1).repeat(2) + np.tile([0, 1], n - 1)
+        self.declare_partials('z', 'x', rows=rows, cols=cols, method=method)
+
+        self.num_computes = 0
+
+    def compute(self, inputs, outputs):
+        self.num_computes += 1
+        x = inputs['x']
+        outputs['y'] = x ** 3
+        outputs['z'] = x[:-1] * x[1:]
+
+
+class TestComponentSparseApprox(unittest.TestCase):
+
+    @parameterized.expand(['fd', 'cs'])
+    def test_colored_partials(self, method):
+        n = 50
+        prob = Problem()
+        model = prob.model
+        x = np.linspace(1.0, 2.0, n)
+        model.add_subsystem('px', IndepVarComp('x', x))
+        comp = model.add_subsystem('comp', SparseApproxComp(size=n, method=method))
+        model.connect('px.x', 'comp.x')
+
+        prob.setup(check=False)
+        prob.run_model()
+
+        comp.num_computes = 0
+        J = prob.compute_totals(of=['comp.y', 'comp.z'], wrt=['px.x'])
+
+        # the banded z partials need 2 colors, into which the diagonal y partials also fit.
+        self.assertEqual(comp.num_computes, 2)
+
+        dz = np.zeros((n - 1, n))
+        dz[np.arange(n - 1), np.arange(n - 1)] = x[1:]
+        dz[np.arange(n - 1), np.arange(1, n)] = x[:-1]
+
+        assert_rel_error(self, J['comp.y', 'px.x'], np.diag(3.0 * x ** 2), 1e-5)
+        assert_rel_error(self, J['comp.z', 'px.x'], dz, 1e-5)
+
+        # partials are stored in the declared (rows, cols) form.
+        subjac = comp._jacobian._subjacs['comp.y', 'comp.x']
+        self.assertEqual(subjac[0].shape, (n,))
+
+    def test_uncolored_sparse_partials(self):
+        class DenseRowComp(ExplicitComponent):
+            def setup(self):
+                self.add_input('x', np.ones(3))
+                self.add_output('y', np.ones(3))
+                self.declare_partials('y', 'x', rows=[0, 0, 0, 1, 2], cols=[0, 1, 2, 1, 2],
+                                      method='fd')
+
+            def compute(self, inputs, outputs):
+                x = inputs['x']
+                outputs['y'] = [x[0] + 2.0 * x[1] + 3.0 * x[2], 4.0 * x[1], 5.0 * x[2]]
+
+        prob = Problem()
+        prob.model.add_subsystem('px', IndepVarComp('x', np.ones(3)))
+        prob.model.add_subsystem('comp', DenseRowComp())
+        prob.model.connect('px.x', 'comp.x')
+
+        prob.setup(check=False)
+        prob.run_model()
+
+        J = prob.compute_totals(of=['comp.y'], wrt=['px.x'])
+        expected = np.array([[1.0, 2.0, 3.0], [0.0, 4.0, 0.0], [0.0, 0.0, 5.0]])
+        assert_rel_error(self, J['comp.y', 'px.x'], expected, 1e-5)
+
+
+class CountedArrayComp(ExplicitComponent):
+    """Dense array component that counts its computes."""
+
+    def initialize(self):
+        self.metadata.declare('method', values=('fd', 'cs'))
+
+    def setup(self):
+        self.add_input('x', np.ones(6))
+        self.add_output('y', np.ones(3))
+        self.declare_partials('y', 'x', method=self.metadata['method'], num_procs=3)
+
+        self.num_computes = 0
+
+    def compute(self, inputs, outputs):
+        self.num_computes += 1
+        x = inputs['x']
+        outputs['y'] = [np.sum(x ** 2), np.prod(x), x[0] * x[5]]
+
+
+@unittest.skipUnless(_can_fork(), "requires a forked local process pool")
+class TestParallelApprox(unittest.TestCase):
+
+    @parameterized.expand(['fd', 'cs'])
+    def test_partials(self, method):
+        prob = Problem()
+        model = prob.model
+        x = np.arange(1.0, 7.0)
+        model.add_subsystem('px', IndepVarComp('x', x))
+        comp = model.add_subsystem('comp', CountedArrayComp(method=method))
+        model.connect('px.x', 'comp.x')
+
+        prob.setup(check=False)
+        prob.run_model()
+
+        comp.num_computes = 0
+        J = prob.compute_totals(of=['comp.y'], wrt=['px.x'])
+
+        # every perturbation ran in a worker process.
+        self.assertEqual(comp.num_computes, 0)
+
+        expected = np.zeros((3, 6))
+        expected[0] = 2.0 * x
+        expected[1] = np.prod(x) / x
+        expected[2, 0] = x[5]
+        expected[2, 5] = x[0]
+        assert_rel_error(self, J['comp.y', 'px.x'], expected, 1e-5)
+
+        # the model state is left untouched.
+        assert_rel_error(self, prob['comp.y'], [91.0, 720.0, 6.0], 1e-12)
+
+    def test_totals(self):
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('p1', IndepVarComp('x', 3.0), promotes=['x'])
+        model.add_subsystem('p2', IndepVarComp('y', -4.0), promotes=['y'])
+        model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+
+        model.approx_totals(method='fd', form='central', num_procs=2)
+
+        prob.setup(check=False)
+        prob.run_model()
+
+        J = prob.compute_totals(of=['f_xy'], wrt=['x', 'y'])
+        assert_rel_error(self, J['f_xy', 'x'], [[-4.0]], 1e-6)
+        assert_rel_error(self, J['f_xy', 'y'], [[3.0]], 1e-6)
+
+
 class ApproxTotalsFeature(unittest.TestCase):
 
     def test_basic(self):
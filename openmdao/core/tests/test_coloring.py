@@ -9,6 +9,7 @@ from numpy.testing import assert_array_almost_equal, assert_almost_equal
 from openmdao.api import Problem, IndepVarComp, ExecComp, DenseJacobian, DirectSolver,\
     ExplicitComponent, LinearRunOnce, ScipyOptimizeDriver
 from openmdao.utils.assert_utils import assert_rel_error
+from openmdao.utils.coloring import get_col_coloring
 
 from openmdao.utils.general_utils import set_pyoptsparse_opt
 
@@ -371,5 +372,43 @@ class SimulColoringScipyTestCase(unittest.TestCase):
 
         assert_almost_equal(p['circle.area'], np.pi, decimal=7)
 
+class ColColoringTestCase(unittest.TestCase):
+
+    def _check_groups(self, J, groups):
+        # every column appears exactly once and no two columns in a group share a row.
+        self.assertEqual(sorted(np.concatenate(groups)), list(range(J.shape[1])))
+        for group in groups:
+            self.assertTrue(np.all(np.count_nonzero(J[:, group], axis=1) <= 1))
+
+    def test_diagonal(self):
+        rows = cols = np.arange(50)
+        groups = get_col_coloring(rows, cols, (50, 50))
+        self.assertEqual(len(groups), 1)
+        self._check_groups(np.eye(50), groups)
+
+    def test_tridiagonal(self):
+        J = np.eye(20) + np.eye(20, k=1) + np.eye(20, k=-1)
+        rows, cols = np.nonzero(J)
+        groups = get_col_coloring(rows, cols, J.shape)
+        self.assertEqual(len(groups), 3)
+        self._check_groups(J, groups)
+
+    def test_dense_row(self):
+        J = np.eye(10)
+        J[0, :] = 1.0
+        rows, cols = np.nonzero(J)
+        groups = get_col_coloring(rows, cols, J.shape)
+        self.assertEqual(len(groups), 10)
+        self._check_groups(J, groups)
+
+    def test_random(self):
+        np.random.seed(11)
+        J = np.random.random((30, 40)) < 0.1
+        rows, cols = np.nonzero(J)
+        groups = get_col_coloring(rows, cols, J.shape)
+        self.assertTrue(len(groups) < 40)
+        self._check_groups(J, groups)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,11 +2,17 @@
 
 from __future__ import division, print_function
 
+import os
+import shutil
+import tempfile
+import threading
+import time
 import unittest
 import numpy as np
 
 from openmdao.api import Problem, Group, ParallelGroup, ExecComp, IndepVarComp, \
-                         ExplicitComponent
+                         ExplicitComponent, AnalysisError, NonlinearBlockJac, LinearBlockJac, \
+                         SqliteRecorder
 
 from openmdao.utils.mpi import under_mpirun
 from openmdao.utils.mpi import MPI
@@ -334,6 +340,119 @@ class MatMatParDevTestCase(unittest.TestCase):
         np.testing.assert_array_equal(J['par.C2.y', 'indeps.y'], np.array([[3.]]))
 
 
+class _SlowComp(ExplicitComponent):
+    """Component that sleeps, releasing the GIL, and records the threads it ran on."""
+
+    def initialize(self):
+        self.metadata.declare('threads', types=set)
+
+    def setup(self):
+        self.add_input('x', np.ones(3))
+        self.add_output('y', np.ones(3))
+        self.declare_partials('y', 'x')
+
+    def compute(self, inputs, outputs):
+        time.sleep(0.02)
+        self.metadata['threads'].add(threading.current_thread().ident)
+        outputs['y'] = inputs['x'] ** 2
+
+    def compute_partials(self, inputs, partials):
+        partials['y', 'x'] = np.diag(2.0 * inputs['x'])
+
+
+class TestThreadedParallelGroup(unittest.TestCase):
+
+    def _build(self, num_threads, threads, nl_solver=None, ln_solver=None):
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('iv', IndepVarComp('x', np.array([1.0, 2.0, 3.0])))
+
+        par = model.add_subsystem('par', ParallelGroup(num_threads=num_threads))
+        if nl_solver is not None:
+            par.nonlinear_solver = nl_solver
+        if ln_solver is not None:
+            par.linear_solver = ln_solver
+
+        for i in range(4):
+            point = par.add_subsystem('p%d' % i, Group())
+            point.add_subsystem('slow', _SlowComp(threads=threads))
+            point.add_subsystem('scale', ExecComp('y = %d.0 * x' % (i + 1),
+                                                  x=np.ones(3), y=np.ones(3)))
+            point.connect('slow.y', 'scale.x')
+            model.connect('iv.x', 'par.p%d.slow.x' % i)
+            model.add_subsystem('sum%d' % i, ExecComp('y = sum(x)', x=np.ones(3)))
+            model.connect('par.p%d.scale.y' % i, 'sum%d.x' % i)
+
+        prob.setup(check=False, mode='rev')
+        prob.set_solver_print(level=0)
+        prob.run_model()
+        return prob
+
+    def _check(self, prob):
+        of = ['sum%d.y' % i for i in range(4)]
+        J = prob.compute_totals(of=of, wrt=['iv.x'])
+        x = np.array([1.0, 2.0, 3.0])
+        for i in range(4):
+            assert_rel_error(self, prob['par.p%d.scale.y' % i], (i + 1) * x ** 2, 1e-15)
+            assert_rel_error(self, prob['sum%d.y' % i], (i + 1) * np.sum(x ** 2), 1e-15)
+            assert_rel_error(self, J['sum%d.y' % i, 'iv.x'], (i + 1) * 2.0 * x[np.newaxis],
+                             1e-15)
+
+    def test_run_once(self):
+        threads = set()
+        self._check(self._build(1, threads))
+        self.assertEqual(len(threads), 1)
+
+        threads = set()
+        self._check(self._build(4, threads, ln_solver=LinearBlockJac(num_threads=4)))
+        self.assertGreater(len(threads), 1)
+
+    def test_block_jac(self):
+        threads = set()
+        prob = self._build(1, threads, nl_solver=NonlinearBlockJac(num_threads=4),
+                           ln_solver=LinearBlockJac(num_threads=4))
+        self._check(prob)
+        self.assertGreater(len(threads), 1)
+
+    def test_recorder_runs_sequentially(self):
+        tempdir = tempfile.mkdtemp(prefix='test_parallel_groups-')
+        self.addCleanup(shutil.rmtree, tempdir, ignore_errors=True)
+
+        threads = set()
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('iv', IndepVarComp('x', np.ones(3)))
+        par = model.add_subsystem('par', ParallelGroup(num_threads=4))
+        for i in range(4):
+            par.add_subsystem('c%d' % i, _SlowComp(threads=threads))
+            model.connect('iv.x', 'par.c%d.x' % i)
+        par.c2.add_recorder(SqliteRecorder(os.path.join(tempdir, 'cases.sql')))
+
+        prob.setup(check=False)
+        prob.run_model()
+        prob.cleanup()
+        self.assertEqual(threads, set([threading.current_thread().ident]))
+
+    def test_analysis_error(self):
+        class FailComp(ExplicitComponent):
+            def setup(self):
+                self.add_input('x', 1.0)
+                self.add_output('y', 1.0)
+
+            def compute(self, inputs, outputs):
+                raise AnalysisError('failed in a thread')
+
+        prob = Problem()
+        par = prob.model.add_subsystem('par', ParallelGroup(num_threads=2))
+        par.add_subsystem('c0', ExecComp('y = 2.0 * x'))
+        par.add_subsystem('c1', FailComp())
+        prob.setup(check=False)
+
+        with self.assertRaises(AnalysisError) as cm:
+            prob.run_model()
+        self.assertEqual(str(cm.exception), 'failed in a thread')
+
+
 if __name__ == "__main__":
     from openmdao.utils.mpi import mpirun_tests
     mpirun_tests()
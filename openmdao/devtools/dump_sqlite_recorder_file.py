@@ -4,7 +4,7 @@ import sqlite3
 import sys
 from six import PY2, PY3, iteritems
 
-from openmdao.recorders.sqlite_recorder import blob_to_array
+from openmdao.recorders.sqlite_recorder import blob_to_array, BlobCodec
 
 if PY2:
     import cPickle as pickle
@@ -44,6 +44,10 @@ filename = sys.argv[1]
 con = sqlite3.connect(filename)
 cur = con.cursor()
 
+cur.execute("SELECT format_version FROM metadata")
+if cur.fetchone()[0] > 1:
+    blob_to_array = BlobCodec(con).decode
+
 from six import PY2, PY3
 
 if PY2:
@@ -17,7 +17,7 @@ from pyDOE import lhs
 
 from openmdao.core.driver import Driver
 from openmdao.recorders.recording_iteration_stack import Recording
-from openmdao.utils.concurrent import concurrent_eval
+from openmdao.utils.concurrent import concurrent_eval, concurrent_eval_local
 
 
 class SimpleGADriver(Driver):
@@ -30,6 +30,9 @@ class SimpleGADriver(Driver):
         If True, replace worst performing point with best from previous generation each iteration.
     options['max_gen'] :  int(300)
         Number of generations before termination.
+    options['num_procs'] :  int(1)
+        Number of local processes used to evaluate the points in a generation when not
+        running in parallel under MPI.
     options['pop_size'] :  int(25)
         Number of points in the GA.
 
@@ -40,6 +43,9 @@ class SimpleGADriver(Driver):
         design variables.
     _ga : <GeneticAlgorithm>
         Main genetic algorithm lies here.
+    _local_worker : bool
+        True in a local worker process, which returns the outputs of the model along with the
+        objective so that the main process can record the point.
     """
 
     def __init__(self):
@@ -75,9 +81,15 @@ class SimpleGADriver(Driver):
                              desc='Number of points in the GA.')
         self.options.declare('run_parallel', default=False,
                              desc='Set to True to execute the points in a generation in parallel.')
+        self.options.declare('num_procs', default=1, types=int, lower=1,
+                             desc='Number of local processes used to evaluate the points in a '
+                             'generation when not running in parallel under MPI. Each process '
+                             'evaluates its points on its own copy of the model, and the points '
+                             'are recorded by the main process.')
 
         self._desvar_idx = {}
         self._ga = None
+        self._local_worker = False
 
     def _setup_driver(self, problem):
         """
@@ -105,7 +117,39 @@ class SimpleGADriver(Driver):
         else:
             comm = None
 
-        self._ga = GeneticAlgorithm(self.objective_callback, comm=comm)
+        self._ga = GeneticAlgorithm(self.objective_callback, comm=comm,
+                                    num_procs=self.options['num_procs'],
+                                    init_worker=self._init_worker,
+                                    record_local=self._record_local_case)
+
+    def _init_worker(self):
+        """
+        Prepare a local worker process to evaluate points.
+
+        The worker is a copy of this process, so its recorders would write to the same files.
+        They are detached, and the worker returns the outputs of the model with each point so
+        that this process can record it.
+        """
+        for rec_mgr in self._problem._get_recording_managers():
+            rec_mgr._recorders = []
+        self._local_worker = True
+
+    def _record_local_case(self, returns):
+        """
+        Record a point that was evaluated in a local worker process.
+
+        Parameters
+        ----------
+        returns : tuple
+            The values returned by objective_callback in the worker, ending with the outputs of
+            the model at the point.
+        """
+        self._problem.model._outputs.set_data(returns[-1])
+
+        with Recording('SimpleGA', self.iter_count, self) as rec:
+            self.iter_count += 1
+            rec.abs = 0.0
+            rec.rel = 0.0
 
     def run(self):
         """
@@ -190,6 +234,8 @@ class SimpleGADriver(Driver):
             Success flag, True if successful
         int
             Case number, used for identification when run in parallel.
+        ndarray, optional
+            Outputs of the model, returned only by local worker processes.
         """
         model = self._problem.model
         success = 1
@@ -221,6 +267,8 @@ class SimpleGADriver(Driver):
         # print("Functions calculated")
         # print(x)
         # print(obj)
+        if self._local_worker:
+            return obj, success, icase, model._outputs.get_data()
         return obj, success, icase
 
 
@@ -238,15 +286,22 @@ class GeneticAlgorithm():
         The MPI communicator that will be used objective evaluation for each generation.
     elite : bool
         Elitism flag.
+    init_worker : function or None
+        Function called in each local worker process when it starts.
+    record_local : function or None
+        Function called in this process with the values returned for each point evaluated in a
+        local worker process.
     lchrom : int
         Chromosome length.
     npop : int
         Population size.
+    num_procs : int
+        Number of local processes used to evaluate each generation when comm is None.
     objfun : function
         Objective function callback.
     """
 
-    def __init__(self, objfun, comm=None):
+    def __init__(self, objfun, comm=None, num_procs=1, init_worker=None, record_local=None):
         """
         Initialize genetic algorithm object.
 
@@ -256,9 +311,20 @@ class GeneticAlgorithm():
             Objective callback function.
         comm : MPI communicator or None
             The MPI communicator that will be used objective evaluation for each generation.
+        num_procs : int
+            Number of local processes used to evaluate each generation when comm is None. The
+            processes are forked, so each starts with a copy of the state of this one.
+        init_worker : function or None
+            Function called in each local worker process when it starts.
+        record_local : function or None
+            Function called in this process with the values returned for each point evaluated
+            in a local worker process, in the order of the points.
         """
         self.objfun = objfun
         self.comm = comm
+        self.num_procs = num_procs
+        self.init_worker = init_worker
+        self.record_local = record_local
 
         self.lchrom = 0
         self.npop = 0
@@ -305,7 +371,7 @@ class GeneticAlgorithm():
 
         # TODO: from an user-supplied intial population
         # new_gen, lchrom = encode(x0, vlb, vub, bits)
-        new_gen = np.round(lhs(self.lchrom, self.npop, criterion='center'))
+        new_gen = np.round(lhs(self.lchrom, self.npop, criterion='center')).astype(bool)
 
         # Main Loop
         nfit = 0
@@ -314,18 +380,28 @@ class GeneticAlgorithm():
             x_pop = self.decode(old_gen, vlb, vub, bits)
 
             # Evaluate points in this generation.
-            if self.comm is not None:
+            if self.comm is not None or self.num_procs > 1:
                 # Parallel
                 cases = [((item, ii), None) for ii, item in enumerate(x_pop)]
 
-                results = concurrent_eval(self.objfun, cases, self.comm, allgather=True)
+                if self.comm is not None:
+                    results = concurrent_eval(self.objfun, cases, self.comm, allgather=True)
+                else:
+                    results = concurrent_eval_local(self.objfun, cases, self.num_procs,
+                                                    initializer=self.init_worker)
+
+                    # the workers do not record, so their points are recorded here
+                    if self.record_local is not None:
+                        for returns, traceback in results:
+                            if returns and len(returns) > 3:
+                                self.record_local(returns)
 
                 fitness[:] = np.inf
                 for result in results:
                     returns, traceback = result
 
                     if returns:
-                        val, success, ii = returns
+                        val, success, ii = returns[:3]
                         if success:
                             fitness[ii] = val
                             nfit += 1
@@ -389,17 +465,16 @@ class GeneticAlgorithm():
             New generation with best points.
         """
         new_gen = []
-        idx = np.array(range(0, self.npop - 1, 2))
+        idx = np.arange(0, self.npop - 1, 2)
         for j in range(2):
             old_gen, i_shuffled = self.shuffle(old_gen)
             fitness = fitness[i_shuffled]
 
             # Each point competes with its neighbor; save the best.
-            i_min = np.argmin(np.array([[fitness[idx]], [fitness[idx + 1]]]), axis=0)
-            selected = i_min + idx
+            selected = idx + (fitness[idx + 1] < fitness[idx])
             new_gen.append(old_gen[selected])
 
-        return np.concatenate(np.array(new_gen), axis=1).reshape(old_gen.shape)
+        return np.concatenate(new_gen)
 
     def crossover(self, old_gen, Pc):
         """
@@ -420,15 +495,13 @@ class GeneticAlgorithm():
         ndarray
             Current generation with crossovers applied.
         """
-        new_gen = copy.deepcopy(old_gen)
+        new_gen = old_gen.copy()
         num_sites = self.npop // 2
-        sites = np.random.rand(num_sites, self.lchrom)
-        idx, idy = np.where(sites < Pc)
-        for ii, jj in zip(idx, idy):
-            i = 2 * ii
-            j = i + 1
-            new_gen[i][jj] = old_gen[j][jj]
-            new_gen[j][jj] = old_gen[i][jj]
+        sites = np.random.rand(num_sites, self.lchrom) < Pc
+
+        # Swap the genes at the crossover sites of each pair of neighbors.
+        new_gen[0:2 * num_sites:2][sites] = old_gen[1:2 * num_sites:2][sites]
+        new_gen[1:2 * num_sites:2][sites] = old_gen[0:2 * num_sites:2][sites]
         return new_gen
 
     def mutate(self, current_gen, Pm):
@@ -450,9 +523,8 @@ class GeneticAlgorithm():
         ndarray
             Current generation with mutations applied.
         """
-        temp = np.random.rand(self.npop, self.lchrom)
-        idx, idy = np.where(temp < Pm)
-        current_gen[idx, idy] = 1 - current_gen[idx, idy]
+        mutations = np.random.rand(self.npop, self.lchrom) < Pm
+        current_gen[mutations] = np.logical_not(current_gen[mutations])
         return current_gen
 
     def shuffle(self, old_gen):
@@ -499,16 +571,16 @@ class GeneticAlgorithm():
         """
         num_desvar = len(bits)
         interval = (vub - vlb) / (2**bits - 1)
-        x = np.empty((self.npop, num_desvar))
-        sbit = 0
-        ebit = 0
-        for jj in range(num_desvar):
-            exponents = 2**np.array(range(bits[jj] - 1, -1, -1))
-            ebit += bits[jj]
-            fact = exponents * (gen[:, sbit:ebit])
-            x[:, jj] = np.einsum('ij->i', fact) * interval[jj] + vlb[jj]
-            sbit = ebit
-        return x
+
+        # Each gene contributes a power of two to the integer value of its design variable, with
+        # the most significant bit first.
+        lchrom = int(np.sum(bits))
+        var_idx = np.repeat(np.arange(num_desvar), bits)
+        exponents = np.cumsum(bits)[var_idx] - 1 - np.arange(lchrom)
+        powers = np.zeros((lchrom, num_desvar))
+        powers[np.arange(lchrom), var_idx] = 2.0 ** exponents
+
+        return gen.dot(powers) * interval + vlb
 
     def encode(self, x, vlb, vub, bits):
         """
@@ -55,6 +55,10 @@ class ScipyOptimizeDriver(Driver):
 
     Options
     -------
+    options['cache_size'] : int(10)
+        Number of design points whose model evaluations and derivatives are kept for reuse.
+    options['cache_tol'] : float(0.0)
+        Design points that differ by no more than this in every entry share a cache entry.
     options['disp'] :  bool(True)
         Set to False to prevent printing of Scipy convergence messages
     options['maxiter'] : int(200)
@@ -66,6 +70,9 @@ class ScipyOptimizeDriver(Driver):
 
     Attributes
     ----------
+    cache_stats : dict
+        Number of model evaluations and total derivative computations performed, and the number
+        of requests for each that were served from the evaluation cache.
     fail : bool
         Flag that indicates failure of most recent optimization.
     iter_count : int
@@ -82,6 +89,9 @@ class ScipyOptimizeDriver(Driver):
         Contains all constraint info.
     _designvars : dict
         Contains all design variable info.
+    _eval_cache : OrderedDict
+        Model evaluations and derivatives keyed on the bytes of the design vector, least
+        recently used first.
     _grad_cache : OrderedDict
         Cached result of nonlinear constraint derivatives because scipy asks for them in a separate
         function.
@@ -92,6 +102,8 @@ class ScipyOptimizeDriver(Driver):
         Contains all objective info.
     _exc_info : 3 item tuple
         Storage for exception and traceback information.
+    _model_x : ndarray or None
+        Design vector the model was last successfully evaluated at.
     _obj_and_nlcons : list
         List of objective + nonlinear constraints. Used to compute total derivatives
         for all except linear constraints.
@@ -125,6 +137,13 @@ class ScipyOptimizeDriver(Driver):
                              desc='Maximum number of iterations.')
         self.options.declare('disp', True,
                              desc='Set to False to prevent printing of Scipy convergence messages')
+        self.options.declare('cache_size', 10, lower=1,
+                             desc='Number of design points whose model evaluations and '
+                             'derivatives are kept for reuse by the optimizer callbacks.')
+        self.options.declare('cache_tol', 0.0, lower=0.0,
+                             desc='Design points that differ by no more than this absolute '
+                             'tolerance in every entry are treated as the same point by the '
+                             'evaluation cache.')
 
         # The user places optimizer-specific settings in here.
         self.opt_settings = OrderedDict()
@@ -139,6 +158,9 @@ class ScipyOptimizeDriver(Driver):
         self.fail = False
         self.iter_count = 0
         self._exc_info = None
+        self._eval_cache = OrderedDict()
+        self._model_x = None
+        self.cache_stats = {}
 
         self.cite = CITATIONS
 
@@ -203,6 +225,9 @@ class ScipyOptimizeDriver(Driver):
         opt = self.options['optimizer']
         model = self._problem.model
         self.iter_count = 0
+        self._eval_cache = OrderedDict()
+        self._model_x = None
+        self.cache_stats = {'model_evals': 0, 'model_hits': 0, 'deriv_evals': 0, 'deriv_hits': 0}
 
         # Initial Run
         model._solve_nonlinear()
@@ -360,7 +385,7 @@ class ScipyOptimizeDriver(Driver):
         """
         Evaluate and return the objective function.
 
-        Model is executed here.
+        Model is executed here, unless the design point is already in the evaluation cache.
 
         Parameters
         ----------
@@ -372,27 +397,14 @@ class ScipyOptimizeDriver(Driver):
         float
             Value of the objective function evaluated at the new design point.
         """
-        model = self._problem.model
-
         try:
+            entry = self._get_cache_entry(x_new)
 
-            # Pass in new parameters
-            i = 0
-            for name, meta in iteritems(self._designvars):
-                size = meta['size']
-                self.set_design_var(name, x_new[i:i + size])
-                i += size
-
-            with RecordingDebugging(self.options['optimizer'], self.iter_count, self) as rec:
-                self.iter_count += 1
-                model._solve_nonlinear()
-
-            # Get the objective function evaluations
-            for name, obj in iteritems(self.get_objective_values()):
-                f_new = obj
-                break
-
-            self._con_cache = self.get_constraint_values()
+            if 'obj' in entry:
+                self.cache_stats['model_hits'] += 1
+                self._con_cache = entry['cons']
+            else:
+                self._run_model(entry)
 
         except Exception as msg:
             self._exc_info = sys.exc_info()
@@ -400,16 +412,120 @@ class ScipyOptimizeDriver(Driver):
 
         # print("Functions calculated")
         # print(x_new)
-        # print(f_new)
+        # print(entry['obj'])
+
+        return entry['obj']
+
+    def _run_model(self, entry):
+        """
+        Run the model at the design point of a cache entry and store the responses in it.
+
+        Parameters
+        ----------
+        entry : dict
+            Cache entry for the new design point.
+        """
+        model = self._problem.model
+        x_new = entry['x']
+
+        # Pass in new parameters
+        i = 0
+        for name, meta in iteritems(self._designvars):
+            size = meta['size']
+            self.set_design_var(name, x_new[i:i + size])
+            i += size
 
-        return f_new
+        self._model_x = None
+        with RecordingDebugging(self.options['optimizer'], self.iter_count, self) as rec:
+            self.iter_count += 1
+            self.cache_stats['model_evals'] += 1
+            model._solve_nonlinear()
+        self._model_x = entry['x']
+
+        # Get the objective function evaluations
+        for name, obj in iteritems(self.get_objective_values()):
+            entry['obj'] = obj
+            break
+
+        self._con_cache = entry['cons'] = self.get_constraint_values()
+
+    def _get_cache_entry(self, x_new):
+        """
+        Return the evaluation cache entry for a design point, creating an empty one if needed.
+
+        Parameters
+        ----------
+        x_new : ndarray
+            Array containing parameter values at new design point.
+
+        Returns
+        -------
+        dict
+            Cache entry, holding the design vector under 'x' and whatever has been computed there
+            so far under 'obj', 'cons' and 'grad'.
+        """
+        cache = self._eval_cache
+        key = x_new.tobytes()
+        entry = cache.get(key)
+
+        if entry is None:
+            tol = self.options['cache_tol']
+            if tol > 0.0:
+                for old_entry in itervalues(cache):
+                    if np.max(np.abs(old_entry['x'] - x_new)) <= tol:
+                        entry = old_entry
+                        break
+
+        if entry is None:
+            entry = {'x': x_new.copy(), 'key': key}
+            size = self.options['cache_size']
+            while len(cache) >= size:
+                cache.popitem(last=False)
+        else:
+            # move to the most recently used end
+            del cache[entry['key']]
+
+        cache[entry['key']] = entry
+        return entry
+
+    def _get_grad(self, x_new):
+        """
+        Return the derivatives of the objective and nonlinear constraints at a design point.
+
+        Parameters
+        ----------
+        x_new : ndarray
+            Array containing parameter values at new design point.
+
+        Returns
+        -------
+        ndarray
+            Derivatives of the objective and nonlinear constraints with respect to the
+            parameter array.
+        """
+        entry = self._get_cache_entry(x_new)
+
+        if 'grad' in entry:
+            self.cache_stats['deriv_hits'] += 1
+        else:
+            # The model may have moved on to other points since this one was evaluated.
+            if self._model_x is not entry['x']:
+                self._run_model(entry)
+
+            self.cache_stats['deriv_evals'] += 1
+            entry['grad'] = self._compute_totals(of=self._obj_and_nlcons,
+                                                 wrt=list(self._designvars),
+                                                 return_format='array')
+
+        self._grad_cache = entry['grad']
+        return entry['grad']
 
     def _confunc(self, x_new, name, dbl, idx):
         """
         Return the value of the constraint function requested in args.
 
-        Note that this function is called for each constraint, so the model is only run when the
-        objective is evaluated.
+        Note that this function is called for each constraint, so the values are taken from the
+        evaluation cache and the model is only run if this design point is not there.
 
         Parameters
         ----------
@@ -430,7 +546,20 @@ class ScipyOptimizeDriver(Driver):
         if self._exc_info is not None:
             self._reraise()
 
-        cons = self._con_cache
+        entry = self._eval_cache.get(x_new.tobytes())
+        if entry is not None and 'cons' in entry:
+            cons = entry['cons']
+        else:
+            # Not the point of the latest objective evaluation, so look it up or run it.
+            try:
+                entry = self._get_cache_entry(x_new)
+                if 'cons' not in entry:
+                    self._run_model(entry)
+            except Exception as msg:
+                self._exc_info = sys.exc_info()
+                return 0
+            cons = entry['cons']
+
         meta = self._cons[name]
 
         # Equality constraints
@@ -472,9 +601,7 @@ class ScipyOptimizeDriver(Driver):
             Gradient of objective with respect to parameter array.
         """
         try:
-            grad = self._compute_totals(of=self._obj_and_nlcons, wrt=list(self._designvars),
-                                        return_format='array')
-            self._grad_cache = grad
+            grad = self._get_grad(x_new)
 
         except Exception as msg:
             self._exc_info = sys.exc_info()
@@ -491,7 +618,7 @@ class ScipyOptimizeDriver(Driver):
         Return the cached gradient of the constraint function.
 
         Note, scipy calls the constraints one at a time, so the gradient is cached when the
-        objective gradient is called.
+        objective gradient is called, and only computed here if it is not in the cache.
 
         Parameters
         ----------
@@ -517,7 +644,15 @@ class ScipyOptimizeDriver(Driver):
         if meta['linear']:
             grad = self._lincongrad_cache
         else:
-            grad = self._grad_cache
+            entry = self._eval_cache.get(x_new.tobytes())
+            if entry is not None and 'grad' in entry:
+                grad = entry['grad']
+            else:
+                try:
+                    grad = self._get_grad(x_new)
+                except Exception as msg:
+                    self._exc_info = sys.exc_info()
+                    return np.array([])
         grad_idx = self._con_idx[name] + idx
 
         # print("Constraint Gradient returned")
@@ -1,11 +1,16 @@
 """ Unit tests for the SimpleGADriver Driver."""
 
+import os
 import unittest
+from shutil import rmtree
+from tempfile import mkdtemp
 
 import numpy as np
 
-from openmdao.api import Problem, Group, IndepVarComp, ExplicitComponent, ExecComp, PETScVector
-from openmdao.drivers.genetic_algorithm_driver import SimpleGADriver
+from openmdao.api import Problem, Group, IndepVarComp, ExplicitComponent, ExecComp, PETScVector, \
+    SqliteRecorder
+from openmdao.drivers.genetic_algorithm_driver import SimpleGADriver, GeneticAlgorithm
+from openmdao.recorders.case_reader import CaseReader
 from openmdao.test_suite.components.branin import Branin
 from openmdao.test_suite.components.three_bar_truss import ThreeBarTruss
 from openmdao.utils.assert_utils import assert_rel_error
@@ -93,6 +98,89 @@ class TestSimpleGA(unittest.TestCase):
         assert_rel_error(self, prob['comp.f'], 0.49398, 1e-4)
         self.assertTrue(int(prob['p2.xI']) in [3, -3])
 
+    def test_mixed_integer_branin_num_procs(self):
+
+        def run_ga(num_procs):
+            np.random.seed(1)
+
+            prob = Problem()
+            model = prob.model = Group()
+
+            model.add_subsystem('p1', IndepVarComp('xC', 7.5))
+            model.add_subsystem('p2', IndepVarComp('xI', 0.0))
+            model.add_subsystem('comp', Branin())
+
+            model.connect('p2.xI', 'comp.x0')
+            model.connect('p1.xC', 'comp.x1')
+
+            model.add_design_var('p2.xI', lower=-5.0, upper=10.0)
+            model.add_design_var('p1.xC', lower=0.0, upper=15.0)
+            model.add_objective('comp.f')
+
+            prob.driver = SimpleGADriver()
+            prob.driver.options['bits'] = {'p1.xC' : 8}
+            prob.driver.options['max_gen'] = 20
+            prob.driver.options['num_procs'] = num_procs
+
+            prob.setup(check=False)
+            prob.run_driver()
+
+            return prob['comp.f'].copy(), prob['p1.xC'].copy(), prob['p2.xI'].copy()
+
+        # the points are evaluated in other processes, but the search is the same
+        for expected, actual in zip(run_ga(1), run_ga(3)):
+            assert_rel_error(self, actual, expected, 1e-15)
+
+    def test_num_procs_recording(self):
+        tempdir = mkdtemp()
+        self.addCleanup(rmtree, tempdir, ignore_errors=True)
+
+        def run_ga(num_procs):
+            np.random.seed(1)
+
+            prob = Problem()
+            model = prob.model = Group()
+
+            model.add_subsystem('p1', IndepVarComp('xC', 7.5))
+            model.add_subsystem('p2', IndepVarComp('xI', 0.0))
+            model.add_subsystem('comp', Branin())
+
+            model.connect('p2.xI', 'comp.x0')
+            model.connect('p1.xC', 'comp.x1')
+
+            model.add_design_var('p2.xI', lower=-5.0, upper=10.0)
+            model.add_design_var('p1.xC', lower=0.0, upper=15.0)
+            model.add_objective('comp.f')
+
+            filename = os.path.join(tempdir, 'ga_%d.sql' % num_procs)
+            prob.driver = SimpleGADriver()
+            prob.driver.options['bits'] = {'p1.xC': 8}
+            prob.driver.options['max_gen'] = 3
+            prob.driver.options['pop_size'] = 10
+            prob.driver.options['num_procs'] = num_procs
+            prob.driver.add_recorder(SqliteRecorder(filename))
+
+            prob.setup(check=False)
+            prob.run_driver()
+            prob.cleanup()
+
+            cases = CaseReader(filename).driver_cases
+            self.assertEqual(prob.driver.iter_count, cases.num_cases)
+            return [cases.get_case(i) for i in range(cases.num_cases)]
+
+        expected = run_ga(1)
+        actual = run_ga(2)
+
+        # every point of the 4 generations of 10, and the final point
+        self.assertEqual(len(expected), 41)
+        self.assertEqual(len(actual), 41)
+        for case, expected_case in zip(actual, expected):
+            self.assertEqual(case.iteration_coordinate, expected_case.iteration_coordinate)
+            for name in ('p1.xC', 'p2.xI'):
+                assert_rel_error(self, case.desvars[name], expected_case.desvars[name], 1e-15)
+            assert_rel_error(self, case.objectives['comp.f'],
+                             expected_case.objectives['comp.f'], 1e-15)
+
     def test_mixed_integer_3bar(self):
         np.random.seed(1)
 
@@ -154,6 +242,41 @@ class TestSimpleGA(unittest.TestCase):
         assert_rel_error(self, prob['mat2'], 3, 1e-5)
         #Material 3 can be anything
 
+    def test_ga_operators(self):
+        np.random.seed(7)
+
+        ga = GeneticAlgorithm(None)
+        ga.npop = 6
+        ga.lchrom = 5
+
+        # 3 bits and 2 bits, most significant bit first
+        gen = np.array([[0, 0, 0, 0, 0],
+                        [1, 1, 1, 1, 1],
+                        [1, 0, 0, 0, 1],
+                        [0, 1, 1, 1, 0],
+                        [0, 0, 1, 1, 1],
+                        [1, 1, 0, 0, 0]], dtype=bool)
+        vlb = np.array([0.0, -1.0])
+        vub = np.array([7.0, 5.0])
+        x = ga.decode(gen, vlb, vub, np.array([3, 2]))
+        assert_rel_error(self, x, [[0.0, -1.0], [7.0, 5.0], [4.0, 1.0], [3.0, 3.0],
+                                   [1.0, 5.0], [6.0, -1.0]], 1e-15)
+
+        # the best point wins both of its tournaments
+        fitness = np.arange(6.0)
+        new_gen = ga.tournament(gen, fitness)
+        self.assertEqual(new_gen.shape, gen.shape)
+        self.assertEqual(new_gen.dtype, bool)
+        self.assertEqual(sum(np.array_equal(point, gen[0]) for point in new_gen), 2)
+
+        # crossover swaps genes between neighbors, so each column keeps its number of ones
+        crossed = ga.crossover(gen, 0.5)
+        np.testing.assert_array_equal(crossed.sum(axis=0), gen.sum(axis=0))
+        np.testing.assert_array_equal(crossed[0::2] ^ crossed[1::2], gen[0::2] ^ gen[1::2])
+
+        mutated = ga.mutate(gen.copy(), 1.0)
+        np.testing.assert_array_equal(mutated, ~gen)
+
 
 @unittest.skipUnless(PETScVector, "PETSc is required.")
 class MPITestSimpleGA(unittest.TestCase):
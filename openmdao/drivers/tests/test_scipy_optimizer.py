@@ -967,6 +967,74 @@ class TestScipyOptimizeDriver(unittest.TestCase):
         self.assertTrue(len([s for s in output if s.startswith('comp.f_xy')]) > 1,
                         "Should be more than one comp.f_xy printed")
 
+    def test_eval_cache(self):
+
+        class CountedParaboloid(Paraboloid):
+
+            def initialize(self):
+                super(CountedParaboloid, self).initialize()
+                self.count = 0
+
+            def compute(self, inputs, outputs):
+                self.count += 1
+                super(CountedParaboloid, self).compute(inputs, outputs)
+
+        prob = Problem()
+        model = prob.model = Group()
+
+        model.add_subsystem('p1', IndepVarComp('x', 50.0), promotes=['*'])
+        model.add_subsystem('p2', IndepVarComp('y', 50.0), promotes=['*'])
+        comp = model.add_subsystem('comp', CountedParaboloid(), promotes=['*'])
+        model.add_subsystem('con', ExecComp('c = - x + y'), promotes=['*'])
+
+        prob.driver = ScipyOptimizeDriver()
+        prob.driver.options['optimizer'] = 'SLSQP'
+        prob.driver.options['tol'] = 1e-9
+        prob.driver.options['disp'] = False
+        prob.driver.options['cache_size'] = 100
+
+        model.add_design_var('x', lower=-50.0, upper=50.0)
+        model.add_design_var('y', lower=-50.0, upper=50.0)
+        model.add_objective('f_xy')
+        model.add_constraint('c', upper=-15.0)
+
+        prob.setup(check=False)
+        prob.run_driver()
+
+        assert_rel_error(self, prob['x'], 7.16667, 1e-6)
+        assert_rel_error(self, prob['y'], -7.833334, 1e-6)
+
+        driver = prob.driver
+        stats = driver.cache_stats
+
+        # one extra run for the initial point
+        self.assertEqual(comp.count, stats['model_evals'] + 1)
+        self.assertEqual(driver.iter_count, stats['model_evals'])
+
+        # revisiting cached points does not run the model
+        x_old = np.array([50.0, 50.0])
+        x_opt = np.array([prob['x'][0], prob['y'][0]])
+        count = comp.count
+        hits = stats['model_hits']
+        assert_rel_error(self, driver._objfunc(x_old), 47.0**2 + 2500.0 + 54.0**2 - 3.0, 1e-10)
+        assert_rel_error(self, driver._confunc(x_old, 'con.c', False, 0), -15.0, 1e-10)
+        self.assertEqual(comp.count, count)
+        self.assertEqual(stats['model_hits'], hits + 1)
+
+        # derivatives at a cached point the model has moved away from are computed there
+        driver._eval_cache.pop(x_opt.tobytes(), None)
+        for entry in driver._eval_cache.values():
+            entry.pop('grad', None)
+        grad = driver._gradfunc(x_old)
+        self.assertEqual(comp.count, count + 1)
+        assert_rel_error(self, grad, [2.0 * 50.0 - 6.0 + 50.0, 2.0 * 50.0 + 8.0 + 50.0], 1e-6)
+        assert_rel_error(self, driver._congradfunc(x_old, 'con.c', False, 0), [1.0, -1.0], 1e-10)
+        hits = stats['deriv_hits']
+
+        driver._gradfunc(x_old)
+        self.assertEqual(stats['deriv_hits'], hits + 1)
+        self.assertEqual(comp.count, count + 1)
+
 
 class TestScipyOptimizeDriverFeatures(unittest.TestCase):
 
@@ -45,8 +45,9 @@ class AssembledJacobian(Jacobian):
         Mapping of original (output, input) key to (output, source) in cases
         where the input has src_indices.
     _mask_caches : dict
-        Contains masking arrays for when a subset of the variables are present in a vector, keyed
-        by the input._names set.
+        Contains the indices of the d_inputs entries to exclude when only a subset of the
+        variables are present in a vector, keyed by system pathname, vector name and the
+        input._names set.
     _subjac_iters : dict
         Mapping of system pathname to tuple of lists of absolute key tuples used to index into
         the jacobian.
@@ -359,22 +360,14 @@ class AssembledJacobian(Jacobian):
                     d_residuals.iadd_data(int_mtx._prod(d_outputs.get_data(), mode, int_ranges))
 
                 if ext_mtx is not None and d_inputs._names and d_residuals._names:
+                    dinputs = d_inputs.get_data()
 
-                    # Masking
-                    cache_key = tuple(d_inputs._names)
-                    if cache_key not in self._mask_caches:
-                        self._create_mask_cache(d_inputs, cache_key, ext_mtx)
-
-                    mask = self._mask_caches.get(cache_key)
+                    # Inputs that are not part of this product are excluded by zeroing them.
+                    mask = self._get_mask(d_inputs)
                     if mask is not None:
-                        inputs_masked = np.ma.array(d_inputs.get_data(), mask=mask)
-
-                        # Use the special dot product function from masking module so that we
-                        # ignore masked parts.
-                        d_residuals.iadd_data(np.ma.dot(ext_mtx._matrix, inputs_masked))
+                        dinputs[mask] = 0.0
 
-                    else:
-                        d_residuals.iadd_data(ext_mtx._prod(d_inputs.get_data(), mode, None))
+                    d_residuals.iadd_data(ext_mtx._prod(dinputs, mode, None))
 
             else:  # rev
                 dresids = d_residuals.get_data()
@@ -383,59 +376,51 @@ class AssembledJacobian(Jacobian):
                     d_outputs.iadd_data(int_mtx._prod(dresids, mode, int_ranges))
 
                 if ext_mtx is not None and d_inputs._names and d_residuals._names:
+                    dinputs = ext_mtx._prod(dresids, mode, None)
 
-                    # Masking
-                    cache_key = tuple(d_inputs._names)
-                    if cache_key not in self._mask_caches:
-                        self._create_mask_cache(d_inputs, cache_key, ext_mtx)
-
-                    mask_cols = self._mask_caches.get(cache_key)
-                    if mask_cols is not None:
-
-                        # Mask need to be applied to ext_mtx so that we can ignore multiplication
-                        # by certain columns.
-                        mask = np.zeros(ext_mtx._matrix.T.shape, dtype=np.bool)
-                        mask[mask_cols, :] = True
-                        masked_mtx = np.ma.array(ext_mtx._matrix, mask=mask, fill_value=0.0)
-
-                        masked_product = np.ma.dot(masked_mtx.T, dresids).flatten()
-
-                        for set_name, data in iteritems(d_inputs._data):
-                            data += np.ma.filled(masked_product, fill_value=0.0)
+                    # Inputs that are not part of this product are left untouched.
+                    mask = self._get_mask(d_inputs)
+                    if mask is not None:
+                        dinputs[mask] = 0.0
 
-                    else:
-                        d_inputs.iadd_data(ext_mtx._prod(dresids, mode, None))
+                    d_inputs.iadd_data(dinputs)
 
-    def _create_mask_cache(self, d_inputs, cache_key, ext_mtx):
+    def _get_mask(self, d_inputs):
         """
-        Create masking array for d_inputs vector.
+        Get the indices of the d_inputs entries that are excluded from the current product.
 
         Parameters
         ----------
         d_inputs : Vector
             The inputs linear vector.
-        cache_key : tuple
-            Hashable unique key, from d_inputs._names
-        ext_mtx : Matrix
-            External matrix
-        """
-        masked = [name for name in d_inputs._views if name not in cache_key]
-        if masked:
-            mask = np.zeros(d_inputs._data[0].shape, dtype=np.bool)
-            for name in masked:
 
-                # TODO: For now, we figure out where each variable in the matrix is using
-                # the matrix metadata, but this is not ideal. The framework does not provide
-                # this information cleanly, but an upcoming refactor will address this.
-                for key, val in iteritems(ext_mtx._metadata):
-                    if key[1] == name:
-                        mask[val[1]] = True
-                        continue
+        Returns
+        -------
+        ndarray of int or None
+            Indices into the combined d_inputs data, or None if no entries are excluded.
+        """
+        system = d_inputs._system
+        vec_name = d_inputs._name
+        cache_key = (system.pathname, vec_name, tuple(d_inputs._names))
 
-            self._mask_caches[cache_key] = mask
+        try:
+            return self._mask_caches[cache_key]
+        except KeyError:
+            pass
 
+        masked = [name for name in d_inputs._views if name not in d_inputs._names]
+        if masked:
+            sizes = system._var_sizes[vec_name]['input'][system.comm.rank]
+            offsets = np.cumsum(sizes) - sizes
+            abs2idx = system._var_allprocs_abs2idx[vec_name]
+            mask = np.concatenate([np.arange(offsets[abs2idx[name]],
+                                             offsets[abs2idx[name]] + sizes[abs2idx[name]])
+                                   for name in masked])
         else:
-            self._mask_caches[cache_key] = None
+            mask = None
+
+        self._mask_caches[cache_key] = mask
+        return mask
 
 
 class DenseJacobian(AssembledJacobian):
@@ -2,8 +2,7 @@
 from __future__ import division
 
 import numpy as np
-import scipy.sparse
-from six.moves import range
+from scipy.sparse import csr_matrix
 
 from openmdao.jacobians.jacobian import Jacobian
 
@@ -16,7 +15,9 @@ class DictionaryJacobian(Jacobian):
     ----------
     _iter_keys : list of (vname, vname) tuples
         List of tuples of variable names that match subjacs in the this Jacobian.
-
+    _apply_plans : dict
+        Precompiled mat-vec products, keyed first on the system pathname and vector name and then
+        on the identities of the sets of variable names in the scope of the product.
     """
 
     def __init__(self, **kwargs):
@@ -31,6 +32,28 @@ class DictionaryJacobian(Jacobian):
         super(DictionaryJacobian, self).__init__(**kwargs)
 
         self._iter_keys = {}
+        self._apply_plans = {}
+
+    def _set_abs(self, abs_key, subjac):
+        """
+        Set sub-Jacobian.
+
+        Parameters
+        ----------
+        abs_key : (str, str)
+            Absolute name pair of sub-Jacobian.
+        subjac : int or float or ndarray or sparse matrix
+            sub-Jacobian as a scalar, vector, array, or AIJ list or tuple.
+        """
+        old = self._subjacs.get(abs_key)
+        super(DictionaryJacobian, self)._set_abs(abs_key, subjac)
+        new = self._subjacs[abs_key]
+
+        # The plans hold the sparse matrices built from AIJ subjacs and the keys of all others,
+        # so they only go stale when a subjac is added or an AIJ subjac is replaced.
+        if new is not old and (old is None or isinstance(old, list) or isinstance(new, list)):
+            self._iter_keys = {}
+            self._apply_plans = {}
 
     def _iter_abs_keys(self, vec_name):
         """
@@ -65,9 +88,9 @@ class DictionaryJacobian(Jacobian):
 
         return self._iter_keys[entry]
 
-    def _apply(self, d_inputs, d_outputs, d_residuals, mode):
+    def _get_apply_plan(self, d_inputs, d_outputs, d_residuals):
         """
-        Compute matrix-vector product.
+        Return the precompiled mat-vec product for the current system, vector and scope.
 
         Parameters
         ----------
@@ -77,82 +100,153 @@ class DictionaryJacobian(Jacobian):
             outputs linear vector.
         d_residuals : Vector
             residuals linear vector.
-        mode : str
-            'fwd' or 'rev'.
+
+        Returns
+        -------
+        list
+            One entry per subjac in the product, in the form (kind, res_name, other_name,
+            is_output, op), where kind is 'identity', 'aij' or 'matrix'.  For 'aij' subjacs,
+            op is [matrix, transpose, order, data] and for 'matrix' subjacs, it is the key.
         """
         # avoid circular import
         from openmdao.core.explicitcomponent import ExplicitComponent
 
-        fwd = mode == 'fwd'
         system = self._system
+        vec_name = d_residuals._name
         d_res_names = d_residuals._names
         d_out_names = d_outputs._names
         d_inp_names = d_inputs._names
+
+        # Plans are dropped when the vectors are rebuilt, which replaces their name dicts.
+        entry = (system.pathname, vec_name)
+        plans = self._apply_plans.get(entry)
+        if plans is None or plans[0] is not d_res_names:
+            plans = self._apply_plans[entry] = (d_res_names, {})
+
+        key = (id(d_out_names), id(d_inp_names))
+        try:
+            return plans[1][key][1]
+        except KeyError:
+            pass
+
+        explicit = isinstance(system, ExplicitComponent)
+        plan = []
+        for abs_key in self._iter_abs_keys(vec_name):
+            res_name, other_name = abs_key
+            if res_name not in d_res_names:
+                continue
+            if other_name in d_out_names:
+                is_output = True
+            elif other_name in d_inp_names:
+                is_output = False
+            else:
+                continue
+
+            subjac = self._subjacs[abs_key]
+            if isinstance(subjac, list):
+                # skip the matvec mult completely for identity subjacs
+                if is_output and res_name is other_name and explicit:
+                    plan.append(('identity', res_name, other_name, True, None))
+                else:
+                    plan.append(('aij', res_name, other_name, is_output,
+                                 self._get_aij_matrix(abs_key, subjac)))
+            else:  # ndarray or sparse
+                plan.append(('matrix', res_name, other_name, is_output, abs_key))
+
+        # The name sets are kept with the plan so their ids stay unique.
+        plans[1][key] = ((d_out_names, d_inp_names), plan)
+        return plan
+
+    def _get_aij_matrix(self, abs_key, subjac):
+        """
+        Convert a subjac in AIJ form into a CSR matrix and its transpose.
+
+        Duplicate (row, col) entries are kept as they are; they are summed by the products.
+
+        Parameters
+        ----------
+        abs_key : (str, str)
+            Absolute name pair of sub-Jacobian.
+        subjac : list
+            The sub-Jacobian as [data, rows, cols].
+
+        Returns
+        -------
+        list
+            [matrix, transpose, order, data], where order maps the CSR entries to the AIJ
+            entries, or is None if they are in the same order, in which case the matrix shares
+            its data with the subjac.
+        """
+        data, rows, cols = subjac
+        shape = self._subjacs_info[abs_key][1]
+
+        order = np.argsort(rows, kind='mergesort')
+        if np.all(order == np.arange(order.size)):
+            order = None
+            csr_data = data
+        else:
+            csr_data = data[order]
+            rows = rows[order]
+            cols = cols[order]
+
+        indptr = np.zeros(shape[0] + 1, dtype=int)
+        np.cumsum(np.bincount(rows, minlength=shape[0]), out=indptr[1:])
+
+        mtx = csr_matrix((csr_data, cols, indptr), shape=shape, copy=False)
+        if order is None and mtx.data is not data:
+            order = np.arange(data.size)
+
+        return [mtx, mtx.T, order, data]
+
+    def _apply(self, d_inputs, d_outputs, d_residuals, mode):
+        """
+        Compute matrix-vector product.
+
+        Parameters
+        ----------
+        d_inputs : Vector
+            inputs linear vector.
+        d_outputs : Vector
+            outputs linear vector.
+        d_residuals : Vector
+            residuals linear vector.
+        mode : str
+            'fwd' or 'rev'.
+        """
+        fwd = mode == 'fwd'
+        system = self._system
+        subjacs = self._subjacs
         res_flat_views = d_residuals._views_flat
         out_flat_views = d_outputs._views_flat
         inp_flat_views = d_inputs._views_flat
-        np_add_at = np.add.at
+
+        plan = self._get_apply_plan(d_inputs, d_outputs, d_residuals)
 
         with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
-            ncol = d_residuals._ncol
-            for abs_key in self._iter_abs_keys(d_residuals._name):
-                subjac = self._subjacs[abs_key]
-                res_name, other_name = abs_key
-                if res_name in d_res_names:
-                    if isinstance(subjac, list):
-                        if other_name in d_out_names:
-                            re = res_flat_views[res_name]
-                            op = out_flat_views[other_name]
-                            # skip the matvec mult completely for identity subjacs
-                            if res_name is other_name and isinstance(system, ExplicitComponent):
-                                if fwd:
-                                    re += op
-                                else:
-                                    op += re
-                            elif fwd:
-                                if ncol > 1:
-                                    for i in range(ncol):
-                                        np_add_at(re[:, i], subjac[1],
-                                                  op[:, i][subjac[2]] * subjac[0])
-                                else:
-                                    np_add_at(re, subjac[1], op[subjac[2]] * subjac[0])
-                            else:  # rev
-                                if ncol > 1:
-                                    for i in range(ncol):
-                                        np_add_at(op[:, i], subjac[2],
-                                                  re[:, i][subjac[1]] * subjac[0])
-                                else:
-                                    np_add_at(op, subjac[2], re[subjac[1]] * subjac[0])
-                        elif other_name in d_inp_names:
-                            re = res_flat_views[res_name]
-                            ip = inp_flat_views[other_name]
-                            if fwd:
-                                if ncol > 1:
-                                    for i in range(ncol):
-                                        np_add_at(re[:, i], subjac[1],
-                                                  ip[:, i][subjac[2]] * subjac[0])
-                                else:
-                                    np_add_at(re, subjac[1], ip[subjac[2]] * subjac[0])
-                            else:  # rev
-                                if ncol > 1:
-                                    for i in range(ncol):
-                                        np_add_at(ip[:, i], subjac[2],
-                                                  re[:, i][subjac[1]] * subjac[0])
-                                else:
-                                    np_add_at(ip, subjac[2], re[subjac[1]] * subjac[0])
-                    else:  # ndarray or sparse
-                        if other_name in d_out_names:
-                            re = res_flat_views[res_name]
-                            op = out_flat_views[other_name]
-                            if fwd:
-                                re += subjac.dot(op)
-                            else:  # rev
-                                op += subjac.T.dot(re)
-
-                        elif other_name in d_inp_names:
-                            re = res_flat_views[res_name]
-                            ip = inp_flat_views[other_name]
-                            if fwd:
-                                re += subjac.dot(ip)
-                            else:  # rev
-                                ip += subjac.T.dot(re)
+            for kind, res_name, other_name, is_output, op in plan:
+                re = res_flat_views[res_name]
+                if is_output:
+                    other = out_flat_views[other_name]
+                else:
+                    other = inp_flat_views[other_name]
+
+                if kind == 'identity':
+                    if fwd:
+                        re += other
+                    else:
+                        other += re
+                elif kind == 'aij':
+                    mtx, mtx_T, order, data = op
+                    if order is not None:
+                        # the CSR entries are a permutation of the AIJ values
+                        np.take(data, order, out=mtx.data)
+                    if fwd:
+                        re += mtx.dot(other)
+                    else:  # rev
+                        other += mtx_T.dot(re)
+                else:  # ndarray or sparse
+                    subjac = subjacs[op]
+                    if fwd:
+                        re += subjac.dot(other)
+                    else:  # rev
+                        other += subjac.T.dot(re)
@@ -460,6 +460,43 @@ class TestJacobian(unittest.TestCase):
         # Make sure we don't get a size mismatch.
         derivs = prob.compute_totals(of=of, wrt=wrt)
 
+    @parameterized.expand(itertools.product([DenseJacobian, CSRJacobian, CSCJacobian,
+                                             COOJacobian], ['fwd', 'rev']),
+                          testcase_func_name=lambda f, n, p:
+                          'test_subset_ext_mat_' + p.args[0].__name__ + '_' + p.args[1])
+    def test_subset_ext_mat(self, jac_class, mode):
+        # The subgroup jacobians see inputs that are connected from outside, and the block
+        # solvers above only apply them to a subset of those inputs at a time.
+        def build(jac_class):
+            prob = Problem()
+            model = prob.model
+
+            model.add_subsystem('px', IndepVarComp('x', 1.0), promotes=['x'])
+            model.add_subsystem('pz', IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+            sup = model.add_subsystem('sup', Group(), promotes=['*'])
+            sub1 = sup.add_subsystem('sub1', Group(), promotes=['*'])
+            sub2 = sup.add_subsystem('sub2', Group(), promotes=['*'])
+            sub1.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['*'])
+            sub2.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['*'])
+
+            model.linear_solver = LinearBlockGS()
+            sup.linear_solver = LinearBlockGS(maxiter=50, atol=1e-12, rtol=1e-12)
+
+            if jac_class is not None:
+                sub1.jacobian = jac_class()
+                sub2.jacobian = jac_class()
+
+            prob.set_solver_print(level=0)
+            prob.setup(check=False, mode=mode)
+            prob.run_model()
+            return prob.compute_totals(of=['y1', 'y2'], wrt=['x', 'z'])
+
+        expected = build(None)
+        derivs = build(jac_class)
+
+        for key, val in expected.items():
+            assert_rel_error(self, derivs[key], val, 1e-8)
+
     def test_assembled_jac_bad_key(self):
         # this test fails if AssembledJacobian._update sets in_start with 'output' instead of 'input'
         prob = Problem()
@@ -778,5 +815,44 @@ class TestJacobian(unittest.TestCase):
         with assertRaisesRegex(self, KeyError, msg.format('y', 'x')):
             J = prob.compute_totals(of=['comp.y'], wrt=['p.x'])
 
+    @parameterized.expand(itertools.product(['fwd', 'rev'], [False, True]),
+                          testcase_func_name=lambda f, n, p:
+                          'test_aij_subjac_' + '_'.join(str(a) for a in p.args))
+    def test_aij_subjac(self, mode, vectorize):
+        # unsorted rows with a duplicate entry, and values that change with the inputs
+        rows = np.array([2, 0, 1, 0, 2, 0])
+        cols = np.array([1, 0, 3, 2, 1, 3])
+
+        class AIJComp(ExplicitComponent):
+            def setup(self):
+                self.add_input('x', val=np.ones(4))
+                self.add_output('y', val=np.zeros(3))
+                self.declare_partials('y', 'x', rows=rows, cols=cols)
+
+            def compute(self, inputs, outputs):
+                outputs['y'] = 0.0
+
+            def compute_partials(self, inputs, partials):
+                partials['y', 'x'] = inputs['x'][cols] * np.arange(1.0, 7.0)
+
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('p', IndepVarComp('x', val=np.ones(4)))
+        model.add_subsystem('comp', AIJComp())
+        model.connect('p.x', 'comp.x')
+        model.add_design_var('p.x', vectorize_derivs=vectorize)
+        model.add_constraint('comp.y', lower=0.0, vectorize_derivs=vectorize)
+        prob.setup(check=False, mode=mode)
+
+        for x in (np.ones(4), np.array([2.0, -1.0, 3.0, 0.5])):
+            prob['p.x'] = x
+            prob.run_model()
+
+            expected = np.zeros((3, 4))
+            np.add.at(expected, (rows, cols), x[cols] * np.arange(1.0, 7.0))
+
+            J = prob.driver._compute_totals(of=['comp.y'], wrt=['p.x'], return_format='dict')
+            assert_rel_error(self, J['comp.y']['p.x'], expected, 1e-15)
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,13 +1,16 @@
 """Management of iteration stack for recording."""
+import threading
+
 from openmdao.utils.mpi import MPI
 
 
-class _RecIteration(object):
+class _RecIteration(threading.local):
     """
     A class that encapsulates the iteration stack.
 
     Some tests needed to reset the stack and this avoids issues
-    with data left over from other tests.
+    with data left over from other tests.  Each thread has its own stack, so that subsystems
+    run on a thread pool keep separate iteration coordinates.
 
     Attributes
     ----------
@@ -4,14 +4,19 @@ Definition of the SqliteCaseReader.
 from __future__ import print_function, absolute_import
 
 import sqlite3
+from collections import OrderedDict
+
+import numpy as np
 
 from openmdao.recorders.base_case_reader import BaseCaseReader
 from openmdao.recorders.case import DriverCase, SystemCase, SolverCase
 from openmdao.recorders.cases import BaseCases
-from openmdao.recorders.sqlite_recorder import blob_to_array
+from openmdao.recorders.sqlite_recorder import blob_to_array, BlobCodec
 from openmdao.utils.record_util import is_valid_sqlite3_db
 
-from six import PY2, PY3
+from six.moves import range
+
+from six import PY2, PY3, iteritems
 
 if PY2:
     import cPickle as pickle
@@ -36,6 +41,8 @@ class SqliteCaseReader(BaseCaseReader):
         Dictionary mapping absolute names to promoted names.
     _prom2abs : {'input': dict, 'output': dict}
         Dictionary mapping promoted names to absolute names.
+    _con : sqlite3.Connection
+        Connection to the database, kept open for the lifetime of the reader.
     """
 
     def __init__(self, filename):
@@ -54,21 +61,21 @@ class SqliteCaseReader(BaseCaseReader):
                 raise IOError('File does not contain a valid '
                               'sqlite database ({0})'.format(filename))
 
-        with sqlite3.connect(self.filename) as con:
-            cur = con.cursor()
-            cur.execute("SELECT format_version, abs2prom, prom2abs FROM metadata")
-            row = cur.fetchone()
-            self.format_version = row[0]
-            self._abs2prom = None
-            self._prom2abs = None
+        self._con = sqlite3.connect(self.filename)
 
-            if PY2:
-                self._abs2prom = pickle.loads(str(row[1])) if row[1] is not None else None
-                self._prom2abs = pickle.loads(str(row[2])) if row[2] is not None else None
-            if PY3:
-                self._abs2prom = pickle.loads(row[1]) if row[1] is not None else None
-                self._prom2abs = pickle.loads(row[2]) if row[2] is not None else None
-        con.close()
+        cur = self._con.cursor()
+        cur.execute("SELECT format_version, abs2prom, prom2abs FROM metadata")
+        row = cur.fetchone()
+        self.format_version = row[0]
+        self._abs2prom = None
+        self._prom2abs = None
+
+        if PY2:
+            self._abs2prom = pickle.loads(str(row[1])) if row[1] is not None else None
+            self._prom2abs = pickle.loads(str(row[2])) if row[2] is not None else None
+        if PY3:
+            self._abs2prom = pickle.loads(row[1]) if row[1] is not None else None
+            self._prom2abs = pickle.loads(row[2]) if row[2] is not None else None
 
         self._load()
 
@@ -80,78 +87,268 @@ class SqliteCaseReader(BaseCaseReader):
         `format_version`, `parameters`, and `unknowns` attributes of this
         CaseReader.
 
-        The `iterations` table is read to load the keys which identify
-        the individual cases/iterations from the recorded file.
+        Only the number of cases in each of the iteration tables is read here. The
+        iteration coordinates and the cases themselves are read on demand.
         """
-        self.driver_cases = DriverCases(self.filename)
-        self.system_cases = SystemCases(self.filename)
-        self.solver_cases = SolverCases(self.filename)
+        self.driver_cases = DriverCases(self.filename, self._con)
+        self.system_cases = SystemCases(self.filename, self._con)
+        self.solver_cases = SolverCases(self.filename, self._con)
 
         self.driver_cases._prom2abs = self._prom2abs
         self.system_cases._prom2abs = self._prom2abs
         self.solver_cases._prom2abs = self._prom2abs
 
-        if self.format_version in (1,):
-            with sqlite3.connect(self.filename) as con:
-
-                # Read in iterations from Drivers, Systems, and Solvers
-                cur = con.cursor()
-                cur.execute("SELECT iteration_coordinate FROM driver_iterations")
-                rows = cur.fetchall()
-                self.driver_cases._case_keys = [coord[0] for coord in rows]
-                self.driver_cases.num_cases = len(self.driver_cases._case_keys)
-
-                cur.execute("SELECT iteration_coordinate FROM system_iterations")
-                rows = cur.fetchall()
-                self.system_cases._case_keys = [coord[0] for coord in rows]
-                self.system_cases.num_cases = len(self.system_cases._case_keys)
-
-                cur.execute("SELECT iteration_coordinate FROM solver_iterations")
-                rows = cur.fetchall()
-                self.solver_cases._case_keys = [coord[0] for coord in rows]
-                self.solver_cases.num_cases = len(self.solver_cases._case_keys)
-
-                # Read in metadata for Drivers, Systems, and Solvers
-                cur.execute("SELECT model_viewer_data FROM driver_metadata")
-                for row in cur:
-                    if PY2:
-                        self.driver_metadata = pickle.loads(str(row[0]))
-                    if PY3:
-                        self.driver_metadata = pickle.loads(row[0])
-
-                cur.execute("SELECT id, scaling_factors FROM system_metadata")
-                for row in cur:
-                    id = row[0]
-                    self.system_metadata[id] = {}
-
-                    if PY2:
-                        self.system_metadata[id]['scaling_factors'] = pickle.loads(str(row[1]))
-                    if PY3:
-                        self.system_metadata[id]['scaling_factors'] = pickle.loads(row[1])
-
-                cur.execute("SELECT id, solver_options, solver_class FROM solver_metadata")
-                for row in cur:
-                    id = row[0]
-                    if PY2:
-                        solver_options = pickle.loads(str(row[1]))
-                    if PY3:
-                        solver_options = pickle.loads(row[1])
-                    solver_class = row[2]
-                    self.solver_metadata[id] = {
-                        'solver_options': solver_options,
-                        'solver_class': solver_class,
-                    }
-            con.close()
+        if self.format_version in (1, 2):
+            # Files written before the iteration coordinates were indexed are never modified
+            # here; their cases are looked up by identifier through a mapping built in memory.
+            cur = self._con.execute("SELECT name FROM sqlite_master WHERE type='index'")
+            indices = set(row[0] for row in cur)
+            for cases in (self.driver_cases, self.system_cases, self.solver_cases):
+                if '{}_coord_ind'.format(cases._table) not in indices:
+                    cases._coord_ids = {}
+
+            if self.format_version == 1:
+                # values were saved with np.save
+                decode = blob_to_array
+            else:
+                decode = BlobCodec(self._con).decode
+
+            for cases in (self.driver_cases, self.system_cases, self.solver_cases):
+                cases._blob_to_array = decode
+
+            self.update()
+
+            # Read in metadata for Drivers, Systems, and Solvers
+            cur = self._con.cursor()
+            cur.execute("SELECT model_viewer_data FROM driver_metadata")
+            for row in cur:
+                if PY2:
+                    self.driver_metadata = pickle.loads(str(row[0]))
+                if PY3:
+                    self.driver_metadata = pickle.loads(row[0])
+
+            cur.execute("SELECT id, scaling_factors FROM system_metadata")
+            for row in cur:
+                id = row[0]
+                self.system_metadata[id] = {}
+
+                if PY2:
+                    self.system_metadata[id]['scaling_factors'] = pickle.loads(str(row[1]))
+                if PY3:
+                    self.system_metadata[id]['scaling_factors'] = pickle.loads(row[1])
+
+            cur.execute("SELECT id, solver_options, solver_class FROM solver_metadata")
+            for row in cur:
+                id = row[0]
+                if PY2:
+                    solver_options = pickle.loads(str(row[1]))
+                if PY3:
+                    solver_options = pickle.loads(row[1])
+                solver_class = row[2]
+                self.solver_metadata[id] = {
+                    'solver_options': solver_options,
+                    'solver_class': solver_class,
+                }
         else:
             raise ValueError('SQliteCaseReader encountered an unhandled '
                              'format version: {0}'.format(self.format_version))
 
+    def update(self):
+        """
+        Pick up any cases that have been recorded since the file was last read.
+
+        This allows a file that is still being written to be followed while the recording
+        is in progress.
+        """
+        self.driver_cases.update()
+        self.system_cases.update()
+        self.solver_cases.update()
+
+    def close(self):
+        """
+        Close the connection to the database file.
+        """
+        self._con.close()
+
 
-class DriverCases(BaseCases):
+class SqliteCases(BaseCases):
     """
-    Case specific to the entries that might be recorded in a Driver iteration.
+    Cases read from one of the iteration tables of a file created with SqliteRecorder.
+
+    Cases are numbered in the order they were recorded, which is also the order of the
+    integer primary key of the table. While the keys run from 1 to the number of cases, a
+    case can be read by index without first reading the identifiers of all of the cases;
+    otherwise the keys are read once to map indices to rows.
+
+    Attributes
+    ----------
+    _con : sqlite3.Connection
+        Connection to the database, shared with the owning reader.
+    _prom2abs : {'input': dict, 'output': dict}
+        Dictionary mapping promoted names to absolute names.
+    _history_vars : dict
+        Mapping of (category, absolute name) to the id and shape of each variable whose history
+        was recorded, loaded on demand.
+    _blob_to_array : function
+        Function that converts the blobs of the file to arrays, which depends on the format
+        version of the file.
+    _delta_bases : dict
+        Mapping of the id of each case stored as a delta to the id of the case it applies to.
+    _deltas_read_to : int
+        Id of the last case for which it is known whether it was stored as a delta.
+    _full_arrays : OrderedDict
+        The most recently rebuilt arrays of cases involved in deltas, keyed by case id.
+    _max_id : int
+        Largest primary key in the table as of the last update.
+    _row_ids : list of int
+        Primary keys of the rows in order, read only if the keys have gaps.
+    _keys_read_to : int
+        Primary key of the last case whose identifier is in _case_keys.
+    _coord_ids : dict or None
+        Mapping of iteration coordinate to primary key, used in place of an index on the
+        iteration coordinates for files recorded without one. None if the file has the index.
+    _coords_read_to : int
+        Primary key of the last case whose identifier is in _coord_ids.
     """
 
+    _table = None
+    _categories = ()
+    _blob_start = 6
+
+    def __init__(self, filename, con):
+        """
+        Initialize.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the recording file from which to instantiate the case reader.
+        con : sqlite3.Connection
+            Connection to the recording file.
+        """
+        super(SqliteCases, self).__init__(filename)
+        self._case_keys = []
+        self._con = con
+        self._prom2abs = None
+        self._history_vars = {}
+        self._blob_to_array = blob_to_array
+        self._delta_bases = {}
+        self._deltas_read_to = 0
+        self._full_arrays = OrderedDict()
+        self._max_id = 0
+        self._row_ids = []
+        self._keys_read_to = 0
+        self._coord_ids = None
+        self._coords_read_to = 0
+
+    def update(self):
+        """
+        Update the number of cases to include any recorded since the last update.
+        """
+        cur = self._con.execute("SELECT COUNT(*), MAX(id) FROM {}".format(self._table))
+        num_cases, max_id = cur.fetchone()
+        self.num_cases = num_cases
+        self._max_id = max_id or 0
+
+    def list_cases(self):
+        """
+        Return the case string identifiers available in this instance of the CaseReader.
+
+        The identifiers are read from the file the first time they are requested, after which
+        only those of newly recorded cases are read.
+
+        Returns
+        -------
+        _case_keys : list
+            The case string identifiers.
+        """
+        if self._keys_read_to < self._max_id:
+            cur = self._con.execute("SELECT id, iteration_coordinate FROM {} WHERE id > ? AND "
+                                    "id <= ? ORDER BY id".format(self._table),
+                                    (self._keys_read_to, self._max_id))
+            self._case_keys.extend(row[1] for row in cur)
+            self._keys_read_to = self._max_id
+
+        return self._case_keys
+
+    def get_iteration_coordinate(self, case_id):
+        """
+        Return the iteration coordinate.
+
+        Parameters
+        ----------
+        case_id : int or str
+            The case number that we want the iteration coordinate for.
+
+        Returns
+        -------
+        iteration_coordinate : str
+            The iteration coordinate.
+        """
+        if not isinstance(case_id, int):
+            return case_id
+
+        cur = self._con.execute("SELECT iteration_coordinate FROM {} WHERE id=?"
+                                .format(self._table), (self._get_row_id(case_id),))
+        return cur.fetchone()[0]
+
+    def _get_row_id(self, index):
+        """
+        Return the primary key of the row holding the case with the given index.
+
+        Parameters
+        ----------
+        index : int
+            The index of the case, which may be negative.
+
+        Returns
+        -------
+        int
+            The primary key of the row.
+        """
+        if index < 0:
+            index += self.num_cases
+        if index < 0 or index >= self.num_cases:
+            raise IndexError("Case index out of range for {} cases.".format(self.num_cases))
+
+        if self.num_cases == self._max_id:
+            # the keys run from 1 to the number of cases
+            return index + 1
+
+        row_ids = self._row_ids
+        if len(row_ids) < self.num_cases:
+            last = row_ids[-1] if row_ids else 0
+            cur = self._con.execute("SELECT id FROM {} WHERE id > ? AND id <= ? ORDER BY id"
+                                    .format(self._table), (last, self._max_id))
+            row_ids.extend(row[0] for row in cur)
+        return row_ids[index]
+
+    def _get_coord_row_id(self, coord):
+        """
+        Return the primary key of the first case with the given iteration coordinate.
+
+        This is only used for files that have no index on the iteration coordinates.
+
+        Parameters
+        ----------
+        coord : str
+            The iteration coordinate of the case.
+
+        Returns
+        -------
+        int or None
+            The primary key of the row, or None if there is no such case.
+        """
+        coord_ids = self._coord_ids
+        if coord not in coord_ids and self._coords_read_to < self._max_id:
+            cur = self._con.execute("SELECT id, iteration_coordinate FROM {} WHERE id > ? AND "
+                                    "id <= ? ORDER BY id".format(self._table),
+                                    (self._coords_read_to, self._max_id))
+            for row_id, row_coord in cur:
+                coord_ids.setdefault(row_coord, row_id)
+            self._coords_read_to = self._max_id
+        return coord_ids.get(coord)
+
     def get_case(self, case_id):
         """
         Get a case from the database.
@@ -163,28 +360,346 @@ class DriverCases(BaseCases):
 
         Returns
         -------
-            An instance of a Driver Case populated with data from the
-            specified case/iteration.
+            An instance of a Case populated with data from the specified case/iteration.
+        """
+        if isinstance(case_id, int):
+            cur = self._con.execute("SELECT * FROM {} WHERE id=?".format(self._table),
+                                    (self._get_row_id(case_id),))
+        elif self._coord_ids is not None:
+            cur = self._con.execute("SELECT * FROM {} WHERE id=?".format(self._table),
+                                    (self._get_coord_row_id(case_id),))
+        else:
+            cur = self._con.execute("SELECT * FROM {} WHERE iteration_coordinate=?"
+                                    .format(self._table), (case_id,))
+        row = cur.fetchone()
+        if row is None:
+            raise KeyError("No case found with iteration coordinate '{}'.".format(case_id))
+
+        return self._make_case(row)
+
+    def get_cases(self, case_ids):
+        """
+        Get several cases from the database, reading them in as few queries as possible.
+
+        Parameters
+        ----------
+        case_ids : slice or iterable of int or str
+            The integer indices or string-identifiers of the cases to be retrieved.
+
+        Returns
+        -------
+        list
+            The requested cases, in the order they were requested.
+        """
+        if isinstance(case_ids, slice):
+            case_ids = range(*case_ids.indices(self.num_cases))
+
+        keys = []
+        row_ids = []
+        coords = []
+        for case_id in case_ids:
+            if isinstance(case_id, int):
+                key = self._get_row_id(case_id)
+                row_ids.append(key)
+            else:
+                key = case_id
+                coords.append(key)
+            keys.append(key)
+
+        rows = {}
+        if row_ids:
+            lo = min(row_ids)
+            hi = max(row_ids)
+            if hi - lo < 2 * len(row_ids):
+                # The rows are close together, so read the whole span in one pass.
+                cur = self._con.execute("SELECT * FROM {} WHERE id BETWEEN ? AND ?"
+                                        .format(self._table), (lo, hi))
+                rows.update((row[0], row) for row in cur)
+            else:
+                self._fetch_rows('id', row_ids, 0, rows)
+        if coords:
+            if self._coord_ids is not None:
+                coord_ids = {}
+                for coord in coords:
+                    row_id = self._get_coord_row_id(coord)
+                    if row_id is not None:
+                        coord_ids[coord] = row_id
+                id_rows = {}
+                self._fetch_rows('id', list(set(coord_ids.values())), 0, id_rows)
+                rows.update((coord, id_rows[row_id]) for coord, row_id in iteritems(coord_ids))
+            else:
+                self._fetch_rows('iteration_coordinate', coords, 2, rows)
+
+        cases = []
+        for key in keys:
+            if key not in rows:
+                raise KeyError("No case found with iteration coordinate '{}'.".format(key))
+            cases.append(self._make_case(rows[key]))
+
+        return cases
+
+    def _fetch_rows(self, column, values, col_idx, rows):
+        """
+        Read the rows whose given column matches any of the given values.
+
+        Parameters
+        ----------
+        column : str
+            Name of the column to match.
+        values : list
+            The values to look for.
+        col_idx : int
+            Index of the column in the row, used to key the returned rows.
+        rows : dict
+            Dictionary into which the rows are placed.
+        """
+        # Stay below the default sqlite limit on the number of bound parameters.
+        chunk = 500
+        for i in range(0, len(values), chunk):
+            sub = values[i:i + chunk]
+            cur = self._con.execute("SELECT * FROM {} WHERE {} IN ({})".format(
+                                    self._table, column, ','.join('?' * len(sub))), sub)
+            rows.update((row[col_idx], row) for row in cur)
+
+    def get_var_history(self, *names, **kwargs):
+        """
+        Get the values of variables across all of the cases in which they were recorded.
+
+        This requires the cases to have been recorded by a SqliteRecorder created with
+        `record_var_history=True`. Only the values of the requested variables are read.
+
+        Parameters
+        ----------
+        *names : str
+            Promoted or absolute names of the variables.
+        **kwargs : dict
+            The only accepted keyword is 'category', the part of the cases from which to take
+            the variables (for example 'outputs' or 'residuals'). By default, the first part of
+            the cases that contains each variable is used.
+
+        Returns
+        -------
+        dict
+            Mapping of each name to an array holding the values of that variable, stacked along
+            the first axis in the order in which the cases were recorded.
+        """
+        category = kwargs.pop('category', None)
+        if kwargs:
+            raise TypeError("get_var_history() got unexpected keyword arguments: {}"
+                            .format(sorted(kwargs)))
+
+        if category is None:
+            categories = self._categories
+        elif category in self._categories:
+            categories = (category,)
+        else:
+            raise ValueError("'{}' is not a valid category. Must be one of {}."
+                             .format(category, self._categories))
+
+        history = {}
+        for name in names:
+            abs_names = [name]
+            if self._prom2abs is not None:
+                abs_names.extend(self._prom2abs['output'].get(name, ()))
+                abs_names.extend(self._prom2abs['input'].get(name, ()))
+
+            info = self._find_history_var(abs_names, categories)
+            if info is None:
+                # the variable may have been recorded since its ids were last read
+                self._load_history_vars()
+                info = self._find_history_var(abs_names, categories)
+                if info is None:
+                    raise KeyError("No history was recorded for '{}'.".format(name))
+
+            var_id, shape = info
+            cur = self._con.execute("SELECT value FROM var_history WHERE var_id=? AND "
+                                    "case_id<=? ORDER BY case_id", (var_id, self._max_id))
+            blobs = [row[0] for row in cur]
+            if PY2:
+                blobs = [str(blob) for blob in blobs]
+
+            history[name] = np.frombuffer(bytearray().join(blobs)).reshape((len(blobs),) + shape)
+
+        return history
+
+    def _find_history_var(self, abs_names, categories):
+        """
+        Find the first of the given variables recorded in one of the given categories.
+
+        Parameters
+        ----------
+        abs_names : list of str
+            Candidate names of the variable.
+        categories : tuple of str
+            Categories to search, in order.
+
+        Returns
+        -------
+        tuple or None
+            The id and shape of the variable, or None if it was not found.
+        """
+        for category in categories:
+            for abs_name in abs_names:
+                info = self._history_vars.get((category, abs_name))
+                if info is not None:
+                    return info
+
+    def _load_history_vars(self):
+        """
+        Read the ids and shapes of the variables whose history was recorded.
+        """
+        try:
+            cur = self._con.execute("SELECT id, category, name, shape FROM var_history_names "
+                                    "WHERE case_table=?", (self._table,))
+        except sqlite3.OperationalError:
+            # recorded by a version that did not store variable histories
+            return
+
+        for var_id, category, name, shape in cur:
+            if PY2:
+                shape = str(shape)
+            self._history_vars[category, name] = (var_id, pickle.loads(shape))
+
+    def _row_arrays(self, row):
+        """
+        Convert the blobs of a row of the iterations table to arrays of values.
+
+        If the case was recorded as a delta, the arrays of the full case are rebuilt from the
+        cases before it.
+
+        Parameters
+        ----------
+        row : tuple
+            A row of the iterations table.
+
+        Returns
+        -------
+        list of ndarray
+            The arrays of values of each part of the case.
+        """
+        arrays = [self._blob_to_array(blob) for blob in row[self._blob_start:]]
+
+        row_id = row[0]
+        base_id = self._get_delta_base(row_id)
+        if base_id is None:
+            return arrays
+
+        # walk back to the last full case, or to a case that was already rebuilt
+        chain = []
+        while base_id is not None and base_id not in self._full_arrays:
+            chain.append(base_id)
+            base_id = self._get_delta_base(base_id)
+
+        if base_id is None:
+            base_id = chain.pop()
+            cur = self._con.execute("SELECT * FROM {} WHERE id=?".format(self._table),
+                                    (base_id,))
+            full = [self._blob_to_array(blob) for blob in cur.fetchone()[self._blob_start:]]
+        else:
+            full = self._full_arrays[base_id]
+
+        if chain:
+            cur = self._con.execute("SELECT * FROM {} WHERE id IN ({})".format(
+                                    self._table, ','.join('?' * len(chain))), chain)
+            rows = {r[0]: r for r in cur}
+            for delta_id in reversed(chain):
+                full = [_apply_delta(base, self._blob_to_array(blob))
+                        for base, blob in zip(full, rows[delta_id][self._blob_start:])]
+                self._cache_full_arrays(delta_id, full)
+
+        full = [_apply_delta(base, delta) for base, delta in zip(full, arrays)]
+        self._cache_full_arrays(row_id, full)
+
+        # the cached arrays are used to rebuild other cases, so they must not be changed
+        return [array.copy() for array in full]
+
+    def _get_delta_base(self, row_id):
+        """
+        Return the id of the case that the case with the given id is a delta of.
+
+        Parameters
+        ----------
+        row_id : int
+            The id of the case.
+
+        Returns
+        -------
+        int or None
+            The id of the base case, or None if the case was stored in full.
+        """
+        if row_id > self._deltas_read_to:
+            read_to = max(row_id, self._max_id)
+            try:
+                cur = self._con.execute("SELECT id, base_id FROM iteration_deltas WHERE "
+                                        "case_table=? AND id>? AND id<=?",
+                                        (self._table, self._deltas_read_to, read_to))
+            except sqlite3.OperationalError:
+                # recorded by a version that did not store deltas
+                cur = ()
+            self._delta_bases.update(cur)
+            self._deltas_read_to = read_to
+
+        return self._delta_bases.get(row_id)
+
+    def _cache_full_arrays(self, row_id, arrays):
+        """
+        Keep the rebuilt arrays of a case, to rebuild the cases that follow it.
+
+        Parameters
+        ----------
+        row_id : int
+            The id of the case.
+        arrays : list of ndarray
+            The full arrays of values of each part of the case.
         """
-        iteration_coordinate = self.get_iteration_coordinate(case_id)
+        cache = self._full_arrays
+        cache[row_id] = arrays
+        if len(cache) > 100:
+            cache.popitem(last=False)
+
+    def _make_case(self, row):
+        """
+        Create a case from a row of the iterations table.
+
+        Parameters
+        ----------
+        row : tuple
+            A row of the iterations table.
+
+        Returns
+        -------
+            An instance of a Case populated with data from the row.
+        """
+        raise NotImplementedError()
 
-        with sqlite3.connect(self.filename) as con:
-            cur = con.cursor()
-            cur.execute("SELECT * FROM driver_iterations WHERE "
-                        "iteration_coordinate=:iteration_coordinate",
-                        {"iteration_coordinate": iteration_coordinate})
-            # Initialize the Case object from the iterations data
-            row = cur.fetchone()
-        con.close()
 
+class DriverCases(SqliteCases):
+    """
+    Case specific to the entries that might be recorded in a Driver iteration.
+    """
+
+    _table = 'driver_iterations'
+    _categories = ('desvars', 'responses', 'objectives', 'constraints', 'sysincludes')
+
+    def _make_case(self, row):
+        """
+        Create a case from a row of the driver iterations table.
+
+        Parameters
+        ----------
+        row : tuple
+            A row of the driver iterations table.
+
+        Returns
+        -------
+            An instance of a Driver Case populated with data from the
+            specified case/iteration.
+        """
         idx, counter, iteration_coordinate, timestamp, success, msg, desvars_blob, responses_blob, \
             objectives_blob, constraints_blob, sysincludes_blob = row
 
-        desvars_array = blob_to_array(desvars_blob)
-        responses_array = blob_to_array(responses_blob)
-        objectives_array = blob_to_array(objectives_blob)
-        constraints_array = blob_to_array(constraints_blob)
-        sysincludes_array = blob_to_array(sysincludes_blob)
+        desvars_array, responses_array, objectives_array, constraints_array, \
+            sysincludes_array = self._row_arrays(row)
 
         case = DriverCase(self.filename, counter, iteration_coordinate, timestamp, success, msg,
                           desvars_array, responses_array, objectives_array, constraints_array,
@@ -193,43 +708,33 @@ class DriverCases(BaseCases):
         return case
 
 
-class SystemCases(BaseCases):
+class SystemCases(SqliteCases):
     """
     Case specific to the entries that might be recorded in a System iteration.
     """
 
-    def get_case(self, case_id):
+    _table = 'system_iterations'
+    _categories = ('outputs', 'inputs', 'residuals')
+
+    def _make_case(self, row):
         """
-        Get a case from the database.
+        Create a case from a row of the system iterations table.
 
         Parameters
         ----------
-        case_id : int or str
-            The integer index or string-identifier of the case to be retrieved.
+        row : tuple
+            A row of the system iterations table.
 
         Returns
         -------
             An instance of a System Case populated with data from the
             specified case/iteration.
         """
-        iteration_coordinate = self.get_iteration_coordinate(case_id)
-
-        with sqlite3.connect(self.filename) as con:
-            cur = con.cursor()
-            cur.execute("SELECT * FROM system_iterations WHERE "
-                        "iteration_coordinate=:iteration_coordinate",
-                        {"iteration_coordinate": iteration_coordinate})
-            # Initialize the Case object from the iterations data
-            row = cur.fetchone()
-        con.close()
-
         # inputs , outputs , residuals
         idx, counter, iteration_coordinate, timestamp, success, msg, inputs_blob,\
             outputs_blob, residuals_blob = row
 
-        inputs_array = blob_to_array(inputs_blob)
-        outputs_array = blob_to_array(outputs_blob)
-        residuals_array = blob_to_array(residuals_blob)
+        inputs_array, outputs_array, residuals_array = self._row_arrays(row)
 
         case = SystemCase(self.filename, counter, iteration_coordinate, timestamp, success, msg,
                           inputs_array, outputs_array, residuals_array, self._prom2abs)
@@ -237,43 +742,60 @@ class SystemCases(BaseCases):
         return case
 
 
-class SolverCases(BaseCases):
+class SolverCases(SqliteCases):
     """
     Case specific to the entries that might be recorded in a Solver iteration.
     """
 
-    def get_case(self, case_id):
+    _table = 'solver_iterations'
+    _categories = ('outputs', 'residuals')
+    _blob_start = 8
+
+    def _make_case(self, row):
         """
-        Get a case from the database.
+        Create a case from a row of the solver iterations table.
 
         Parameters
         ----------
-        case_id : int or str
-            The integer index or string-identifier of the case to be retrieved.
+        row : tuple
+            A row of the solver iterations table.
 
         Returns
         -------
             An instance of a solver Case populated with data from the
             specified case/iteration.
         """
-        iteration_coordinate = self.get_iteration_coordinate(case_id)
-
-        with sqlite3.connect(self.filename) as con:
-            cur = con.cursor()
-            cur.execute("SELECT * FROM solver_iterations WHERE "
-                        "iteration_coordinate=:iteration_coordinate",
-                        {"iteration_coordinate": iteration_coordinate})
-            # Initialize the Case object from the iterations data
-            row = cur.fetchone()
-        con.close()
-
         idx, counter, iteration_coordinate, timestamp, success, msg, abs_err, rel_err, \
             output_blob, residuals_blob = row
 
-        output_array = blob_to_array(output_blob)
-        residuals_array = blob_to_array(residuals_blob)
+        output_array, residuals_array = self._row_arrays(row)
 
         case = SolverCase(self.filename, counter, iteration_coordinate, timestamp, success, msg,
                           abs_err, rel_err, output_array, residuals_array, self._prom2abs)
 
         return case
+
+
+def _apply_delta(base, delta):
+    """
+    Return a copy of the values of a case updated with the values stored in a delta.
+
+    Parameters
+    ----------
+    base : ndarray
+        Structured array of the values of the previous case.
+    delta : ndarray
+        Structured array of the values that changed, with no fields if none changed.
+
+    Returns
+    -------
+    ndarray
+        Structured array of the values of the case.
+    """
+    if not delta.dtype.names:
+        return base
+
+    full = base.copy()
+    for name in delta.dtype.names:
+        full[name] = delta[name]
+    return full
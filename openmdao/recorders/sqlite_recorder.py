@@ -2,13 +2,19 @@
 Class definition for SqliteRecorder, which provides dictionary backed by SQLite.
 """
 
+import ast
 import io
 import os
 import sqlite3
+import struct
+import threading
+import zlib
+from collections import OrderedDict
 
 import numpy as np
 from six import iteritems
 from six.moves import cPickle as pickle
+from six.moves.queue import Queue, Empty
 
 from openmdao.recorders.base_recorder import BaseRecorder
 from openmdao.utils.mpi import MPI
@@ -18,54 +24,169 @@ from openmdao.core.driver import Driver
 from openmdao.core.system import System
 
 
-def array_to_blob(array):
+def blob_to_array(blob):
     """
-    Make numpy array in to BLOB type.
-
-    Convert a numpy array to something that can be written
-    to a BLOB field in sqlite.
+    Convert sqlite BLOB written with `np.save` to numpy array.
 
-    TODO: move this to a util file?
+    This is the encoding used by files of format version 1.
 
     Parameters
     ----------
-    array : array
-        The array that will be converted to a blob.
+    blob : blob
+        The blob that will be converted to an array.
 
     Returns
     -------
-    blob :
-        The blob created from the array.
-
+    array :
+        The array created from the blob.
     """
-    out = io.BytesIO()
-    np.save(out, array)
+    out = io.BytesIO(blob)
     out.seek(0)
-    return sqlite3.Binary(out.read())
+    return np.load(out)
 
 
-def blob_to_array(blob):
+format_version = 2
+
+
+# dtype id and flags at the start of each blob
+_blob_header = struct.Struct('<IB')
+_COMPRESSED = 1
+
+
+class BlobCodec(object):
     """
-    Convert sqlite BLOB to numpy array.
+    Converts the structured arrays of recorded values to and from sqlite BLOBs.
 
-    TODO: move this to a util file?
+    A blob holds only the raw bytes of the array after a short header giving the id of its
+    dtype. Each distinct dtype is stored once, in the blob_dtypes table.
+
+    Attributes
+    ----------
+    _compress : bool
+        If True, compress the bytes of the arrays with zlib.
+    _con : sqlite connection object or None
+        Connection from which to read the dtypes of the blobs being decoded.
+    _dtype_ids : dict
+        Mapping of dtype to its id.
+    _dtypes : dict
+        Mapping of id to its dtype.
+    """
+
+    def __init__(self, con=None, compress=False):
+        """
+        Initialize.
+
+        Parameters
+        ----------
+        con : sqlite connection object or None
+            Connection to the recording file, needed only for decoding.
+        compress : bool
+            If True, compress the bytes of the arrays with zlib.
+        """
+        self._compress = compress
+        self._con = con
+        self._dtype_ids = {}
+        self._dtypes = {}
+
+    def encode(self, array):
+        """
+        Convert a structured array, or None, to a blob.
+
+        Parameters
+        ----------
+        array : ndarray or None
+            The array that will be converted to a blob.
+
+        Returns
+        -------
+        blob
+            The blob created from the array.
+        tuple or None
+            The row to insert into the blob_dtypes table if the dtype of the array was not seen
+            before, otherwise None.
+        """
+        if array is None:
+            return sqlite3.Binary(_blob_header.pack(0, 0)), None
+
+        new_dtype = None
+        dtype_id = self._dtype_ids.get(array.dtype)
+        if dtype_id is None:
+            dtype_id = len(self._dtype_ids) + 1
+            self._dtype_ids[array.dtype] = dtype_id
+            self._dtypes[dtype_id] = array.dtype
+            new_dtype = (dtype_id, repr(array.dtype.descr))
+
+        data = array.tobytes()
+        if self._compress:
+            return (sqlite3.Binary(_blob_header.pack(dtype_id, _COMPRESSED) +
+                                   zlib.compress(data)), new_dtype)
+        return sqlite3.Binary(_blob_header.pack(dtype_id, 0) + data), new_dtype
+
+    def decode(self, blob):
+        """
+        Convert a blob to a structured array.
+
+        The array has its own, writable, copy of the data.
+
+        Parameters
+        ----------
+        blob : blob
+            The blob that will be converted to an array.
+
+        Returns
+        -------
+        ndarray
+            The array created from the blob. An object array holding None if None was encoded.
+        """
+        dtype_id, flags = _blob_header.unpack_from(blob)
+        if dtype_id == 0:
+            return np.array(None, dtype=object)
+
+        dtype = self._dtypes.get(dtype_id)
+        if dtype is None:
+            # the dtype may have been recorded since the dtypes were last read
+            self._read_dtypes()
+            dtype = self._dtypes[dtype_id]
+
+        if flags & _COMPRESSED:
+            data = bytearray(zlib.decompress(blob[_blob_header.size:]))
+        else:
+            data = bytearray(blob[_blob_header.size:])
+        return np.frombuffer(data, dtype=dtype)
+
+    def _read_dtypes(self):
+        """
+        Read the dtypes stored in the recording file.
+        """
+        for dtype_id, descr in self._con.execute("SELECT id, descr FROM blob_dtypes"):
+            # the descr is parsed as a literal, so reading a file never runs code from it
+            self._dtypes[dtype_id] = np.dtype(ast.literal_eval(descr))
+
+
+def _same_variables(values, last_values):
+    """
+    Return True if two dicts of variable values hold the same variables with the same shapes.
 
     Parameters
     ----------
-    blob : blob
-        The blob that will be converted to an array.
+    values : dict or None
+        Dict of variable names and values.
+    last_values : dict or None
+        Dict of variable names and values.
 
     Returns
     -------
-    array :
-        The array created from the blob.
+    bool
+        True if the variables and their shapes are the same.
     """
-    out = io.BytesIO(blob)
-    out.seek(0)
-    return np.load(out)
-
-
-format_version = 1
+    if not values or not last_values:
+        return not values and not last_values
+    if len(values) != len(last_values):
+        return False
+    for name, value in iteritems(values):
+        if name not in last_values or np.shape(value) != last_values[name].shape:
+            return False
+    return True
 
 
 class SqliteRecorder(BaseRecorder):
@@ -86,9 +207,37 @@ class SqliteRecorder(BaseRecorder):
         Dictionary mapping promoted names to absolute names.
     _open_close_sqlite: bool
         If True, open, write, and close the sqlite file. Needed for when running under MPI.
+    _record_var_history : bool
+        If True, also store the value of each variable in its own row so that its history
+        across cases can be read without decoding every case.
+    _codec : BlobCodec
+        Converts the arrays of recorded values to blobs.
+    _history_ids : dict
+        Mapping of (case table, category, absolute name) to the id of that variable in the
+        var_history_names table.
+    _last_ids : dict
+        Mapping of table name to the id of the last row assigned in that table.
+    _queue : Queue or None
+        Queue of pending inserts consumed by the writer thread. None if not buffered.
+    _writer : Thread or None
+        Thread that writes the queued inserts to the database. None if not buffered.
+    _writer_error : Exception or None
+        Exception raised in the writer thread, reported on the next record or on close.
+    _record_deltas : bool
+        If True, system and solver iterations store only the variables that changed since the
+        previous iteration of the same system or solver.
+    _keyframe_interval : int
+        Number of iterations of a system or solver between two that are stored in full.
+    _delta_tol : float
+        Variables that changed by no more than this are not stored in a delta.
+    _delta_streams : dict
+        Mapping of each recorded system or solver to the id of its last case, the number of
+        deltas stored since the last full case and the values stored as of the last case.
     """
 
-    def __init__(self, filepath, append=False):
+    def __init__(self, filepath, append=False, record_var_history=False, buffered=False,
+                 buffer_size=1000, compress=False, record_deltas=False, keyframe_interval=50,
+                 delta_tol=0.0):
         """
         Initialize the SqliteRecorder.
 
@@ -98,6 +247,27 @@ class SqliteRecorder(BaseRecorder):
             Path to the recorder file.
         append : bool
             Optional. If True, append to an existing case recorder file.
+        record_var_history : bool
+            Optional. If True, also store the value of each recorded variable separately, so
+            that the history of a variable can be read efficiently with `get_var_history`.
+        buffered : bool
+            Optional. If True, recorded iterations are queued and written by a background thread,
+            which commits many of them per transaction. The queue is flushed on `close`.
+        buffer_size : int
+            Optional. Maximum number of records waiting in the queue when buffered. Recording
+            blocks until the writer thread catches up when the queue is full.
+        compress : bool
+            Optional. If True, compress the recorded values with zlib.
+        record_deltas : bool
+            Optional. If True, an iteration of a system or solver stores only the variables that
+            changed since its previous iteration, except for every `keyframe_interval`-th
+            iteration, which is stored in full. Case readers rebuild the full cases.
+        keyframe_interval : int
+            Optional. Number of iterations of a system or solver between full cases when
+            recording deltas.
+        delta_tol : float
+            Optional. When recording deltas, a variable is stored only if one of its values
+            changed by more than this since it was last stored.
         """
         super(SqliteRecorder, self).__init__()
 
@@ -109,6 +279,19 @@ class SqliteRecorder(BaseRecorder):
         self.model_viewer_data = None
         self._abs2prom = {'input': {}, 'output': {}}
         self._prom2abs = {'input': {}, 'output': {}}
+        self._record_var_history = record_var_history
+        self._codec = BlobCodec(compress=compress)
+        self._history_ids = {}
+        self._last_ids = {'global_iterations': 0, 'driver_iterations': 0,
+                          'system_iterations': 0, 'solver_iterations': 0,
+                          'var_history_names': 0}
+        self._queue = None
+        self._writer = None
+        self._writer_error = None
+        self._record_deltas = record_deltas
+        self._keyframe_interval = keyframe_interval
+        self._delta_tol = delta_tol
+        self._delta_streams = {}
 
         if append:
             raise NotImplementedError("Append feature not implemented for SqliteRecorder")
@@ -118,7 +301,8 @@ class SqliteRecorder(BaseRecorder):
                 os.remove(filepath)
             except OSError:
                 pass
-            self.con = sqlite3.connect(filepath)
+            # when buffered, the connection is handed over to the writer thread after setup
+            self.con = sqlite3.connect(filepath, check_same_thread=not buffered)
             with self.con:
                 self.cursor = self.con.cursor()
                 self.cursor.execute("CREATE TABLE metadata( format_version INT, "
@@ -143,6 +327,25 @@ class SqliteRecorder(BaseRecorder):
                                     "success INT, msg TEXT, abs_err REAL, rel_err REAL, "
                                     "solver_output BLOB, solver_residuals BLOB)")
 
+                # cases are looked up by their iteration coordinate when read
+                for table in ('driver_iterations', 'system_iterations', 'solver_iterations'):
+                    self.cursor.execute("CREATE INDEX {0}_coord_ind ON {0}(iteration_coordinate)"
+                                        .format(table))
+
+                # the dtypes of the structured arrays stored in the blobs, each stored once
+                self.cursor.execute("CREATE TABLE blob_dtypes(id INTEGER PRIMARY KEY, "
+                                    "descr TEXT)")
+
+                # per-variable storage, one row per variable per case, kept together by variable
+                self.cursor.execute("CREATE TABLE var_history_names(id INTEGER PRIMARY KEY, "
+                                    "case_table TEXT, category TEXT, name TEXT, shape BLOB)")
+                self.cursor.execute("CREATE TABLE var_history(var_id INT, case_id INT, "
+                                    "value BLOB, PRIMARY KEY(var_id, case_id)) WITHOUT ROWID")
+
+                # cases stored as deltas, with the id of the case each is applied to
+                self.cursor.execute("CREATE TABLE iteration_deltas(case_table TEXT, id INT, "
+                                    "base_id INT, PRIMARY KEY(case_table, id)) WITHOUT ROWID")
+
                 self.cursor.execute("CREATE TABLE driver_metadata(id TEXT PRIMARY KEY, "
                                     "model_viewer_data BLOB)")
                 self.cursor.execute("CREATE TABLE system_metadata(id TEXT PRIMARY KEY, "
@@ -150,6 +353,12 @@ class SqliteRecorder(BaseRecorder):
                 self.cursor.execute("CREATE TABLE solver_metadata(id TEXT PRIMARY KEY, "
                                     "solver_options BLOB, solver_class TEXT)")
 
+            if buffered:
+                self._queue = Queue(maxsize=buffer_size)
+                self._writer = threading.Thread(target=self._write_queued)
+                self._writer.daemon = True
+                self._writer.start()
+
     def startup(self, recording_requester):
         """
         Prepare for a new run and create/update the abs2prom and prom2abs variables.
@@ -184,9 +393,8 @@ class SqliteRecorder(BaseRecorder):
         abs2prom = pickle.dumps(self._abs2prom)
         prom2abs = pickle.dumps(self._prom2abs)
         if self._open_close_sqlite:
-            with self.con:
-                self.con.execute("UPDATE metadata SET abs2prom=?, prom2abs=?",
-                                 (abs2prom, prom2abs))
+            self._insert([("UPDATE metadata SET abs2prom=?, prom2abs=?",
+                           [(abs2prom, prom2abs)])])
 
     def record_iteration_driver(self, recording_requester, data, metadata):
         """
@@ -222,23 +430,34 @@ class SqliteRecorder(BaseRecorder):
             constraints_array = values_to_array(constraints)
             sysvars_array = values_to_array(sysvars)
 
-            desvars_blob = array_to_blob(desvars_array)
-            responses_blob = array_to_blob(responses_array)
-            objectives_blob = array_to_blob(objectives_array)
-            constraints_blob = array_to_blob(constraints_array)
-            sysvars_blob = array_to_blob(sysvars_array)
-
-            with self.con:
-                self.cursor.execute("INSERT INTO driver_iterations(counter, iteration_coordinate, "
-                                    "timestamp, success, msg, desvars , responses , objectives , "
-                                    "constraints, sysincludes ) VALUES(?,?,?,?,?,?,?,?,?,?)",
-                                    (self._counter, self._iteration_coordinate,
-                                     metadata['timestamp'], metadata['success'],
-                                     metadata['msg'], desvars_blob,
-                                     responses_blob, objectives_blob,
-                                     constraints_blob, sysvars_blob))
-                self.con.execute("INSERT INTO global_iterations(record_type, rowid) VALUES(?,?)",
-                                 ('driver', self.cursor.lastrowid))
+            (desvars_blob, responses_blob, objectives_blob, constraints_blob, sysvars_blob), \
+                dtype_insert = self._arrays_to_blobs((desvars_array, responses_array,
+                                                      objectives_array, constraints_array,
+                                                      sysvars_array))
+
+            case_id = self._next_id('driver_iterations')
+            inserts = [
+                dtype_insert,
+                ("INSERT INTO driver_iterations(id, counter, iteration_coordinate, "
+                 "timestamp, success, msg, desvars , responses , objectives , "
+                 "constraints, sysincludes ) VALUES(?,?,?,?,?,?,?,?,?,?,?)",
+                 [(case_id, self._counter, self._iteration_coordinate,
+                   metadata['timestamp'], metadata['success'],
+                   metadata['msg'], desvars_blob,
+                   responses_blob, objectives_blob,
+                   constraints_blob, sysvars_blob)]),
+                self._global_iteration_insert('driver', case_id),
+            ]
+
+            if self._record_var_history:
+                inserts.extend(self._var_history_inserts('driver_iterations', case_id,
+                                                         (('desvars', desvars),
+                                                          ('responses', responses),
+                                                          ('objectives', objectives),
+                                                          ('constraints', constraints),
+                                                          ('sysincludes', sysvars))))
+
+            self._insert(inserts)
 
     def record_iteration_system(self, recording_requester, data, metadata):
         """
@@ -257,24 +476,41 @@ class SqliteRecorder(BaseRecorder):
         outputs = data['o']
         residuals = data['r']
 
-        inputs_array = values_to_array(inputs)
-        outputs_array = values_to_array(outputs)
-        residuals_array = values_to_array(residuals)
-
-        inputs_blob = array_to_blob(inputs_array)
-        outputs_blob = array_to_blob(outputs_array)
-        residuals_blob = array_to_blob(residuals_array)
-
-        with self.con:
-            self.cursor.execute("INSERT INTO system_iterations(counter, iteration_coordinate, "
-                                "timestamp, success, msg, inputs , outputs , residuals ) "
-                                "VALUES(?,?,?,?,?,?,?,?)",
-                                (self._counter, self._iteration_coordinate,
-                                 metadata['timestamp'], metadata['success'],
-                                 metadata['msg'], inputs_blob,
-                                 outputs_blob, residuals_blob))
-            self.cursor.execute("INSERT INTO global_iterations(record_type, rowid) VALUES(?,?)",
-                                ('system', self.cursor.lastrowid))
+        case_id = self._next_id('system_iterations')
+        inserts = []
+        if self._record_deltas:
+            (inputs_stored, outputs_stored, residuals_stored), delta_insert = \
+                self._delta_values(recording_requester, 'system_iterations', case_id,
+                                   (inputs, outputs, residuals))
+            inserts.append(delta_insert)
+        else:
+            inputs_stored, outputs_stored, residuals_stored = inputs, outputs, residuals
+
+        inputs_array = values_to_array(inputs_stored)
+        outputs_array = values_to_array(outputs_stored)
+        residuals_array = values_to_array(residuals_stored)
+
+        (inputs_blob, outputs_blob, residuals_blob), dtype_insert = \
+            self._arrays_to_blobs((inputs_array, outputs_array, residuals_array))
+
+        inserts += [
+            dtype_insert,
+            ("INSERT INTO system_iterations(id, counter, iteration_coordinate, "
+             "timestamp, success, msg, inputs , outputs , residuals ) "
+             "VALUES(?,?,?,?,?,?,?,?,?)",
+             [(case_id, self._counter, self._iteration_coordinate,
+               metadata['timestamp'], metadata['success'],
+               metadata['msg'], inputs_blob,
+               outputs_blob, residuals_blob)]),
+            self._global_iteration_insert('system', case_id),
+        ]
+
+        if self._record_var_history:
+            inserts.extend(self._var_history_inserts('system_iterations', case_id,
+                                                     (('inputs', inputs), ('outputs', outputs),
+                                                      ('residuals', residuals))))
+
+        self._insert(inserts)
 
     def record_iteration_solver(self, recording_requester, data, metadata):
         """
@@ -294,24 +530,270 @@ class SqliteRecorder(BaseRecorder):
         outputs = data['o']
         residuals = data['r']
 
-        outputs_array = values_to_array(outputs)
-        residuals_array = values_to_array(residuals)
+        case_id = self._next_id('solver_iterations')
+        inserts = []
+        if self._record_deltas:
+            (outputs_stored, residuals_stored), delta_insert = \
+                self._delta_values(recording_requester, 'solver_iterations', case_id,
+                                   (outputs, residuals))
+            inserts.append(delta_insert)
+        else:
+            outputs_stored, residuals_stored = outputs, residuals
+
+        outputs_array = values_to_array(outputs_stored)
+        residuals_array = values_to_array(residuals_stored)
+
+        (outputs_blob, residuals_blob), dtype_insert = \
+            self._arrays_to_blobs((outputs_array, residuals_array))
+
+        inserts += [
+            dtype_insert,
+            ("INSERT INTO solver_iterations(id, counter, iteration_coordinate, "
+             "timestamp, success, msg, abs_err, rel_err, solver_output, "
+             "solver_residuals) VALUES(?,?,?,?,?,?,?,?,?,?)",
+             [(case_id, self._counter, self._iteration_coordinate,
+               metadata['timestamp'],
+               metadata['success'], metadata['msg'],
+               abs, rel,
+               outputs_blob, residuals_blob)]),
+            self._global_iteration_insert('solver', case_id),
+        ]
+
+        if self._record_var_history:
+            inserts.extend(self._var_history_inserts('solver_iterations', case_id,
+                                                     (('outputs', outputs),
+                                                      ('residuals', residuals))))
+
+        self._insert(inserts)
+
+    def _delta_values(self, recording_requester, case_table, case_id, values):
+        """
+        Reduce the values of an iteration to those that changed since the previous iteration.
+
+        Parameters
+        ----------
+        recording_requester : object
+            The System or Solver being recorded.
+        case_table : str
+            Name of the table the case is inserted into.
+        case_id : int
+            Id of the case in its table.
+        values : tuple of dict or None
+            The dict of variable values of each part of the case.
+
+        Returns
+        -------
+        tuple of dict or None
+            The values to store for each part of the case.
+        (str, list of tuple)
+            The insert that records the case this one is a delta of, if it is one.
+        """
+        tol = self._delta_tol
+        stream = self._delta_streams.get(recording_requester)
+
+        # store the case in full if it starts the stream, if it is due for a keyframe or if the
+        # recorded variables changed
+        full = stream is None or stream[1] >= self._keyframe_interval
+        if not full:
+            full = not all(_same_variables(vals, last) for vals, last in zip(values, stream[2]))
+
+        if full:
+            stored = values
+            last_values = tuple({name: np.array(val, dtype=np.float64)
+                                 for name, val in iteritems(vals)} if vals else vals
+                                for vals in values)
+            self._delta_streams[recording_requester] = [case_id, 0, last_values]
+            return stored, ("INSERT INTO iteration_deltas(case_table, id, base_id) "
+                            "VALUES(?,?,?)", [])
+
+        base_id = stream[0]
+        stored = []
+        for vals, last in zip(values, stream[2]):
+            if not vals:
+                stored.append(vals)
+                continue
+            changed = {}
+            for name, val in iteritems(vals):
+                last_val = last[name]
+                # a value that becomes or stops being NaN has changed, whatever the tolerance
+                if np.any(np.abs(val - last_val) > tol) or \
+                        np.any(np.isnan(val) != np.isnan(last_val)):
+                    changed[name] = val
+                    last_val[...] = val
+            stored.append(changed)
+
+        stream[0] = case_id
+        stream[1] += 1
+        return stored, ("INSERT INTO iteration_deltas(case_table, id, base_id) VALUES(?,?,?)",
+                        [(case_table, case_id, base_id)])
+
+    def _arrays_to_blobs(self, arrays):
+        """
+        Convert the arrays of a case to blobs.
+
+        Parameters
+        ----------
+        arrays : tuple of ndarray or None
+            The structured arrays of values of each part of the case.
+
+        Returns
+        -------
+        list
+            The blobs created from the arrays.
+        (str, list of tuple)
+            The insert that stores the dtypes that were not seen in earlier cases.
+        """
+        blobs = []
+        dtype_rows = []
+        for array in arrays:
+            blob, dtype_row = self._codec.encode(array)
+            blobs.append(blob)
+            if dtype_row is not None:
+                dtype_rows.append(dtype_row)
+
+        return blobs, ("INSERT INTO blob_dtypes(id, descr) VALUES(?,?)", dtype_rows)
+
+    def _next_id(self, table):
+        """
+        Assign the id of the next row inserted into the given table.
+
+        Ids are assigned here rather than by sqlite so that inserts can be queued and batched.
+
+        Parameters
+        ----------
+        table : str
+            Name of the table.
+
+        Returns
+        -------
+        int
+            The id of the new row.
+        """
+        self._last_ids[table] += 1
+        return self._last_ids[table]
+
+    def _global_iteration_insert(self, record_type, case_id):
+        """
+        Return the insert that records the position of a case in the global_iterations table.
+
+        Parameters
+        ----------
+        record_type : str
+            One of 'driver', 'system' or 'solver'.
+        case_id : int
+            Id of the case in its table.
+
+        Returns
+        -------
+        (str, list of tuple)
+            The sql statement and its rows.
+        """
+        return ("INSERT INTO global_iterations(id, record_type, rowid) VALUES(?,?,?)",
+                [(self._next_id('global_iterations'), record_type, case_id)])
+
+    def _var_history_inserts(self, case_table, case_id, categories):
+        """
+        Return the inserts that store the value of each variable of a case in its own row.
+
+        Parameters
+        ----------
+        case_table : str
+            Name of the table the case is inserted into.
+        case_id : int
+            Id of the case in its table.
+        categories : iterable of (str, dict)
+            The category name and the dict of variable values of each part of the case.
+
+        Returns
+        -------
+        list of (str, list of tuple)
+            The sql statements and their rows.
+        """
+        history_ids = self._history_ids
+        name_rows = []
+        rows = []
+        for category, values in categories:
+            if not values:
+                continue
+            for name, value in iteritems(values):
+                key = (case_table, category, name)
+                var_id = history_ids.get(key)
+                if var_id is None:
+                    var_id = history_ids[key] = self._next_id('var_history_names')
+                    name_rows.append((var_id,) + key +
+                                     (pickle.dumps(np.shape(value), pickle.HIGHEST_PROTOCOL),))
+
+                # recorded values are always stored as doubles (see values_to_array)
+                value = np.asarray(value, dtype=np.float64)
+                rows.append((var_id, case_id, sqlite3.Binary(value.tobytes())))
+
+        return [("INSERT INTO var_history_names(id, case_table, category, name, shape) "
+                 "VALUES(?,?,?,?,?)", name_rows),
+                ("INSERT INTO var_history(var_id, case_id, value) VALUES(?,?,?)", rows)]
+
+    def _insert(self, inserts):
+        """
+        Write rows to the database, or queue them for the writer thread if buffered.
 
-        outputs_blob = array_to_blob(outputs_array)
-        residuals_blob = array_to_blob(residuals_array)
+        Parameters
+        ----------
+        inserts : list of (str, list of tuple)
+            The sql statements and the rows to execute each of them with, in order.
+        """
+        if self._queue is None:
+            with self.con:
+                for sql, rows in inserts:
+                    if rows:
+                        self.con.executemany(sql, rows)
+        else:
+            self._check_writer()
+            self._queue.put(inserts)
 
-        with self.con:
-            self.cursor.execute("INSERT INTO solver_iterations(counter, iteration_coordinate, "
-                                "timestamp, success, msg, abs_err, rel_err, solver_output, "
-                                "solver_residuals) VALUES(?,?,?,?,?,?,?,?,?)",
-                                (self._counter, self._iteration_coordinate,
-                                 metadata['timestamp'],
-                                 metadata['success'], metadata['msg'],
-                                 abs, rel,
-                                 outputs_blob, residuals_blob))
+    def _write_queued(self):
+        """
+        Write the queued inserts to the database until the queue is closed.
 
-            self.cursor.execute("INSERT INTO global_iterations(record_type, rowid) VALUES(?,?)",
-                                ('solver', self.cursor.lastrowid))
+        Everything waiting in the queue is written in a single transaction, with one
+        executemany per sql statement.
+        """
+        queue = self._queue
+        done = False
+        while not done:
+            batch = [queue.get()]
+            while True:
+                try:
+                    batch.append(queue.get_nowait())
+                except Empty:
+                    break
+
+            # rows have explicit ids, so statements can be grouped regardless of table order
+            grouped = OrderedDict()
+            for inserts in batch:
+                if inserts is None:
+                    done = True
+                    continue
+                for sql, rows in inserts:
+                    if sql in grouped:
+                        grouped[sql].extend(rows)
+                    else:
+                        grouped[sql] = list(rows)
+
+            if self._writer_error is None:
+                try:
+                    with self.con:
+                        for sql, rows in iteritems(grouped):
+                            if rows:
+                                self.con.executemany(sql, rows)
+                except Exception as err:
+                    self._writer_error = err
+
+    def _check_writer(self):
+        """
+        Raise an error if the writer thread failed to write to the database.
+        """
+        if self._writer_error is not None:
+            raise RuntimeError("SqliteRecorder: failed to write to the case recorder file: "
+                               "%s" % self._writer_error)
 
     def record_metadata_driver(self, recording_requester):
         """
@@ -325,9 +807,8 @@ class SqliteRecorder(BaseRecorder):
         driver_class = type(recording_requester).__name__
         model_viewer_data = pickle.dumps(recording_requester._model_viewer_data,
                                          pickle.HIGHEST_PROTOCOL)
-        with self.con:
-            self.con.execute("INSERT INTO driver_metadata(id, model_viewer_data) VALUES(?,?)",
-                             (driver_class, sqlite3.Binary(model_viewer_data)))
+        self._insert([("INSERT INTO driver_metadata(id, model_viewer_data) VALUES(?,?)",
+                       [(driver_class, sqlite3.Binary(model_viewer_data))])])
 
     def record_metadata_system(self, recording_requester):
         """
@@ -354,10 +835,8 @@ class SqliteRecorder(BaseRecorder):
         path = recording_requester.pathname
         if not path:
             path = 'root'
-        with self.con:
-            self.con.execute("INSERT INTO system_metadata(id, scaling_factors) \
-                              VALUES(?,?)",
-                             (path, sqlite3.Binary(scaling_factors)))
+        self._insert([("INSERT INTO system_metadata(id, scaling_factors) VALUES(?,?)",
+                       [(path, sqlite3.Binary(scaling_factors))])])
 
     def record_metadata_solver(self, recording_requester):
         """
@@ -377,14 +856,20 @@ class SqliteRecorder(BaseRecorder):
         solver_options = pickle.dumps(recording_requester.options,
                                       pickle.HIGHEST_PROTOCOL)
 
-        with self.con:
-            self.con.execute(
-                "INSERT INTO solver_metadata(id, solver_options, solver_class) "
-                "VALUES(?,?,?)", (id, sqlite3.Binary(solver_options), solver_class))
+        self._insert([("INSERT INTO solver_metadata(id, solver_options, solver_class) "
+                       "VALUES(?,?,?)",
+                       [(id, sqlite3.Binary(solver_options), solver_class)])])
 
     def close(self):
         """
-        Close `out`.
+        Close `out`, after writing any queued records.
         """
         if self._open_close_sqlite:
-            self.con.close()
+            if self._writer is not None:
+                self._queue.put(None)
+                self._writer.join()
+                self._queue = self._writer = None
+                self.con.close()
+                self._check_writer()
+            else:
+                self.con.close()
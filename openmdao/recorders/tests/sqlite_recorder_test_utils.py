@@ -9,12 +9,13 @@ import numpy as np
 
 from openmdao.utils.record_util import format_iteration_coordinate
 from openmdao.utils.assert_utils import assert_rel_error
-from openmdao.recorders.sqlite_recorder import blob_to_array, format_version
+from openmdao.recorders.sqlite_recorder import BlobCodec, format_version
 
 def assertDriverIterationDataRecorded(test, db_cur, expected, tolerance):
     """
         Expected can be from multiple cases.
     """
+    blob_to_array = BlobCodec(db_cur.connection).decode
     # iterate through the cases
     for coord, (t0, t1), desvars_expected, responses_expected, objectives_expected, \
             constraints_expected, sysincludes_expected in expected:
@@ -71,6 +72,7 @@ def assertSystemIterationDataRecorded(test, db_cur, expected, tolerance):
     """
         Expected can be from multiple cases.
     """
+    blob_to_array = BlobCodec(db_cur.connection).decode
 
     # iterate through the cases
     for coord, (t0, t1), inputs_expected, outputs_expected, residuals_expected in expected:
@@ -121,6 +123,7 @@ def assertSolverIterationDataRecorded(test, db_cur, expected, tolerance):
     """
         Expected can be from multiple cases.
     """
+    blob_to_array = BlobCodec(db_cur.connection).decode
 
     # iterate through the cases
     for coord, (t0, t1), expected_abs_error, expected_rel_error, expected_output, \
@@ -3,6 +3,7 @@ from __future__ import print_function
 
 import errno
 import os
+import sqlite3
 import unittest
 from shutil import rmtree
 from tempfile import mkdtemp, mkstemp
@@ -10,7 +11,8 @@ from tempfile import mkdtemp, mkstemp
 import numpy as np
 
 from openmdao.test_suite.components.sellar import SellarDerivatives
-from openmdao.api import Problem, Group, IndepVarComp, ExecComp, NonlinearBlockGS, ScipyKrylov, LinearBlockGS
+from openmdao.api import Problem, Group, IndepVarComp, ExecComp, NonlinearBlockGS, ScipyKrylov, LinearBlockGS, \
+    ScipyOptimizeDriver
 from openmdao.recorders.sqlite_recorder import SqliteRecorder, format_version
 from openmdao.recorders.case_reader import CaseReader
 from openmdao.recorders.sqlite_reader import SqliteCaseReader
@@ -329,6 +331,327 @@ class TestSqliteCaseReader(unittest.TestCase):
                              'rank0:Driver|0|root._solve_nonlinear|0|NonlinearBlockGS|{}'
                              .format(i))
 
+    def test_reading_compressed_cases(self):
+        self.setup_sellar_model()
+
+        recorder = SqliteRecorder(self.filename, compress=True)
+
+        self.prob.model._nonlinear_solver.recording_options['record_solver_residuals'] = True
+        self.prob.model._nonlinear_solver.add_recorder(recorder)
+        self.prob.model.add_recorder(recorder)
+
+        self.prob.setup(check=False)
+
+        self.prob.run_driver()
+        self.prob.cleanup()
+
+        cr = CaseReader(self.filename)
+
+        self.assertEqual(cr.system_cases.num_cases, 1)
+        self.assertEqual(cr.solver_cases.num_cases, 7)
+
+        last_case = cr.solver_cases.get_case(-1)
+        np.testing.assert_almost_equal(last_case.outputs['z'], [5.0, 2.0])
+        np.testing.assert_almost_equal(last_case.outputs['y1'], [25.58830237], decimal=6)
+        np.testing.assert_almost_equal(last_case.residuals['con2'], [0.0, ])
+
+        system_case = cr.system_cases.get_case(0)
+        np.testing.assert_almost_equal(system_case.outputs['y2'], [12.05848815], decimal=6)
+        np.testing.assert_almost_equal(system_case.inputs['x'], [1.0, ])
+        np.testing.assert_almost_equal(system_case.residuals['con1'], [0.0, ])
+
+        cr.close()
+
+    def test_reading_delta_cases_nan(self):
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('px', IndepVarComp('x', 1.0))
+        model.add_subsystem('comp', ExecComp('y = 2.0 * x'))
+        model.connect('px.x', 'comp.x')
+
+        recorder = SqliteRecorder(self.filename, record_deltas=True, delta_tol=1e-6)
+        model.add_recorder(recorder)
+
+        prob.setup(check=False)
+        values = [1.0, np.nan, 3.0, 4.0, np.nan, np.nan, 7.0]
+        for x in values:
+            prob['px.x'] = x
+            prob.run_model()
+        prob.cleanup()
+
+        cr = CaseReader(self.filename)
+        cases = cr.system_cases
+        self.assertEqual(cases.num_cases, len(values))
+        for i, x in enumerate(values):
+            case = cases.get_case(i)
+            np.testing.assert_equal(case.outputs['px.x'], [x])
+            np.testing.assert_equal(case.outputs['comp.y'], [2.0 * x])
+
+            # changing the values of a case does not change the cases rebuilt from it
+            case.outputs['px.x'][:] = -1.0
+
+        for i, x in enumerate(values):
+            np.testing.assert_equal(cases.get_case(i).outputs['px.x'], [x])
+
+        cr.close()
+
+    def test_case_values_writable(self):
+        for compress in (False, True):
+            self.setup_sellar_model()
+
+            filename = os.path.join(self.dir, "sqlite_writable_%s" % compress)
+            recorder = SqliteRecorder(filename, compress=compress)
+            self.prob.model.add_recorder(recorder)
+
+            self.prob.setup(check=False)
+            self.prob.run_driver()
+            self.prob.cleanup()
+
+            # the dtypes are stored as text, not pickled
+            con = sqlite3.connect(filename)
+            for row in con.execute("SELECT descr FROM blob_dtypes"):
+                self.assertIsInstance(row[0], str)
+            con.close()
+
+            cr = CaseReader(filename)
+            case = cr.system_cases.get_case(0)
+            y1 = case.outputs['y1']
+            expected = y1 + 1.0
+            y1 += 1.0
+            assert_rel_error(self, case.outputs['y1'], expected, 1e-15)
+            cr.close()
+
+    def test_reading_delta_cases(self):
+        self.setup_sellar_model()
+
+        delta_filename = os.path.join(self.dir, "sqlite_delta_test")
+        delta_recorder = SqliteRecorder(delta_filename, record_deltas=True, keyframe_interval=3)
+
+        solver = self.prob.model._nonlinear_solver
+        solver.recording_options['record_solver_residuals'] = True
+        for recorder in (self.recorder, delta_recorder):
+            solver.add_recorder(recorder)
+            self.prob.model.d1.add_recorder(recorder)
+
+        self.prob.setup(check=False)
+        self.prob.run_driver()
+        self.prob.cleanup()
+
+        cr = CaseReader(self.filename)
+        delta_cr = CaseReader(delta_filename)
+
+        # only the variables that changed are stored after the first case
+        con = sqlite3.connect(delta_filename)
+        num_deltas = con.execute("SELECT COUNT(*) FROM iteration_deltas WHERE "
+                                 "case_table='solver_iterations'").fetchone()[0]
+        con.close()
+        self.assertEqual(num_deltas, 5)
+
+        for cases, delta_cases in ((cr.solver_cases, delta_cr.solver_cases),
+                                   (cr.system_cases, delta_cr.system_cases)):
+            self.assertEqual(delta_cases.num_cases, cases.num_cases)
+
+            # read the cases out of order, and all at once
+            expected = [cases.get_case(i) for i in range(cases.num_cases)]
+            actual = [delta_cases.get_case(i) for i in reversed(range(cases.num_cases))][::-1]
+            for actual_cases in (actual, delta_cases.get_cases(slice(None))):
+                for case, delta_case in zip(expected, actual_cases):
+                    for attr in ('inputs', 'outputs', 'residuals'):
+                        values = getattr(case, attr, None)
+                        if values is None:
+                            self.assertIsNone(getattr(delta_case, attr, None))
+                            continue
+                        delta_values = getattr(delta_case, attr)
+                        self.assertEqual(values._values.dtype, delta_values._values.dtype)
+                        for name in values._values.dtype.names:
+                            assert_rel_error(self, delta_values._values[name],
+                                             values._values[name], 1e-15)
+
+        cr.close()
+        delta_cr.close()
+
+    def test_reading_multiple_cases(self):
+        self.setup_sellar_model()
+
+        self.prob.model._nonlinear_solver.add_recorder(self.recorder)
+
+        self.prob.setup(check=False)
+        self.prob.run_driver()
+        self.prob.cleanup()
+
+        cr = CaseReader(self.filename)
+        solver_cases = cr.solver_cases
+
+        expected = [solver_cases.get_case(i) for i in range(solver_cases.num_cases)]
+        keys = solver_cases.list_cases()
+        self.assertEqual(keys, [case.iteration_coordinate for case in expected])
+
+        def check(cases, indices):
+            self.assertEqual(len(cases), len(indices))
+            for case, i in zip(cases, indices):
+                self.assertEqual(case.iteration_coordinate, expected[i].iteration_coordinate)
+                assert_rel_error(self, case.outputs['y1'], expected[i].outputs['y1'], 1e-15)
+
+        check(solver_cases.get_cases(range(2, 5)), [2, 3, 4])
+        check(solver_cases.get_cases(slice(None, None, 3)), [0, 3, 6])
+        check(solver_cases.get_cases([-1, 0, 6]), [6, 0, 6])
+        check(solver_cases.get_cases([keys[4], 1, keys[0]]), [4, 1, 0])
+        check(solver_cases.get_cases([]), [])
+
+        self.assertEqual(solver_cases.get_iteration_coordinate(-2), keys[5])
+
+        with self.assertRaises(IndexError):
+            solver_cases.get_case(7)
+        with self.assertRaises(IndexError):
+            solver_cases.get_cases([0, -8])
+        with self.assertRaises(KeyError):
+            solver_cases.get_case('rank0:nowhere|0')
+        with self.assertRaises(KeyError):
+            solver_cases.get_cases(['rank0:nowhere|0'])
+
+        cr.close()
+
+    def test_reading_unindexed_file_with_gaps(self):
+        self.setup_sellar_model()
+
+        self.prob.model._nonlinear_solver.add_recorder(self.recorder)
+
+        self.prob.setup(check=False)
+        self.prob.run_driver()
+        self.prob.cleanup()
+
+        cr = CaseReader(self.filename)
+        expected = [cr.solver_cases.get_case(i) for i in range(cr.solver_cases.num_cases)]
+        cr.close()
+
+        # make the file look like one recorded without the indices, with a case missing
+        con = sqlite3.connect(self.filename)
+        with con:
+            for table in ('driver_iterations', 'system_iterations', 'solver_iterations'):
+                con.execute("DROP INDEX {}_coord_ind".format(table))
+            con.execute("DELETE FROM solver_iterations WHERE id=3")
+        con.close()
+        del expected[2]
+
+        with open(self.filename, 'rb') as f:
+            contents = f.read()
+
+        cr = CaseReader(self.filename)
+        solver_cases = cr.solver_cases
+        self.assertEqual(solver_cases.num_cases, 6)
+
+        keys = solver_cases.list_cases()
+        self.assertEqual(keys, [case.iteration_coordinate for case in expected])
+
+        def check(cases, indices):
+            self.assertEqual(len(cases), len(indices))
+            for case, i in zip(cases, indices):
+                self.assertEqual(case.iteration_coordinate, expected[i].iteration_coordinate)
+                assert_rel_error(self, case.outputs['y1'], expected[i].outputs['y1'], 1e-15)
+
+        check([solver_cases.get_case(i) for i in range(6)], range(6))
+        check([solver_cases.get_case(key) for key in keys], range(6))
+        check(solver_cases.get_cases(range(1, 4)), [1, 2, 3])
+        check(solver_cases.get_cases([keys[4], -1, keys[0]]), [4, 5, 0])
+        self.assertEqual(solver_cases.get_iteration_coordinate(2), keys[2])
+
+        with self.assertRaises(IndexError):
+            solver_cases.get_case(6)
+        with self.assertRaises(KeyError):
+            solver_cases.get_case('rank0:nowhere|0')
+
+        cr.close()
+
+        # reading the file does not change it
+        with open(self.filename, 'rb') as f:
+            self.assertEqual(f.read(), contents)
+
+    def test_var_history(self):
+        self.setup_sellar_model()
+
+        recorder = SqliteRecorder(self.filename, record_var_history=True)
+
+        self.prob.driver = ScipyOptimizeDriver()
+        self.prob.driver.options['optimizer'] = 'SLSQP'
+        self.prob.driver.options['tol'] = 1e-9
+        self.prob.driver.options['disp'] = False
+        self.prob.driver.recording_options['record_objectives'] = True
+        self.prob.driver.add_recorder(recorder)
+        self.prob.model._nonlinear_solver.recording_options['record_solver_residuals'] = True
+        self.prob.model._nonlinear_solver.add_recorder(recorder)
+
+        self.prob.setup(check=False)
+        self.prob.run_driver()
+        self.prob.cleanup()
+
+        cr = CaseReader(self.filename)
+
+        driver_cases = cr.driver_cases.get_cases(slice(None))
+        history = cr.driver_cases.get_var_history('obj', 'z', 'px.x')
+        self.assertEqual(history['z'].shape, (len(driver_cases), 2))
+        self.assertEqual(history['obj'].shape, (len(driver_cases), 1))
+        assert_rel_error(self, history['z'], [case.desvars['z'] for case in driver_cases], 1e-15)
+        assert_rel_error(self, history['px.x'], [case.desvars['x'] for case in driver_cases],
+                         1e-15)
+        assert_rel_error(self, history['obj'], [case.objectives['obj'] for case in driver_cases],
+                         1e-15)
+
+        solver_cases = cr.solver_cases.get_cases(slice(None))
+        history = cr.solver_cases.get_var_history('y1')
+        assert_rel_error(self, history['y1'], [case.outputs['y1'] for case in solver_cases],
+                         1e-15)
+        history = cr.solver_cases.get_var_history('y1', category='residuals')
+        assert_rel_error(self, history['y1'], [case.residuals['y1'] for case in solver_cases],
+                         1e-15)
+
+        with self.assertRaises(KeyError):
+            cr.driver_cases.get_var_history('y3')
+        with self.assertRaises(ValueError):
+            cr.solver_cases.get_var_history('y1', category='desvars')
+
+        cr.close()
+
+    def test_var_history_not_recorded(self):
+        self.setup_sellar_model()
+
+        self.prob.model._nonlinear_solver.add_recorder(self.recorder)
+
+        self.prob.setup(check=False)
+        self.prob.run_driver()
+        self.prob.cleanup()
+
+        cr = CaseReader(self.filename)
+        with self.assertRaises(KeyError):
+            cr.solver_cases.get_var_history('y1')
+
+        cr.close()
+
+    def test_reading_file_being_recorded(self):
+        self.setup_sellar_model()
+
+        self.prob.model._nonlinear_solver.add_recorder(self.recorder)
+
+        self.prob.setup(check=False)
+        self.prob.run_driver()
+
+        cr = CaseReader(self.filename)
+        self.assertEqual(cr.solver_cases.num_cases, 7)
+        self.assertEqual(len(cr.solver_cases.list_cases()), 7)
+
+        # cases recorded after the reader was created are picked up by an update
+        self.prob.run_driver()
+        self.assertEqual(cr.solver_cases.num_cases, 7)
+
+        # the model is already converged, so the second run takes a single iteration
+        cr.update()
+        self.assertEqual(cr.solver_cases.num_cases, 8)
+        self.assertEqual(len(cr.solver_cases.list_cases()), 8)
+        self.assertEqual(cr.solver_cases.get_case(-1).iteration_coordinate,
+                         'rank0:Driver|1|root._solve_nonlinear|1|NonlinearBlockGS|0')
+
+        self.prob.cleanup()
+        cr.close()
+
     @unittest.skipIf(OPT is None, "pyoptsparse is not installed" )
     @unittest.skipIf(OPTIMIZER is None, "pyoptsparse is not providing SNOPT or SLSQP" )
     def test_reading_driver_metadata(self):
@@ -828,6 +828,69 @@ class TestSqliteRecorder(unittest.TestCase):
                                                   expected_rel_error, expected_solver_output,
                                                   expected_solver_residuals),), self.eps)
 
+    def test_record_solver_nonlinear_block_gs_buffered(self):
+        self.setup_sellar_model()
+
+        # a small buffer makes recording wait on the writer thread
+        self.recorder = SqliteRecorder(self.filename, buffered=True, buffer_size=2)
+
+        self.prob.model.add_recorder(self.recorder)
+        self.prob.model.nonlinear_solver = NonlinearBlockGS()
+        nonlinear_solver = self.prob.model.nonlinear_solver
+        nonlinear_solver.add_recorder(self.recorder)
+
+        nonlinear_solver.recording_options['record_solver_residuals'] = True
+
+        self.prob.setup(check=False)
+
+        t0, t1 = run_driver(self.prob)
+
+        self.prob.cleanup()
+
+        coordinate = [0, 'Driver', (0,), 'root._solve_nonlinear', (0,), 'NonlinearBlockGS', (6, )]
+        expected_abs_error = 1.31880284470753394998e-10
+        expected_rel_error = 3.6299074030587596e-12
+
+        expected_solver_output = {
+            'px.x': [1.],
+            'pz.z': [5., 2.],
+            'd1.y1': [25.58830237],
+            'd2.y2': [12.05848815],
+            'obj_cmp.obj': [28.58830817],
+            'con_cmp1.con1': [-22.42830237],
+            'con_cmp2.con2': [-11.94151185]
+        }
+
+        expected_solver_residuals = {
+            'px.x': [-0.],
+            'pz.z': [-0., -0.],
+            'd1.y1': [1.31880284e-10],
+            'd2.y2': [0.],
+            'obj_cmp.obj': [0.],
+            'con_cmp1.con1': [0.],
+            'con_cmp2.con2': [0.]
+        }
+
+        self.assertSolverIterationDataRecorded(((coordinate, (t0, t1), expected_abs_error,
+                                                  expected_rel_error, expected_solver_output,
+                                                  expected_solver_residuals),), self.eps)
+
+        # every queued iteration was written, in the order it was recorded
+        con = sqlite3.connect(self.filename)
+        cur = con.cursor()
+        cur.execute("SELECT record_type, rowid FROM global_iterations ORDER BY id")
+        global_iterations = cur.fetchall()
+        cur.execute("SELECT COUNT(*) FROM solver_iterations")
+        num_solver = cur.fetchone()[0]
+        cur.execute("SELECT COUNT(*) FROM system_iterations")
+        num_system = cur.fetchone()[0]
+        con.close()
+
+        self.assertEqual(len(global_iterations), self.recorder._counter)
+        self.assertEqual(num_solver + num_system, self.recorder._counter)
+        self.assertEqual(global_iterations[0], ('solver', 1))
+        self.assertEqual(global_iterations[-1], ('system', 1))
+
     def test_record_solver_nonlinear_block_jac(self):
         self.setup_sellar_model()
 
@@ -4,12 +4,13 @@ from __future__ import division, print_function
 
 import sys
 import warnings
-from six import reraise, PY2
+from six import reraise, PY2, iteritems
 from six.moves import range
 
 import numpy as np
 import scipy.linalg
 import scipy.sparse.linalg
+from scipy.sparse import coo_matrix
 
 from openmdao.solvers.solver import LinearSolver
 from openmdao.matrices.coo_matrix import COOMatrix
@@ -17,6 +18,7 @@ from openmdao.matrices.csr_matrix import CSRMatrix
 from openmdao.matrices.csc_matrix import CSCMatrix
 from openmdao.matrices.dense_matrix import DenseMatrix
 from openmdao.recorders.recording_iteration_stack import Recording
+from openmdao.utils.coloring import get_col_coloring
 
 
 def format_singluar_error(err, system, mtx):
@@ -68,16 +70,73 @@ def format_singluar_error(err, system, mtx):
 class DirectSolver(LinearSolver):
     """
     LinearSolver that uses linalg.solve or LU factor/solve.
+
+    Attributes
+    ----------
+    _rhs_idxs : dict
+        Mapping of right-hand-side vector name to the indices of its (relevance-reduced)
+        data within the full linear vector, or None if it spans the full linear vector.
+    _mtx_free_coloring : list or None
+        Column groups and their nonzero (row, col) entries used to assemble the matrix-free
+        Jacobian, False if no coloring can be used, or None if not yet computed.
     """
 
     SOLVER = 'LN: Direct'
 
+    def __init__(self, **kwargs):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            options dictionary.
+        """
+        super(DirectSolver, self).__init__(**kwargs)
+        self._rhs_idxs = {}
+        self._mtx_free_coloring = None
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
         """
         self.options.declare('err_on_singular', default=True,
                              desc="Raise an error if LU decomposition is singular.")
+        self.options.declare('use_coloring', default=True, types=bool,
+                             desc="When there is no assembled jacobian, use the declared "
+                                  "partials to probe structurally orthogonal columns together "
+                                  "while building the matrix.")
+
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and optionally perform setup.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super(DirectSolver, self)._setup_solvers(system, depth)
+
+        self._mtx_free_coloring = None
+
+        iproc = system.comm.rank
+        lin_sizes = system._var_sizes['linear']['output'][iproc]
+        lin_offsets = np.cumsum(lin_sizes) - lin_sizes
+        abs2idx = system._var_allprocs_abs2idx['linear']
+
+        self._rhs_idxs = {}
+        for vec_name in system._rel_vec_names:
+            names = system._var_relevant_names[vec_name]['output']
+            if len(names) == len(system._var_abs_names['output']):
+                self._rhs_idxs[vec_name] = None
+            else:
+                idxs = [np.arange(lin_offsets[abs2idx[name]],
+                                  lin_offsets[abs2idx[name]] + lin_sizes[abs2idx[name]])
+                        for name in names]
+                self._rhs_idxs[vec_name] = np.concatenate(idxs) if idxs else np.zeros(0, int)
 
     def _linearize(self):
         """
@@ -122,12 +181,28 @@ class DirectSolver(LinearSolver):
             b_data = system._vectors['residual']['linear'].get_data()
             x_data = system._vectors['output']['linear'].get_data()
 
-            # Assemble the Jacobian by running the identity matrix through apply_linear
+            # Assemble the Jacobian by running unit vectors through apply_linear. With a
+            # coloring, each product probes a whole group of structurally orthogonal columns.
             nmtx = x_data.size
-            eye = np.eye(nmtx)
-            mtx = np.empty((nmtx, nmtx))
-            for i in range(nmtx):
-                self._mat_vec(eye[:, i], mtx[:, i])
+            seed = np.zeros(nmtx)
+
+            if self.options['use_coloring'] and self._mtx_free_coloring is None:
+                self._mtx_free_coloring = self._compute_mtx_free_coloring()
+
+            if self.options['use_coloring'] and self._mtx_free_coloring:
+                mtx = np.zeros((nmtx, nmtx))
+                col_data = np.empty(nmtx)
+                for cols, nzrows, nzcols in self._mtx_free_coloring:
+                    seed[cols] = 1.0
+                    self._mat_vec(seed, col_data)
+                    seed[cols] = 0.0
+                    mtx[nzrows, nzcols] = col_data[nzrows]
+            else:
+                mtx = np.empty((nmtx, nmtx))
+                for i in range(nmtx):
+                    seed[i] = 1.0
+                    self._mat_vec(seed, mtx[:, i])
+                    seed[i] = 0.0
 
             # Restore the backed-up vectors
             system._vectors['residual']['linear'].set_data(b_data)
@@ -145,6 +220,83 @@ class DirectSolver(LinearSolver):
                 except RuntimeWarning as err:
                     raise RuntimeError(format_singluar_error(err, system, mtx))
 
+    def _compute_mtx_free_coloring(self):
+        """
+        Compute column groups for assembling the Jacobian from the declared partials.
+
+        Returns
+        -------
+        list or bool
+            List of (cols, nzrows, nzcols) tuples, one per group of structurally orthogonal
+            columns, or False if the sparsity of the system cannot be determined.
+        """
+        system = self._system
+
+        if system.comm.size > 1:
+            return False
+
+        iproc = system.comm.rank
+        sizes = system._var_sizes['linear']['output'][iproc]
+        offsets = np.cumsum(sizes) - sizes
+        abs2idx = system._var_allprocs_abs2idx['linear']
+        abs2meta = system._var_abs2meta
+        outputs = system._var_abs2prom['output']
+        conns = system._conn_global_abs_in2out
+
+        rows = []
+        cols = []
+        for subsys in system.system_iter(include_self=True, recurse=True):
+            # Matrix-free components and approximated groups have no declared structure.
+            if subsys._owns_approx_jac or getattr(subsys, 'matrix_free', False):
+                return False
+
+            for (of, wrt), meta in iteritems(subsys._subjacs_info):
+                if wrt in outputs:
+                    src = wrt
+                else:
+                    src = conns.get(wrt)
+                    if src not in outputs:
+                        # inputs connected outside of this system aren't part of the matrix.
+                        continue
+
+                row_start = offsets[abs2idx[of]]
+                col_start = offsets[abs2idx[src]]
+
+                if meta['rows'] is not None and (src == wrt or
+                                                 abs2meta[wrt]['src_indices'] is None):
+                    rows.append(np.asarray(meta['rows'], dtype=int) + row_start)
+                    cols.append(np.asarray(meta['cols'], dtype=int) + col_start)
+                else:
+                    # dense subjac, or one whose columns are scattered by src_indices.
+                    nrow = abs2meta[of]['size']
+                    ncol = abs2meta[src]['size']
+                    rows.append(np.repeat(np.arange(row_start, row_start + nrow), ncol))
+                    cols.append(np.tile(np.arange(col_start, col_start + ncol), nrow))
+
+        if not rows:
+            return False
+
+        nmtx = np.sum(sizes)
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+
+        groups = get_col_coloring(rows, cols, (nmtx, nmtx))
+        if len(groups) == nmtx:
+            return False
+
+        pattern = coo_matrix((np.ones(rows.size, dtype=bool), (rows, cols)),
+                             shape=(nmtx, nmtx)).tocsc()
+        indptr = pattern.indptr
+        indices = pattern.indices
+
+        coloring = []
+        for group in groups:
+            nzrows = np.concatenate([indices[indptr[c]:indptr[c + 1]] for c in group])
+            nzcols = np.repeat(group, indptr[group + 1] - indptr[group])
+            coloring.append((group, nzrows, nzcols))
+
+        return coloring
+
     def _mat_vec(self, in_vec, out_vec):
         """
         Compute matrix-vector product.
@@ -173,10 +325,85 @@ class DirectSolver(LinearSolver):
         # put new value in out_vec
         b_vec.get_data(out_vec)
 
+    def _lu_solve(self, b_data, mode):
+        """
+        Back-substitute one or more right-hand sides against the cached factorization.
+
+        Parameters
+        ----------
+        b_data : ndarray
+            Right-hand side(s), either a 1-D array or a 2-D array with one column per RHS.
+        mode : str
+            'fwd' or 'rev'.
+
+        Returns
+        -------
+        ndarray
+            Solution(s), with the same shape as b_data.
+        """
+        system = self._system
+
+        if ((system._owns_assembled_jac or system._views_assembled_jac) and
+                isinstance(system._jacobian._int_mtx, (COOMatrix, CSRMatrix, CSCMatrix))):
+            return self._lu.solve(b_data, 'N' if mode == 'fwd' else 'T')
+
+        return scipy.linalg.lu_solve(self._lup, b_data, trans=0 if mode == 'fwd' else 1)
+
+    def _solve_multi(self, vec_names, b_vecs, x_vecs, mode):
+        """
+        Solve for all right-hand-side vectors with a single back-substitution.
+
+        The data from every column of every RHS vector is stacked into one 2-D array so that
+        the cached LU factors are traversed once for the whole batch.  Relevance-reduced
+        vectors are scattered into (and gathered from) the full linear layout.
+
+        Parameters
+        ----------
+        vec_names : [str, ...]
+            Names of the right-hand-side vectors.
+        b_vecs : [<Vector>, ...]
+            Right-hand-side vectors.
+        x_vecs : [<Vector>, ...]
+            Vectors where the solutions are stored.
+        mode : str
+            'fwd' or 'rev'.
+        """
+        rhs_idxs = [self._rhs_idxs[vec_name] for vec_name in vec_names]
+
+        if len(b_vecs) == 1 and rhs_idxs[0] is None:
+            x_vecs[0].set_data(self._lu_solve(b_vecs[0].get_data(), mode))
+            return
+
+        ncols = [vec._ncol for vec in b_vecs]
+        b_data = np.zeros((len(self._system._vectors['output']['linear']), sum(ncols)))
+
+        start = 0
+        for vec, idxs, ncol in zip(b_vecs, rhs_idxs, ncols):
+            cols = start if ncol == 1 else slice(start, start + ncol)
+            if idxs is None:
+                vec.get_data(b_data[:, cols])
+            else:
+                b_data[idxs, cols] = vec.get_data()
+            start += ncol
+
+        x_data = self._lu_solve(b_data, mode)
+
+        start = 0
+        for vec, idxs, ncol in zip(x_vecs, rhs_idxs, ncols):
+            cols = start if ncol == 1 else slice(start, start + ncol)
+            if idxs is None:
+                vec.set_data(x_data[:, cols])
+            else:
+                vec.set_data(x_data[idxs, cols])
+            start += ncol
+
     def solve(self, vec_names, mode, rel_systems=None):
         """
         Run the solver.
 
+        All right-hand-side vectors, including every column of multi-vectors, are solved
+        together against the factorization computed in _linearize.
+
         Parameters
         ----------
         vec_names : [str, ...]
@@ -195,51 +422,36 @@ class DirectSolver(LinearSolver):
         float
             relative error.
         """
-        if len(vec_names) > 1:
-            raise RuntimeError("DirectSolvers with multiple right-hand-sides are not supported.")
-
         self._vec_names = vec_names
 
         system = self._system
 
         with Recording('DirectSolver', 0, self) as rec:
-            for vec_name in vec_names:
-                if vec_name not in system._rel_vec_names:
-                    continue
-                self._vec_name = vec_name
-                d_residuals = system._vectors['residual'][vec_name]
-                d_outputs = system._vectors['output'][vec_name]
+            vec_names = [vec_name for vec_name in vec_names if vec_name in system._rel_vec_names]
+
+            if vec_names:
+                self._vec_name = vec_names[-1]
+                d_residuals = [system._vectors['residual'][vec_name] for vec_name in vec_names]
+                d_outputs = [system._vectors['output'][vec_name] for vec_name in vec_names]
 
                 # assign x and b vectors based on mode
                 if mode == 'fwd':
-                    x_vec = d_outputs
-                    b_vec = d_residuals
-                    trans_lu = 0
-                    trans_splu = 'N'
+                    x_vecs = d_outputs
+                    b_vecs = d_residuals
                 else:  # rev
-                    x_vec = d_residuals
-                    b_vec = d_outputs
-                    trans_lu = 1
-                    trans_splu = 'T'
+                    x_vecs = d_residuals
+                    b_vecs = d_outputs
 
                 # AssembledJacobians are unscaled.
                 if system._owns_assembled_jac or system._views_assembled_jac:
-                    with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
-                        b_data = b_vec.get_data()
-                        if (isinstance(system._jacobian._int_mtx,
-                                       (COOMatrix, CSRMatrix, CSCMatrix))):
-                            x_data = self._lu.solve(b_data, trans_splu)
-                        else:
-                            x_data = scipy.linalg.lu_solve(self._lup, b_data, trans=trans_lu)
-                        x_vec.set_data(x_data)
+                    with system._unscaled_context(outputs=d_outputs, residuals=d_residuals):
+                        self._solve_multi(vec_names, b_vecs, x_vecs, mode)
 
                 # MVP-generated jacobians are scaled.
                 else:
-                    b_data = b_vec.get_data()
-                    x_data = scipy.linalg.lu_solve(self._lup, b_data, trans=trans_lu)
-                    x_vec.set_data(x_data)
+                    self._solve_multi(vec_names, b_vecs, x_vecs, mode)
 
-                rec.abs = 0.0
-                rec.rel = 0.0
+            rec.abs = 0.0
+            rec.rel = 0.0
 
         return False, 0., 0.
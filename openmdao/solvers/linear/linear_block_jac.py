@@ -9,6 +9,14 @@ class LinearBlockJac(BlockLinearSolver):
 
     SOLVER = 'LN: LNBJ'
 
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        self.options.declare('num_threads', types=int, default=1, lower=1,
+                             desc='Number of threads used to run the subsystems in each '
+                                  'iteration. Only pays off for subsystems that release the GIL.')
+
     def _iter_execute(self):
         """
         Perform the operations in the iteration loop.
@@ -16,32 +24,37 @@ class LinearBlockJac(BlockLinearSolver):
         system = self._system
         mode = self._mode
         vec_names = self._vec_names
+        rel_systems = self._rel_systems
+        num_threads = self.options['num_threads']
 
         subs = [s for s in system._subsystems_myproc
-                if self._rel_systems is None or s.pathname in self._rel_systems]
+                if rel_systems is None or s.pathname in rel_systems]
+
+        # The scope cache of the system is filled here, not from the worker threads.
+        scopes = {subsys.pathname: system._get_scope(subsys) for subsys in subs}
+
+        def apply_linear(subsys):
+            scope_out, scope_in = scopes[subsys.pathname]
+            subsys._apply_linear(vec_names, rel_systems, mode, scope_out, scope_in)
+
+        def solve_linear(subsys):
+            subsys._solve_linear(vec_names, mode, rel_systems)
 
         if mode == 'fwd':
             for vec_name in vec_names:
                 system._transfer(vec_name, mode)
 
-            for subsys in subs:
-                scope_out, scope_in = system._get_scope(subsys)
-                subsys._apply_linear(vec_names, self._rel_systems, mode,
-                                     scope_out, scope_in)
+            self._run_subsystems(apply_linear, subs, num_threads)
 
             for vec_name in vec_names:
                 b_vec = system._vectors['residual'][vec_name]
                 b_vec *= -1.0
                 b_vec += self._rhs_vecs[vec_name]
 
-            for subsys in subs:
-                subsys._solve_linear(vec_names, mode, self._rel_systems)
+            self._run_subsystems(solve_linear, subs, num_threads)
 
         else:  # rev
-            for subsys in subs:
-                scope_out, scope_in = system._get_scope(subsys)
-                subsys._apply_linear(vec_names, self._rel_systems, mode,
-                                     scope_out, scope_in)
+            self._run_subsystems(apply_linear, subs, num_threads)
 
             for vec_name in vec_names:
                 system._transfer(vec_name, mode)
@@ -50,5 +63,4 @@ class LinearBlockJac(BlockLinearSolver):
                 b_vec *= -1.0
                 b_vec += self._rhs_vecs[vec_name]
 
-            for subsys in subs:
-                subsys._solve_linear(vec_names, mode, self._rel_systems)
+            self._run_subsystems(solve_linear, subs, num_threads)
@@ -2,9 +2,18 @@
 
 from __future__ import division, print_function
 
+import hashlib
+from collections import OrderedDict
+
 import numpy as np
+import scipy.linalg
 from scipy.sparse.linalg import LinearOperator, gmres, bicg, bicgstab, cg, cgs
 
+try:
+    from scipy.sparse.linalg import gcrotmk
+except ImportError:  # scipy < 1.0
+    gcrotmk = None
+
 from openmdao.solvers.solver import LinearSolver
 from openmdao.utils.general_utils import warn_deprecation
 from openmdao.recorders.recording_iteration_stack import Recording
@@ -17,6 +26,9 @@ _SOLVER_TYPES = {
     'gmres': gmres,
 }
 
+if gcrotmk is not None:
+    _SOLVER_TYPES['gcrotmk'] = gcrotmk
+
 
 class ScipyKrylov(LinearSolver):
     """
@@ -26,6 +38,12 @@ class ScipyKrylov(LinearSolver):
     ----------
     precon : Solver
         Preconditioner for linear solve. Default is None for no preconditioner.
+    _recycled : dict
+        Recycled Krylov subspace of gcrotmk, as a list of (c, u) vectors, keyed on the vector
+        name and the derivative direction.
+    _warm_starts : dict
+        Solutions of previous solves keyed on the vector name and the derivative direction, each
+        an OrderedDict keyed on a hash of the right-hand side, with the most recent last.
     """
 
     SOLVER = 'LN: SCIPY'
@@ -44,6 +62,9 @@ class ScipyKrylov(LinearSolver):
         # initialize preconditioner to None
         self.precon = None
 
+        self._recycled = {}
+        self._warm_starts = {}
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -54,7 +75,18 @@ class ScipyKrylov(LinearSolver):
         self.options.declare('restart', default=20, types=int,
                              desc='Number of iterations between restarts. Larger values increase '
                                   'iteration cost, but may be necessary for convergence. This '
-                                  'option applies only to gmres.')
+                                  'option applies to gmres and gcrotmk.')
+
+        self.options.declare('recycle', default=20, types=int, lower=0,
+                             desc='Maximum number of vectors of the Krylov subspace that are '
+                                  'recycled between solves. Set to 0 to start every solve from '
+                                  'an empty subspace. This option applies only to gcrotmk.')
+
+        self.options.declare('warm_start', default=0, types=int, lower=0,
+                             desc='Number of solutions kept to be used as the initial guess of '
+                                  'later solves with the same right-hand side, for example the '
+                                  'same derivative seed in the next optimizer iteration. Set to '
+                                  '0 to start from the current value of the solution vector.')
 
         # changing the default maxiter from the base class
         self.options['maxiter'] = 1000
@@ -113,6 +145,10 @@ class ScipyKrylov(LinearSolver):
         if self.precon is not None:
             self.precon._linearize()
 
+        # The products with the recycled vectors are recomputed with the new linearization.
+        for CU in self._recycled.values():
+            CU[:] = [(None, u) for c, u in CU]
+
     def _mat_vec(self, in_vec):
         """
         Compute matrix-vector product.
@@ -165,6 +201,19 @@ class ScipyKrylov(LinearSolver):
         self._mpi_print(self._iter_count, norm, norm / self._norm0)
         self._iter_count += 1
 
+    def _monitor_iter(self, x):
+        """
+        Count the iterations (callback from SciPy for solvers that do not provide the residual).
+
+        Parameters
+        ----------
+        x : ndarray
+            the current solution vector.
+        """
+        with Recording('ScipyKrylov', self._iter_count, self):
+            pass
+        self._iter_count += 1
+
     def solve(self, vec_names, mode, rel_systems=None):
         """
         Run the solver.
@@ -193,8 +242,9 @@ class ScipyKrylov(LinearSolver):
 
         system = self._system
         solver = _SOLVER_TYPES[self.options['solver']]
-        if solver is gmres:
-            restart = self.options['restart']
+        restart = self.options['restart']
+        recycle = self.options['recycle']
+        warm_start = self.options['warm_start']
 
         maxiter = self.options['maxiter']
         atol = self.options['atol']
@@ -218,30 +268,178 @@ class ScipyKrylov(LinearSolver):
                                    matvec=self._mat_vec)
 
             # Support a preconditioner
-            if self.precon:
+            if x_vec._ncol > 1:
+                M = None
+            elif self.precon:
                 M = LinearOperator((size, size),
                                    matvec=self._apply_precon,
                                    dtype=float)
             else:
                 M = None
 
+            b_vec_combined = b_vec.get_data()
+            key = (vec_name, mode)
+
+            if warm_start:
+                solutions = self._warm_starts.setdefault(key, OrderedDict())
+                rhs_hash = hashlib.sha1(b_vec_combined.tobytes()).hexdigest()
+                if rhs_hash in solutions:
+                    x0 = solutions.pop(rhs_hash)
+                    if x0.size == size:
+                        x_vec_combined = x0
+
             self._iter_count = 0
-            if solver is gmres:
-                x, info = solver(linop, b_vec.get_data(), M=M, restart=restart,
+            if x_vec._ncol > 1:
+                # all columns are advanced together, with one product per iteration
+                precon = self._apply_precon if self.precon else None
+                x, info = self._gmres_multi(self._mat_vec, precon, b_vec_combined,
+                                            x_vec_combined, restart, maxiter, atol)
+            elif solver is gmres:
+                x, info = solver(linop, b_vec_combined, M=M, restart=restart,
                                  x0=x_vec_combined, maxiter=maxiter, tol=atol,
                                  callback=self._monitor)
+            elif solver is gcrotmk:
+                if recycle:
+                    CU = self._recycled.setdefault(key, [])
+                    if CU and CU[0][1].size != size:
+                        del CU[:]
+                else:
+                    CU = None
+                x, info = solver(linop, b_vec_combined, M=M, m=restart, k=recycle, CU=CU,
+                                 x0=x_vec_combined, maxiter=maxiter, tol=atol, atol=atol,
+                                 callback=self._monitor_iter)
             else:
-                x, info = solver(linop, b_vec.get_data(), M=M,
+                x, info = solver(linop, b_vec_combined, M=M,
                                  x0=x_vec_combined, maxiter=maxiter, tol=atol,
                                  callback=self._monitor)
 
             fail |= (info != 0)
             x_vec.set_data(x)
 
+            if warm_start:
+                solutions[rhs_hash] = x.copy()
+                while len(solutions) > warm_start:
+                    solutions.popitem(last=False)
+
         # TODO: implement this properly
 
         return fail, 0., 0.
 
+    def _gmres_multi(self, matvec, precon, b, x, restart, maxiter, tol):
+        """
+        Solve for several right-hand sides at once with restarted, flexible GMRES.
+
+        Each column has its own Krylov subspace, but the products with the matrix and the
+        preconditioner are computed for all columns together, so each iteration needs a single
+        sweep through the model.  A column has converged when the norm of its residual is at most
+        tol times the norm of its right-hand side.
+
+        Parameters
+        ----------
+        matvec : function
+            Function that returns the product of the matrix with an array of columns.
+        precon : function or None
+            Function that applies the preconditioner to an array of columns.
+        b : ndarray
+            Right-hand sides, one per column.
+        x : ndarray
+            Initial guesses, one per column.
+        restart : int
+            Number of iterations between restarts.
+        maxiter : int
+            Maximum number of iterations.
+        tol : float
+            Relative tolerance.
+
+        Returns
+        -------
+        ndarray
+            The solutions.
+        int
+            0 if all columns converged, else the number of iterations.
+        """
+        n, ncol = b.shape
+        cols = np.arange(ncol)
+        x = x.copy()
+        col_tol = tol * np.linalg.norm(b, axis=0)
+
+        niter = 0
+        while True:
+            r = b - matvec(x)
+            beta = np.linalg.norm(r, axis=0)
+            active = beta > col_tol
+            if not active.any():
+                return x, 0
+            if niter >= maxiter:
+                return x, niter
+
+            m = min(restart, maxiter - niter)
+            V = np.zeros((m + 1, n, ncol))
+            Z = np.empty((m, n, ncol))
+            H = np.zeros((m + 1, m, ncol))
+            cs = np.zeros((m, ncol))
+            sn = np.zeros((m, ncol))
+            g = np.zeros((m + 1, ncol))
+
+            V[0] = r / np.where(beta > 0.0, beta, 1.0)
+            g[0] = beta
+
+            # number of iterations of this cycle that count for each column
+            nsteps = np.where(active, m, 0)
+
+            for j in range(m):
+                Z[j] = precon(V[j]) if precon else V[j]
+                w = matvec(Z[j])
+
+                # modified Gram-Schmidt
+                for i in range(j + 1):
+                    h = np.einsum('ij,ij->j', V[i], w)
+                    H[i, j] = h
+                    w -= V[i] * h
+
+                hnorm = np.linalg.norm(w, axis=0)
+                H[j + 1, j] = hnorm
+                V[j + 1] = w / np.where(hnorm > 0.0, hnorm, 1.0)
+
+                # apply the previous Givens rotations, then compute the new one
+                for i in range(j):
+                    temp = cs[i] * H[i, j] + sn[i] * H[i + 1, j]
+                    H[i + 1, j] = -sn[i] * H[i, j] + cs[i] * H[i + 1, j]
+                    H[i, j] = temp
+
+                denom = np.hypot(H[j, j], H[j + 1, j])
+                nonzero = denom > 0.0
+                safe = np.where(nonzero, denom, 1.0)
+                cs[j] = np.where(nonzero, H[j, j] / safe, 1.0)
+                sn[j] = np.where(nonzero, H[j + 1, j] / safe, 0.0)
+                H[j, j] = cs[j] * H[j, j] + sn[j] * H[j + 1, j]
+                H[j + 1, j] = 0.0
+                g[j + 1] = -sn[j] * g[j]
+                g[j] = cs[j] * g[j]
+
+                resid = np.abs(g[j + 1])
+                self._monitor(np.where(active, resid, 0.0))
+                niter += 1
+
+                # columns that converge, or whose subspace is exhausted, stop here
+                done = active & ((resid <= col_tol) | (hnorm == 0.0))
+                nsteps[done] = j + 1
+                active &= ~done
+                if not active.any():
+                    break
+
+            # minimize the residual of each column over its subspace
+            k = j + 1
+            Y = np.zeros((k, ncol))
+            for col in cols[nsteps > 0]:
+                kc = nsteps[col]
+                R = H[:kc, :kc, col]
+                diag = np.abs(np.diag(R))
+                kc = np.count_nonzero(diag > 0.0)
+                Y[:kc, col] = scipy.linalg.solve_triangular(R[:kc, :kc], g[:kc, col])
+
+            x += np.einsum('ijk,ik->jk', Z[:k], Y)
+
     def _apply_precon(self, in_vec):
         """
         Apply preconditioner.
@@ -8,13 +8,61 @@ from six import iteritems
 import numpy as np
 
 from openmdao.api import Problem, Group, IndepVarComp, DirectSolver, NewtonSolver, ExecComp, \
-     NewtonSolver, BalanceComp, DenseJacobian
+     NewtonSolver, BalanceComp, DenseJacobian, CSCJacobian, ImplicitComponent
 from openmdao.utils.assert_utils import assert_rel_error
 from openmdao.solvers.linear.tests.linear_test_base import LinearSolverTests
 from openmdao.test_suite.components.sellar import SellarDerivatives
 from openmdao.test_suite.groups.implicit_group import TestImplicitGroup
 
 
+class DiagonalImplicit(ImplicitComponent):
+    """Solves s**2 = x**3 elementwise, with diagonal partials."""
+
+    def initialize(self):
+        self.metadata.declare('size', types=int)
+
+    def setup(self):
+        n = self.metadata['size']
+        self.add_input('x', np.ones(n))
+        self.add_output('s', np.ones(n))
+
+        ar = np.arange(n)
+        self.declare_partials('s', 'x', rows=ar, cols=ar)
+        self.declare_partials('s', 's', rows=ar, cols=ar)
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        residuals['s'] = outputs['s']**2 - inputs['x']**3
+
+    def linearize(self, inputs, outputs, partials):
+        partials['s', 'x'] = -3.0 * inputs['x']**2
+        partials['s', 's'] = 2.0 * outputs['s']
+
+
+class DiagonalImplicitMatrixFree(DiagonalImplicit):
+    """Matrix-free version of DiagonalImplicit."""
+
+    def setup(self):
+        n = self.metadata['size']
+        self.add_input('x', np.ones(n))
+        self.add_output('s', np.ones(n))
+
+    def linearize(self, inputs, outputs, partials):
+        self._x = inputs['x'].copy()
+        self._s = outputs['s'].copy()
+
+    def apply_linear(self, inputs, outputs, d_inputs, d_outputs, d_residuals, mode):
+        if mode == 'fwd':
+            if 'x' in d_inputs:
+                d_residuals['s'] -= 3.0 * self._x**2 * d_inputs['x']
+            if 's' in d_outputs:
+                d_residuals['s'] += 2.0 * self._s * d_outputs['s']
+        else:
+            if 'x' in d_inputs:
+                d_inputs['x'] -= 3.0 * self._x**2 * d_residuals['s']
+            if 's' in d_outputs:
+                d_outputs['s'] += 2.0 * self._s * d_residuals['s']
+
+
 class TestDirectSolver(LinearSolverTests.LinearSolverTestCase):
 
     linear_solver_class = DirectSolver
@@ -210,6 +258,109 @@ class TestDirectSolver(LinearSolverTests.LinearSolverTestCase):
         teg.linear_solver.options['err_on_singular'] = False
         prob.run_model()
 
+    def _check_batched_totals(self, mode, jac_class=None, vectorize=False):
+        prob = Problem()
+        model = prob.model = SellarDerivatives(nonlinear_solver=NewtonSolver(),
+                                               linear_solver=DirectSolver())
+        if jac_class is not None:
+            model.jacobian = jac_class()
+
+        if mode == 'fwd':
+            model.add_design_var('x', parallel_deriv_color='par', vectorize_derivs=vectorize)
+            model.add_design_var('z', parallel_deriv_color='par', vectorize_derivs=vectorize)
+            model.add_objective('obj')
+            model.add_constraint('con1', upper=0.0)
+            model.add_constraint('con2', upper=0.0)
+        else:
+            model.add_design_var('x')
+            model.add_design_var('z')
+            model.add_objective('obj', parallel_deriv_color='par', vectorize_derivs=vectorize)
+            model.add_constraint('con1', upper=0.0, parallel_deriv_color='par',
+                                 vectorize_derivs=vectorize)
+            model.add_constraint('con2', upper=0.0, parallel_deriv_color='par',
+                                 vectorize_derivs=vectorize)
+
+        prob.setup(check=False, mode=mode)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        Jbase = {}
+        Jbase['con1', 'x'] = [[-0.98061433]]
+        Jbase['con1', 'z'] = np.array([[-9.61002285, -0.78449158]])
+        Jbase['con2', 'x'] = [[0.09692762]]
+        Jbase['con2', 'z'] = np.array([[1.94989079, 1.0775421]])
+        Jbase['obj', 'x'] = [[2.98061392]]
+        Jbase['obj', 'z'] = np.array([[9.61001155, 1.78448534]])
+
+        J = prob.compute_totals(of=['obj', 'con1', 'con2'], wrt=['x', 'z'],
+                                return_format='flat_dict')
+        for key, val in iteritems(Jbase):
+            assert_rel_error(self, J[key], val, .00001)
+
+    def test_multiple_rhs_fwd(self):
+        self._check_batched_totals('fwd')
+
+    def test_multiple_rhs_rev(self):
+        self._check_batched_totals('rev')
+
+    def test_multiple_rhs_densejac(self):
+        self._check_batched_totals('fwd', DenseJacobian)
+        self._check_batched_totals('rev', DenseJacobian)
+
+    def test_multiple_rhs_cscjac(self):
+        self._check_batched_totals('fwd', CSCJacobian)
+        self._check_batched_totals('rev', CSCJacobian)
+
+    def test_multiple_rhs_vectorized(self):
+        self._check_batched_totals('fwd', vectorize=True)
+        self._check_batched_totals('rev', vectorize=True)
+        self._check_batched_totals('fwd', DenseJacobian, vectorize=True)
+        self._check_batched_totals('rev', CSCJacobian, vectorize=True)
+
+    def _setup_vectorized_model(self, use_coloring, matrix_free=False):
+        n = 10
+        prob = Problem()
+        model = prob.model = Group()
+        model.add_subsystem('px', IndepVarComp('x', np.arange(n) + 1.0))
+        comp_class = DiagonalImplicitMatrixFree if matrix_free else DiagonalImplicit
+        model.add_subsystem('comp', comp_class(size=n))
+        model.connect('px.x', 'comp.x')
+
+        model.nonlinear_solver = NewtonSolver()
+        model.linear_solver = DirectSolver(use_coloring=use_coloring)
+
+        prob.set_solver_print(level=0)
+        prob.setup(check=False)
+        prob.run_model()
+        return prob
+
+    def test_colored_linearize(self):
+        prob = self._setup_vectorized_model(use_coloring=True)
+        J = prob.compute_totals(of=['comp.s'], wrt=['px.x'])
+
+        # the 20 columns of the diagonal system only need 2 probes.
+        coloring = prob.model.linear_solver._mtx_free_coloring
+        self.assertEqual(len(coloring), 2)
+
+        baseline = self._setup_vectorized_model(use_coloring=False)
+        Jbase = baseline.compute_totals(of=['comp.s'], wrt=['px.x'])
+        self.assertEqual(baseline.model.linear_solver._mtx_free_coloring, None)
+
+        assert_rel_error(self, J['comp.s', 'px.x'], Jbase['comp.s', 'px.x'], 1e-12)
+
+        x = np.arange(10) + 1.0
+        assert_rel_error(self, J['comp.s', 'px.x'], np.diag(1.5 * np.sqrt(x)), 1e-8)
+
+    def test_colored_linearize_matrix_free(self):
+        prob = self._setup_vectorized_model(use_coloring=True, matrix_free=True)
+        J = prob.compute_totals(of=['comp.s'], wrt=['px.x'])
+
+        # no declared structure available, so every column is probed individually.
+        self.assertIs(prob.model.linear_solver._mtx_free_coloring, False)
+
+        x = np.arange(10) + 1.0
+        assert_rel_error(self, J['comp.s', 'px.x'], np.diag(1.5 * np.sqrt(x)), 1e-8)
+
 
 class TestDirectSolverFeature(unittest.TestCase):
 
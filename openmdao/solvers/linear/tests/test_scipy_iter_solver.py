@@ -7,10 +7,12 @@ import warnings
 
 import numpy as np
 
-from openmdao.api import Group, IndepVarComp, Problem, ExecComp, NonlinearBlockGS
+from openmdao.api import Group, IndepVarComp, Problem, ExecComp, NonlinearBlockGS, \
+    LinearSystemComp
 from openmdao.utils.assert_utils import assert_rel_error
 from openmdao.solvers.linear.linear_block_gs import LinearBlockGS
-from openmdao.solvers.linear.scipy_iter_solver import ScipyKrylov, ScipyIterativeSolver
+from openmdao.solvers.linear.scipy_iter_solver import ScipyKrylov, ScipyIterativeSolver, \
+    gcrotmk
 from openmdao.solvers.nonlinear.newton import NewtonSolver
 from openmdao.solvers.linear.tests.linear_test_base import LinearSolverTests
 from openmdao.test_suite.components.expl_comp_simple import TestExplCompSimpleDense
@@ -187,6 +189,96 @@ class TestScipyKrylov(LinearSolverTests.LinearSolverTestCase):
 #     linear_solver_class = krylov_factory('bicgstab')
 
 
+@unittest.skipUnless(gcrotmk, "gcrotmk requires scipy>=1.0.")
+class TestScipyKrylovGCROTMK(TestScipyKrylov):
+    # This will run all of the gmres tests with the gcrotmk solver.
+
+    linear_solver_name = 'gcrotmk'
+    linear_solver_class = krylov_factory('gcrotmk')
+
+
+class CountKrylov(ScipyKrylov):
+    """ This version of ScipyKrylov counts the matrix-vector products."""
+
+    def __init__(self, **kwargs):
+        super(CountKrylov, self).__init__(**kwargs)
+        self.matvec_count = 0
+
+    def _mat_vec(self, in_vec):
+        self.matvec_count += 1
+        return super(CountKrylov, self)._mat_vec(in_vec)
+
+
+class TestScipyKrylovReuse(unittest.TestCase):
+
+    def _run(self, n=40, mode='rev', vectorize=False, precon=None, **options):
+        np.random.seed(11)
+        A = np.eye(n) * 3.0 + np.random.rand(n, n) * 4.0 / n
+
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('pb', IndepVarComp('b', np.ones(n)))
+        model.add_subsystem('pA', IndepVarComp('A', A))
+        model.add_subsystem('lin', LinearSystemComp(size=n))
+        model.connect('pb.b', 'lin.b')
+        model.connect('pA.A', 'lin.A')
+        model.linear_solver = CountKrylov(**options)
+        model.linear_solver.precon = precon
+        model.add_design_var('pb.b', vectorize_derivs=vectorize)
+        model.add_constraint('lin.x', lower=0.0, vectorize_derivs=vectorize)
+
+        prob.setup(check=False, mode=mode)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        counts = []
+        for i in range(2):
+            model.linear_solver.matvec_count = 0
+            J = prob.driver._compute_totals(of=['lin.x'], wrt=['pb.b'], return_format='dict')
+            J = {('lin.x', 'pb.b'): J['lin.x']['pb.b']}
+            assert_rel_error(self, J['lin.x', 'pb.b'], np.linalg.inv(A), 1e-12)
+            counts.append(model.linear_solver.matvec_count)
+
+        return counts
+
+    def test_warm_start(self):
+        counts = self._run()
+        self.assertEqual(counts[0], counts[1])
+
+        # each seed is solved again from its previous solution, so a single product is needed
+        counts = self._run(warm_start=40)
+        self.assertEqual(counts[1], 40)
+
+    @unittest.skipUnless(gcrotmk, "gcrotmk requires scipy>=1.0.")
+    def test_recycle(self):
+        counts = self._run(solver='gcrotmk', recycle=0)
+        self.assertEqual(counts[0], counts[1])
+
+        recycle_counts = self._run(solver='gcrotmk', recycle=40)
+        self.assertLess(recycle_counts[0], counts[0])
+        self.assertLess(recycle_counts[1], recycle_counts[0] / 2)
+
+    def test_vectorized(self):
+        for mode in ('fwd', 'rev'):
+            counts = self._run(mode=mode)
+            vec_counts = self._run(mode=mode, vectorize=True)
+            self.assertEqual(vec_counts[0], vec_counts[1])
+            self.assertLess(vec_counts[0], counts[0] / 10)
+
+            # same answers, and the same products, whichever solver is selected
+            self.assertEqual(self._run(mode=mode, vectorize=True, solver='gcrotmk'), vec_counts)
+
+    def test_vectorized_precon(self):
+        for mode in ('fwd', 'rev'):
+            counts = self._run(mode=mode, precon=LinearBlockGS(maxiter=2))
+            vec_counts = self._run(mode=mode, vectorize=True, precon=LinearBlockGS(maxiter=2))
+            self.assertLess(vec_counts[0], counts[0] / 10)
+
+    def test_vectorized_restart(self):
+        # restarting more often than the number of iterations needed still converges
+        self._run(mode='fwd', vectorize=True, restart=3, maxiter=200)
+
+
 class TestScipyKrylovFeature(unittest.TestCase):
 
     def test_feature_simple(self):
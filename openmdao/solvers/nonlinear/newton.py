@@ -34,6 +34,18 @@ class NewtonSolver(NonlinearSolver):
         Number of iterations for the current invocation of the solver.
     _linear_solver_from_parent : bool
         This is set to True if we are using the parent system's linear solver.
+    _jac_age : int or None
+        Number of iterations since the system was last linearized, or None if it has not been
+        linearized in the current solve.
+    _prev_norm : float
+        Norm of the residual at the start of the previous iteration.
+    _broyden_updates : list of (<Vector>, <Vector>)
+        Rank-one updates applied to the inverse of the reused linearization, as pairs of the
+        step and the correction vector.
+    _prev_step : <Vector> or None
+        Newton direction computed in the previous iteration.
+    _prev_outputs : <Vector> or None
+        Outputs at the start of the previous iteration.
     """
 
     SOLVER = 'NL: Newton'
@@ -59,6 +71,12 @@ class NewtonSolver(NonlinearSolver):
         # if its not shared with the parent group.
         self._linear_solver_from_parent = True
 
+        self._jac_age = None
+        self._prev_norm = None
+        self._broyden_updates = []
+        self._prev_step = None
+        self._prev_outputs = None
+
     @property
     def line_search(self):
         """
@@ -85,6 +103,17 @@ class NewtonSolver(NonlinearSolver):
                              desc='Set to True to turn on sub-solvers (Hybrid Newton).')
         self.options.declare('max_sub_solves', types=int, default=10,
                              desc='Maximum number of subsystem solves.')
+        self.options.declare('max_jac_age', types=int, default=1, lower=1,
+                             desc='Maximum number of iterations that reuse the same '
+                                  'linearization of the system. The default of 1 linearizes '
+                                  'the system on every iteration.')
+        self.options.declare('jac_rate_limit', default=0.5, lower=0.0,
+                             desc='When a linearization is being reused, linearize again '
+                                  'if the norm of the residual decreased by less than this '
+                                  'factor in the last iteration.')
+        self.options.declare('broyden', types=bool, default=False,
+                             desc='Set to True to apply Broyden rank-one updates to a '
+                                  'reused linearization.')
         self.supports['gradients'] = True
 
     def _setup_solvers(self, system, depth):
@@ -207,9 +236,75 @@ class NewtonSolver(NonlinearSolver):
         self._run_apply()
         norm = self._iter_get_norm()
 
+        self._jac_age = None
+        self._prev_norm = norm
+        self._broyden_updates = []
+        self._prev_step = None
+        self._prev_outputs = None
+
         norm0 = norm if norm != 0.0 else 1.0
         return norm0, norm
 
+    def _update_jac(self):
+        """
+        Linearize the system unless the previous linearization can be reused.
+
+        Returns
+        -------
+        bool
+            True if the system was linearized.
+        """
+        max_age = self.options['max_jac_age']
+        age = self._jac_age
+
+        if max_age > 1 and age is not None:
+            norm = self._iter_get_norm()
+            prev_norm = self._prev_norm
+            self._prev_norm = norm
+            if age < max_age and norm <= self.options['jac_rate_limit'] * prev_norm:
+                return False
+
+        self._system._linearize()
+        self._jac_age = 0
+        self._broyden_updates = []
+        return True
+
+    def _broyden_update(self, step):
+        """
+        Turn the direction computed with the reused linearization into a Broyden direction.
+
+        This applies the "good" Broyden update to the inverse of the linearization, stored as a
+        sequence of rank-one corrections, so only one solve with the reused linearization is
+        needed per iteration.
+
+        Parameters
+        ----------
+        step : <Vector>
+            On input, the solution of the reused linear system with the negative residual as the
+            right-hand side. On output, the Broyden direction.
+        """
+        # apply the corrections from earlier iterations
+        for s_vec, a_vec in self._broyden_updates:
+            step.add_scal_vec(s_vec.dot(step), a_vec)
+
+        # the change in the outputs since the last iteration, including any line search or
+        # subsystem solves, and the change in the direction predicted by the previous inverse
+        s_vec = self._system._outputs._clone()
+        s_vec -= self._prev_outputs
+        a_vec = self._prev_step
+        a_vec -= step
+
+        denom = s_vec.dot(a_vec)
+        if denom == 0.0:
+            return
+
+        a_vec *= -1.0
+        a_vec += s_vec
+        a_vec *= 1.0 / denom
+
+        step.add_scal_vec(s_vec.dot(step), a_vec)
+        self._broyden_updates.append((s_vec, a_vec))
+
     def _iter_execute(self):
         """
         Perform the operations in the iteration loop.
@@ -225,10 +320,19 @@ class NewtonSolver(NonlinearSolver):
 
         system._vectors['residual']['linear'].set_vec(system._residuals)
         system._vectors['residual']['linear'] *= -1.0
-        system._linearize()
+        linearized = self._update_jac()
 
         self.linear_solver.solve(['linear'], 'fwd')
 
+        if self.options['broyden'] and self.options['max_jac_age'] > 1:
+            step = system._vectors['output']['linear']
+            if not linearized:
+                self._broyden_update(step)
+            self._prev_step = step._clone()
+            self._prev_outputs = system._outputs._clone()
+
+        self._jac_age += 1
+
         if self.linesearch:
             self.linesearch._do_subsolve = do_subsolve
             self.linesearch.solve()
@@ -1,4 +1,6 @@
 """Define the NonlinearBlockJac class."""
+from operator import methodcaller
+
 from openmdao.recorders.recording_iteration_stack import Recording
 from openmdao.solvers.solver import NonlinearSolver
 from openmdao.utils.mpi import multi_proc_fail_check
@@ -11,6 +13,14 @@ class NonlinearBlockJac(NonlinearSolver):
 
     SOLVER = 'NL: NLBJ'
 
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        self.options.declare('num_threads', types=int, default=1, lower=1,
+                             desc='Number of threads used to run the subsystems in each '
+                                  'iteration. Only pays off for subsystems that release the GIL.')
+
     def _iter_execute(self):
         """
         Perform the operations in the iteration loop.
@@ -20,15 +30,16 @@ class NonlinearBlockJac(NonlinearSolver):
         system._transfer('nonlinear', 'fwd')
 
         with Recording('NonlinearBlockJac', 0, self) as rec:
+            subsystems = system._subsystems_myproc
+            num_threads = self.options['num_threads']
+            solve = methodcaller('_solve_nonlinear')
 
             # If this is a parallel group, check for analysis errors and reraise.
             if len(system._subsystems_myproc) != len(system._subsystems_allprocs):
                 with multi_proc_fail_check(system.comm):
-                    for subsys in system._subsystems_myproc:
-                        subsys._solve_nonlinear()
+                    self._run_subsystems(solve, subsystems, num_threads)
             else:
-                for subsys in system._subsystems_myproc:
-                    subsys._solve_nonlinear()
+                self._run_subsystems(solve, subsystems, num_threads)
 
             system._check_reconf_update()
             rec.abs = 0.0
@@ -3,6 +3,8 @@ Define the NonlinearRunOnce class.
 
 This is a simple nonlinear solver that just runs the system once.
 """
+from operator import methodcaller
+
 from openmdao.recorders.recording_iteration_stack import Recording
 from openmdao.solvers.solver import NonlinearSolver
 from openmdao.utils.general_utils import warn_deprecation
@@ -33,17 +35,25 @@ class NonlinearRunOnce(NonlinearSolver):
         """
         system = self._system
 
+        # Only declared by ParallelGroup, whose subsystems can run on a thread pool.
+        num_threads = system.metadata['num_threads'] if 'num_threads' in system.metadata else 1
+        solve = methodcaller('_solve_nonlinear')
+
         with Recording('NLRunOnce', 0, self) as rec:
             # If this is a parallel group, transfer all at once then run each subsystem.
             if len(system._subsystems_myproc) != len(system._subsystems_allprocs):
                 system._transfer('nonlinear', 'fwd')
 
                 with multi_proc_fail_check(system.comm):
-                    for subsys in system._subsystems_myproc:
-                        subsys._solve_nonlinear()
+                    self._run_subsystems(solve, system._subsystems_myproc, num_threads)
 
                 system._check_reconf_update()
 
+            elif num_threads > 1:
+                system._transfer('nonlinear', 'fwd')
+                self._run_subsystems(solve, system._subsystems_myproc, num_threads)
+                system._check_reconf_update()
+
             # If this is not a parallel group, transfer for each subsystem just prior to running it.
             else:
                 for isub, subsys in enumerate(system._subsystems_myproc):
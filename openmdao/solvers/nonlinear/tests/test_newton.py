@@ -773,6 +773,57 @@ class TestNewton(unittest.TestCase):
         J = prob.compute_totals()
         assert_rel_error(self, J['ecomp.y', 'p1.x'][0][0], -0.703467422498, 1e-6)
 
+    def test_jac_reuse(self):
+
+        class CountDS(DirectSolver):
+            """ This version of DirectSolver counts how many times it linearizes"""
+
+            def __init__(self, **kwargs):
+                super(CountDS, self).__init__(**kwargs)
+                self.lin_count = 0
+
+            def _linearize(self):
+                super(CountDS, self)._linearize()
+                self.lin_count += 1
+
+        def run(linesearch=False, **options):
+            newton = NewtonSolver(**options)
+            ds = CountDS()
+            prob = Problem(model=SellarStateConnection(nonlinear_solver=newton,
+                                                       linear_solver=ds))
+            newton.options['atol'] = 1e-12
+            newton.options['rtol'] = 1e-12
+            newton.options['maxiter'] = 50
+            if linesearch:
+                newton.linesearch = ArmijoGoldsteinLS()
+
+            prob.set_solver_print(level=0)
+            prob.setup(check=False)
+            prob.run_model()
+
+            assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+            assert_rel_error(self, prob['state_eq.y2_command'], 12.05848819, .00001)
+            return newton._iter_count, ds.lin_count
+
+        iters, lins = run()
+        self.assertEqual(lins, iters)
+
+        # reusing the linearization takes more iterations, but fewer linearizations
+        reuse_iters, reuse_lins = run(max_jac_age=10)
+        self.assertGreater(reuse_iters, iters)
+        self.assertLess(reuse_lins, lins)
+
+        # a strict rate limit forces a new linearization on every iteration
+        self.assertEqual(run(max_jac_age=10, jac_rate_limit=0.0), (iters, lins))
+
+        # Broyden updates recover most of the lost convergence rate
+        broyden_iters, broyden_lins = run(max_jac_age=10, broyden=True)
+        self.assertLess(broyden_iters, reuse_iters)
+        self.assertLessEqual(broyden_lins, reuse_lins)
+
+        broyden_iters, broyden_lins = run(max_jac_age=10, broyden=True, linesearch=True)
+        self.assertLess(broyden_iters, reuse_iters)
+
 
 class TestNewtonFeatures(unittest.TestCase):
 
@@ -986,6 +1037,25 @@ class TestNewtonFeatures(unittest.TestCase):
         prob.setup()
         prob.run_model()
 
+    def test_feature_jac_reuse(self):
+        from openmdao.api import Problem, NewtonSolver, DirectSolver
+        from openmdao.test_suite.components.sellar import SellarStateConnection
+
+        newton = NewtonSolver()
+        newton.options['max_jac_age'] = 10
+        newton.options['broyden'] = True
+        newton.options['atol'] = 1e-10
+        newton.options['rtol'] = 1e-10
+
+        prob = Problem(model=SellarStateConnection(nonlinear_solver=newton,
+                                                   linear_solver=DirectSolver()))
+
+        prob.setup()
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['state_eq.y2_command'], 12.05848819, .00001)
+
     def test_feature_err_on_maxiter(self):
         import numpy as np
 
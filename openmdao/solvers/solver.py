@@ -3,6 +3,7 @@
 from __future__ import division, print_function
 
 import os
+import threading
 
 import numpy as np
 
@@ -11,15 +12,19 @@ from openmdao.core.analysis_error import AnalysisError
 from openmdao.jacobians.assembled_jacobian import AssembledJacobian
 from openmdao.recorders.recording_iteration_stack import Recording, recording_iteration
 from openmdao.recorders.recording_manager import RecordingManager
+from openmdao.utils.concurrent import concurrent_eval_threads
 from openmdao.utils.mpi import MPI
 from openmdao.utils.options_dictionary import OptionsDictionary
 from openmdao.utils.record_util import create_local_meta, check_path
 
 
-class SolverInfo(object):
+class SolverInfo(threading.local):
     """
     Communal object for storing some formatting for solver iprint.
 
+    The formatting is kept per thread, so subsystems run on a thread pool can nest their solvers
+    independently.
+
     Attributes
     ----------
     prefix : str
@@ -412,6 +417,46 @@ class Solver(object):
         """
         pass
 
+    def _run_subsystems(self, func, subsystems, num_threads):
+        """
+        Call func on each subsystem, using a pool of threads if num_threads is greater than 1.
+
+        Each worker thread starts with the recording iteration coordinate and iprint prefix of
+        the calling thread.  Recorders are not thread safe, so the subsystems are run one after
+        the other if any of them, or any of their solvers, has a recorder attached.
+
+        Parameters
+        ----------
+        func : function
+            Function called with one subsystem as its argument.
+        subsystems : list of <System>
+            The subsystems, which must not depend on each other.
+        num_threads : int
+            Maximum number of threads.
+        """
+        if num_threads > 1 and len(subsystems) > 1:
+            for subsys in subsystems:
+                if any(mgr._recorders for mgr in subsys._get_recording_managers()):
+                    num_threads = 1
+                    break
+
+        if num_threads > 1 and len(subsystems) > 1:
+            solver_info = self._solver_info
+            rec_stack = list(recording_iteration.stack)
+            prefix = solver_info.prefix
+            info_stack = list(solver_info.stack)
+
+            def run(subsys):
+                recording_iteration.stack = list(rec_stack)
+                solver_info.prefix = prefix
+                solver_info.stack = list(info_stack)
+                func(subsys)
+
+            concurrent_eval_threads(run, subsystems, num_threads)
+        else:
+            for subsys in subsystems:
+                func(subsys)
+
     def _linearize(self):
         """
         Perform any required linearization operations such as matrix factorization.
@@ -16,6 +16,7 @@ from six.moves import range
 
 import numpy as np
 from numpy.random import rand
+from scipy.sparse import coo_matrix
 
 from openmdao.jacobians.jacobian import Jacobian
 from openmdao.jacobians.assembled_jacobian import AssembledJacobian
@@ -244,6 +245,54 @@ def _find_disjoint(prob, mode='fwd', repeats=1, tol=1e-30):
     return total_dv_offsets, total_res_offsets, J
 
 
+def get_col_coloring(rows, cols, shape):
+    """
+    Group the columns of a sparsity pattern into structurally orthogonal sets.
+
+    Columns that share no nonzero rows can be probed together with a single matrix-vector
+    product (or a single perturbation) and their contributions separated afterwards.  Columns
+    are assigned greedily, densest first, to the first compatible group.
+
+    Parameters
+    ----------
+    rows : ndarray of int
+        Row indices of the nonzero entries.
+    cols : ndarray of int
+        Column indices of the nonzero entries.
+    shape : tuple of (int, int)
+        Shape of the matrix.
+
+    Returns
+    -------
+    list of ndarray of int
+        Sorted column indices for each group.
+    """
+    nrows, ncols = shape
+    data = np.ones(len(rows), dtype=bool)
+    pattern = coo_matrix((data, (rows, cols)), shape=shape).tocsc()
+    indptr = pattern.indptr
+    indices = pattern.indices
+
+    group_rows = []
+    group_cols = []
+
+    # mergesort keeps the ordering stable so the coloring is deterministic.
+    for col in np.argsort(-np.diff(indptr), kind='mergesort'):
+        col_rows = indices[indptr[col]:indptr[col + 1]]
+        for used, group in zip(group_rows, group_cols):
+            if not np.any(used[col_rows]):
+                used[col_rows] = True
+                group.append(col)
+                break
+        else:
+            used = np.zeros(nrows, dtype=bool)
+            used[col_rows] = True
+            group_rows.append(used)
+            group_cols.append([col])
+
+    return [np.array(sorted(group), dtype=int) for group in group_cols]
+
+
 def get_simul_meta(problem, mode='fwd', repeats=1, tol=1.e-30, show_jac=False, stream=sys.stdout):
     """
     Compute simultaneous derivative colorings for the given problem.
@@ -1,14 +1,20 @@
 """
-Utilities for submitting function evaluations under MPI.
+Utilities for submitting function evaluations under MPI or to a local process or thread pool.
 """
+import multiprocessing
 import os
+import sys
 import traceback
 from itertools import chain, islice
+from multiprocessing.pool import ThreadPool
 
-from openmdao.utils.mpi import debug
+from openmdao.utils.mpi import MPI, debug
 
 trace = os.environ.get('OPENMDAO_TRACE')
 
+# Function evaluated by the workers of concurrent_eval_local, inherited when they are forked.
+_local_func = None
+
 
 def concurrent_eval_lb(func, cases, comm, broadcast=False):
     """
@@ -233,3 +239,125 @@ def concurrent_eval(func, cases, comm, allgather=False):
                 results = None
 
     return results
+
+
+def _can_fork():
+    """
+    Return True if a local process pool can inherit the current state of this process.
+
+    Returns
+    -------
+    bool
+        True if worker processes are started by forking and MPI is not active.
+    """
+    if MPI is not None or sys.platform == 'win32':
+        return False
+    get_start_method = getattr(multiprocessing, 'get_start_method', None)
+    return get_start_method is None or get_start_method() == 'fork'
+
+
+def _local_eval(case):
+    """
+    Evaluate a single case in a worker of concurrent_eval_local.
+
+    Parameters
+    ----------
+    case : tuple
+        Function args of the form (args, kwargs).
+
+    Returns
+    -------
+    tuple
+        The return value of the function, or None, and the traceback of any error, or None.
+    """
+    args, kwargs = case
+    try:
+        if kwargs:
+            retval = _local_func(*args, **kwargs)
+        else:
+            retval = _local_func(*args)
+    except Exception:
+        return None, traceback.format_exc()
+    return retval, None
+
+
+def concurrent_eval_local(func, cases, num_procs, initializer=None):
+    """
+    Evaluate function on multiple processes of the local machine, without MPI.
+
+    The worker processes are forked, so each of them starts with its own copy of the state of
+    the calling process, for example a Problem that has been set up.  Only the arguments and
+    return values are sent between processes, so they must be picklable.  Where worker processes
+    cannot be forked, the cases are evaluated serially.
+
+    Parameters
+    ----------
+    func : function
+        The function to execute in workers.
+    cases : collection of function args
+        Entries are assumed to be of the form (args, kwargs) where
+        kwargs are allowed to be None and args should be a list or tuple.
+    num_procs : int
+        Maximum number of worker processes.
+    initializer : function or None
+        If given, called with no arguments in each worker process when it starts.
+
+    Returns
+    -------
+    list
+        The (return value, traceback) of each case, in the order of the cases.  The return
+        value is None if the case raised an error, and the traceback is None otherwise.
+    """
+    global _local_func
+
+    cases = list(cases)
+
+    _local_func = func
+    try:
+        if num_procs > 1 and len(cases) > 1 and _can_fork():
+            pool = multiprocessing.Pool(min(num_procs, len(cases)), initializer)
+            try:
+                return pool.map(_local_eval, cases, chunksize=1)
+            finally:
+                pool.close()
+                pool.join()
+
+        return [_local_eval(case) for case in cases]
+    finally:
+        _local_func = None
+
+
+def concurrent_eval_threads(func, cases, num_threads):
+    """
+    Evaluate function on a pool of threads in the current process.
+
+    This only pays off when func spends most of its time in code that releases the GIL, such as
+    NumPy/SciPy routines or external processes.  Cases are evaluated serially if num_threads is 1
+    or if there is only one case.
+
+    Parameters
+    ----------
+    func : function
+        The function to execute.  It is called with a single case as its argument.
+    cases : collection of function args
+        The argument of each call to func.
+    num_threads : int
+        Maximum number of threads.
+
+    Returns
+    -------
+    list
+        The return value of each case, in the order of the cases.  If any case raised an
+        exception, it is re-raised here after all cases have finished.
+    """
+    cases = list(cases)
+
+    if num_threads > 1 and len(cases) > 1:
+        pool = ThreadPool(min(num_threads, len(cases)))
+        try:
+            return pool.map(func, cases, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+
+    return [func(case) for case in cases]
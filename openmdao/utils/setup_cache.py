@@ -0,0 +1,211 @@
+"""
+A persistent cache of setup data that only depends on the structure of the model.
+"""
+import hashlib
+import os
+import tempfile
+
+from six import iteritems
+from six.moves import cPickle as pickle
+
+from openmdao import __version__
+
+
+class SetupCache(object):
+    """
+    Save setup data to disk, keyed on a hash of the model structure, and reload it later.
+
+    The model hierarchy and its variables are still built by calling setup on every system, but
+    the results of the more expensive phases that follow (currently the relevance graph and the
+    transfer indices) are read from the cache file when one exists for the same structure.
+
+    Attributes
+    ----------
+    directory : str
+        Directory that holds the cache files.
+    key : str or None
+        Hash of the model structure, set when the root system is set up.
+    loaded : bool
+        True if the setup data was read from an existing cache file.
+    _data : dict
+        Cached setup data.
+    _dirty : bool
+        True if data has been added since the cache file was read.
+    """
+
+    def __init__(self, directory):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        directory : str
+            Directory that holds the cache files. It is created if it does not exist.
+        """
+        self.directory = directory
+        self.key = None
+        self.loaded = False
+        self._data = {}
+        self._dirty = False
+
+    def _get_filename(self):
+        """
+        Return the name of the cache file for the current key.
+
+        Returns
+        -------
+        str
+            Path to the cache file.
+        """
+        return os.path.join(self.directory, 'setup_%s.pkl' % self.key)
+
+    def load(self, model, mode):
+        """
+        Compute the structure hash of the model and read the matching cache file, if any.
+
+        This is called by the root system during setup, once its variables and global
+        connections are known.
+
+        Parameters
+        ----------
+        model : <System>
+            The root system.
+        mode : str
+            Derivative direction, either 'fwd' or 'rev'.
+        """
+        self.key = get_structure_hash(model, mode)
+        self.loaded = False
+        self._data = {}
+        self._dirty = False
+
+        filename = self._get_filename()
+        if os.path.isfile(filename):
+            try:
+                with open(filename, 'rb') as f:
+                    data = pickle.load(f)
+            except Exception:
+                # A damaged cache file is just a miss; it is rewritten after setup.
+                return
+
+            if data.get('key') == self.key:
+                self._data = data
+                self.loaded = True
+
+    def get(self, name):
+        """
+        Return cached setup data.
+
+        Parameters
+        ----------
+        name : hashable
+            Name of the data.
+
+        Returns
+        -------
+        object or None
+            The cached data, or None if there is none.
+        """
+        return self._data.get(name)
+
+    def set(self, name, value):
+        """
+        Add setup data to the cache.
+
+        Parameters
+        ----------
+        name : hashable
+            Name of the data.
+        value : object
+            The data, which must be picklable.
+        """
+        if self.key is not None and name not in self._data:
+            self._data[name] = value
+            self._dirty = True
+
+    def save(self):
+        """
+        Write the cache file if any data has been added since it was read.
+        """
+        if not self._dirty:
+            return
+
+        if not os.path.isdir(self.directory):
+            try:
+                os.makedirs(self.directory)
+            except OSError:
+                # another process may have just created it
+                if not os.path.isdir(self.directory):
+                    raise
+
+        self._data['key'] = self.key
+
+        # Write to a temporary file first, so other processes never read a partial file.
+        fd, tmpname = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(self._data, f, pickle.HIGHEST_PROTOCOL)
+            filename = self._get_filename()
+            if os.path.exists(filename):
+                os.remove(filename)
+            os.rename(tmpname, filename)
+        except Exception:
+            if os.path.exists(tmpname):
+                os.remove(tmpname)
+            raise
+
+        self._dirty = False
+
+
+def get_structure_hash(model, mode):
+    """
+    Compute a hash of everything the cached setup data depends on.
+
+    Parameters
+    ----------
+    model : <System>
+        The root system, set up through its global connections.
+    mode : str
+        Derivative direction, either 'fwd' or 'rev'.
+
+    Returns
+    -------
+    str
+        Hex digest of the hash.
+    """
+    sha = hashlib.sha1()
+
+    def update(*items):
+        sha.update(repr(items).encode('utf-8'))
+
+    update(__version__, mode, model.comm.size, model.comm.rank, model._vec_names)
+
+    # system tree, including the distribution of subsystems over the procs
+    for system in model.system_iter(include_self=True, recurse=True):
+        update(system.pathname, type(system).__name__,
+               [s.name for s in system._subsystems_allprocs],
+               list(system._subsystems_myproc_inds))
+
+    # variables
+    allprocs_abs2meta = model._var_allprocs_abs2meta
+    abs2meta = model._var_abs2meta
+    for type_ in ('input', 'output'):
+        for abs_name in model._var_allprocs_abs_names[type_]:
+            meta = allprocs_abs2meta[abs_name]
+            update(type_, abs_name, meta['shape'], meta['var_set'])
+
+    for abs_name in model._var_abs_names['input']:
+        src_indices = abs2meta[abs_name]['src_indices']
+        if src_indices is not None:
+            update(abs_name, src_indices.shape, src_indices.dtype.str)
+            sha.update(src_indices.tobytes())
+
+    update(sorted(iteritems(model._conn_global_abs_in2out)))
+
+    # design vars and responses, which determine relevance
+    for kind, vois in (('desvars', model.get_design_vars(recurse=True, get_sizes=False)),
+                       ('responses', model.get_responses(recurse=True, get_sizes=False))):
+        update(kind)
+        for name, meta in iteritems(vois):
+            update(name, meta.get('parallel_deriv_color'), meta.get('vectorize_derivs'))
+
+    return sha.hexdigest()
@@ -0,0 +1,101 @@
+""" Unit tests for the persistent setup cache."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from openmdao.api import Problem, IndepVarComp, ExecComp
+from openmdao.test_suite.components.sellar import SellarDerivativesGrouped
+from openmdao.utils.assert_utils import assert_rel_error
+
+
+def _sellar_problem(add_con=True):
+    prob = Problem()
+    model = prob.model = SellarDerivativesGrouped()
+
+    model.add_design_var('z', lower=np.array([-10.0, 0.0]), upper=np.array([10.0, 10.0]))
+    model.add_design_var('x', lower=0.0, upper=10.0)
+    model.add_objective('obj')
+    if add_con:
+        model.add_constraint('con1', upper=0.0)
+    return prob
+
+
+class TestSetupCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp(prefix='test_setup_cache-')
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir, ignore_errors=True)
+
+    def _run(self, prob):
+        prob.setup(check=False, setup_cache=self.tempdir)
+        prob.run_model()
+        totals = prob.compute_totals(of=['obj', 'con1'], wrt=['x', 'z'])
+        return prob.model._setup_cache, prob['obj'].copy(), totals
+
+    def test_reload(self):
+        cache, obj, totals = self._run(_sellar_problem())
+        self.assertFalse(cache.loaded)
+        self.assertEqual(os.listdir(self.tempdir), ['setup_%s.pkl' % cache.key])
+
+        cache2, obj2, totals2 = self._run(_sellar_problem())
+        self.assertTrue(cache2.loaded)
+        self.assertEqual(cache2.key, cache.key)
+        self.assertFalse(cache2._dirty)
+
+        assert_rel_error(self, obj2, obj, 1e-12)
+        for key in totals:
+            assert_rel_error(self, totals2[key], totals[key], 1e-12)
+
+    def test_structure_change(self):
+        cache, obj, totals = self._run(_sellar_problem())
+
+        # a different response changes the relevance, so the cached data can't be used
+        cache2, obj2, totals2 = self._run(_sellar_problem(add_con=False))
+        self.assertFalse(cache2.loaded)
+        self.assertNotEqual(cache2.key, cache.key)
+        self.assertEqual(len(os.listdir(self.tempdir)), 2)
+        for key in totals:
+            assert_rel_error(self, totals2[key], totals[key], 1e-12)
+
+        # so do different src_indices
+        def build(src_indices):
+            prob = Problem()
+            model = prob.model
+            model.add_subsystem('px', IndepVarComp('x', np.arange(4.0)))
+            model.add_subsystem('comp', ExecComp('y = 2.0 * x', x=np.zeros(2), y=np.zeros(2)))
+            model.connect('px.x', 'comp.x', src_indices=src_indices)
+            prob.setup(check=False, setup_cache=self.tempdir)
+            prob.run_model()
+            return prob
+
+        prob = build([0, 1])
+        assert_rel_error(self, prob['comp.y'], [0.0, 2.0], 1e-15)
+        prob = build([3, 2])
+        self.assertFalse(prob.model._setup_cache.loaded)
+        assert_rel_error(self, prob['comp.y'], [6.0, 4.0], 1e-15)
+        prob = build([0, 1])
+        self.assertTrue(prob.model._setup_cache.loaded)
+        assert_rel_error(self, prob['comp.y'], [0.0, 2.0], 1e-15)
+
+    def test_damaged_file(self):
+        cache, obj, totals = self._run(_sellar_problem())
+
+        with open(os.path.join(self.tempdir, 'setup_%s.pkl' % cache.key), 'wb') as f:
+            f.write(b'not a pickle')
+
+        cache2, obj2, totals2 = self._run(_sellar_problem())
+        self.assertFalse(cache2.loaded)
+        assert_rel_error(self, obj2, obj, 1e-12)
+
+        cache3, obj3, totals3 = self._run(_sellar_problem())
+        self.assertTrue(cache3.loaded)
+
+
+if __name__ == '__main__':
+    unittest.main()
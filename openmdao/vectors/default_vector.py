@@ -13,11 +13,87 @@ from openmdao.vectors.vector import Vector, Transfer
 real_types = tuple([numbers.Real, np.float32, np.float64])
 
 
+# Contiguous runs shorter than this are gathered with the leftover indices, because a separate
+# slice copy costs more than indexing a few extra entries.
+_MIN_SLICE_RUN = 16
+
+
+def _compile_transfer_plan(in_inds, out_inds):
+    """
+    Split a transfer into contiguous slice copies and a leftover set of scattered indices.
+
+    Parameters
+    ----------
+    in_inds : int ndarray
+        input indices for the transfer.
+    out_inds : int ndarray
+        output indices for the transfer.
+
+    Returns
+    -------
+    list of (slice, slice)
+        Input and output slices of the contiguous runs.
+    int ndarray
+        input indices that are not part of a contiguous run.
+    int ndarray
+        output indices that are not part of a contiguous run.
+    """
+    in_inds = np.asarray(in_inds, dtype=int)
+    out_inds = np.asarray(out_inds, dtype=int)
+
+    if len(in_inds) < _MIN_SLICE_RUN:
+        return [], in_inds, out_inds
+
+    # a run ends wherever either index array stops increasing by one
+    breaks = np.nonzero((np.diff(in_inds) != 1) | (np.diff(out_inds) != 1))[0] + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks, [len(in_inds)]))
+
+    slices = []
+    rest = np.ones(len(in_inds), dtype=bool)
+    for start, end in zip(starts, ends):
+        if end - start >= _MIN_SLICE_RUN:
+            slices.append((slice(in_inds[start], in_inds[end - 1] + 1),
+                           slice(out_inds[start], out_inds[end - 1] + 1)))
+            rest[start:end] = False
+
+    return slices, in_inds[rest], out_inds[rest]
+
+
 class DefaultTransfer(Transfer):
     """
     Default NumPy transfer.
+
+    Attributes
+    ----------
+    _plans : dict
+        Contiguous slice copies and leftover indices of each transfer, keyed on the pair of
+        input and output set names.
+    _buffers : dict
+        Preallocated arrays that the leftover output entries are gathered into.
     """
 
+    def __init__(self, in_vec, out_vec, in_inds, out_inds, comm):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        in_vec : <Vector>
+            pointer to the input vector.
+        out_vec : <Vector>
+            pointer to the output vector.
+        in_inds : int ndarray
+            input indices for the transfer.
+        out_inds : int ndarray
+            output indices for the transfer.
+        comm : MPI.Comm or <FakeComm>
+            communicator of the system that owns this transfer.
+        """
+        self._plans = {}
+        self._buffers = {}
+        super(DefaultTransfer, self).__init__(in_vec, out_vec, in_inds, out_inds, comm)
+
     def _initialize_transfer(self, in_vec, out_vec):
         """
         Set up the transfer; do any necessary pre-computation.
@@ -45,6 +121,37 @@ class DefaultTransfer(Transfer):
         self._in_inds = ins
         self._out_inds = outs
 
+        self._plans = plans = {}
+        self._buffers = {}
+        for key in ins:
+            plans[key] = _compile_transfer_plan(ins[key], outs[key])
+
+    def _gather(self, key, data, inds):
+        """
+        Gather the leftover output entries of a transfer into its preallocated buffer.
+
+        Parameters
+        ----------
+        key : (str, str)
+            input and output set names of the transfer.
+        data : ndarray
+            data array of the output vector.
+        inds : int ndarray
+            output indices to gather.
+
+        Returns
+        -------
+        ndarray
+            The buffer, holding the gathered entries.
+        """
+        shape = (len(inds),) + data.shape[1:]
+        buf = self._buffers.get(key)
+        if buf is None or buf.shape != shape or buf.dtype != data.dtype:
+            buf = self._buffers[key] = np.empty(shape, dtype=data.dtype)
+
+        # the indices were validated during setup, so skip the bounds check and its buffering
+        return np.take(data, inds, axis=0, out=buf, mode='clip')
+
     def transfer(self, in_vec, out_vec, mode='fwd'):
         """
         Perform transfer.
@@ -59,30 +166,40 @@ class DefaultTransfer(Transfer):
             'fwd' or 'rev'.
 
         """
-        in_inds = self._in_inds
-        out_inds = self._out_inds
+        plans = self._plans
 
         if mode == 'fwd':
             do_complex = in_vec._vector_info._under_complex_step and out_vec._alloc_complex
 
-            for key in in_inds:
+            for key, (slices, rest_in, rest_out) in iteritems(plans):
                 in_set_name, out_set_name = key
-                # this works whether the vecs have multi columns or not due to broadcasting
-                in_vec._data[in_set_name][in_inds[key]] = \
-                    out_vec._data[out_set_name][out_inds[key]]
+
+                datas = [(in_vec._data[in_set_name], out_vec._data[out_set_name])]
 
                 # Imaginary transfer
                 # (for CS, so only need in fwd)
                 if do_complex:
-                    in_vec._imag_data[in_set_name][in_inds[key]] = \
-                        out_vec._imag_data[out_set_name][out_inds[key]]
+                    datas.append((in_vec._imag_data[in_set_name],
+                                  out_vec._imag_data[out_set_name]))
+
+                # this works whether the vecs have multi columns or not due to broadcasting
+                for in_data, out_data in datas:
+                    for in_slice, out_slice in slices:
+                        np.copyto(in_data[in_slice], out_data[out_slice])
+                    if len(rest_in) > 0:
+                        in_data[rest_in] = self._gather(key, out_data, rest_out)
 
         else:  # rev
-            for key in in_inds:
+            for key, (slices, rest_in, rest_out) in iteritems(plans):
                 in_set_name, out_set_name = key
-                np.add.at(
-                    out_vec._data[out_set_name], out_inds[key],
-                    in_vec._data[in_set_name][in_inds[key]])
+                in_data = in_vec._data[in_set_name]
+                out_data = out_vec._data[out_set_name]
+
+                # output indices are distinct within a run, so a slice add is safe
+                for in_slice, out_slice in slices:
+                    out_data[out_slice] += in_data[in_slice]
+                if len(rest_in) > 0:
+                    np.add.at(out_data, rest_out, in_data[rest_in])
 
 
 class DefaultVector(Vector):
@@ -346,12 +463,17 @@ class DefaultVector(Vector):
         allprocs_abs2idx_byset_t = system._var_allprocs_abs2idx_byset[self._name]
         sizes_byset_t = system._var_sizes_byset[self._name][type_]
         abs2meta = system._var_abs2meta
+
+        # end of each variable in the data of its var_set on this proc
+        ends_byset = {set_name: np.cumsum(sizes[iproc, :])
+                      for set_name, sizes in iteritems(sizes_byset_t)}
+
         for abs_name in system._var_relevant_names[self._name][type_]:
             idx_byset = allprocs_abs2idx_byset_t[abs_name]
             set_name = abs2meta[abs_name]['var_set']
 
-            ind_byset1 = np.sum(sizes_byset_t[set_name][iproc, :idx_byset])
-            ind_byset2 = np.sum(sizes_byset_t[set_name][iproc, :idx_byset + 1])
+            ind_byset2 = ends_byset[set_name][idx_byset]
+            ind_byset1 = ind_byset2 - sizes_byset_t[set_name][iproc, idx_byset]
             shape = abs2meta[abs_name]['shape']
             if ncol > 1:
                 if not isinstance(shape, tuple):
@@ -1,6 +1,10 @@
 import unittest
 
-from openmdao.api import Problem, IndepVarComp
+import numpy as np
+
+from openmdao.api import Problem, IndepVarComp, ExecComp
+from openmdao.utils.assert_utils import assert_rel_error
+from openmdao.vectors.default_vector import _compile_transfer_plan
 
 try:
     from openmdao.parallel_api import PETScVector
@@ -52,6 +56,55 @@ class TestVector(unittest.TestCase):
 
         self.assertEqual(new_vec.dot(p.model._outputs), 9.)
 
+    def test_name_lookup(self):
+        p = Problem()
+        comp = IndepVarComp()
+        comp.add_output('v1', val=np.ones(3))
+        comp.add_output('v2', val=2.0)
+        p.model.add_subsystem('des_vars', comp, promotes=['v1'])
+        p.setup()
+        p.final_setup()
+
+        outputs = p.model._outputs
+
+        # promoted and relative names resolve to the same views, before and after caching.
+        for i in range(2):
+            assert_rel_error(self, outputs['v1'], np.ones(3), 1e-15)
+            assert_rel_error(self, outputs['des_vars.v1'], np.ones(3), 1e-15)
+            assert_rel_error(self, outputs['des_vars.v2'], 2.0, 1e-15)
+            self.assertTrue('v1' in outputs)
+            self.assertFalse('v2' in outputs)
+
+        outputs['v1'] = np.array([1., 2., 3.])
+        assert_rel_error(self, outputs['des_vars.v1'], np.array([1., 2., 3.]), 1e-15)
+        outputs['v1'] = 5.0
+        assert_rel_error(self, outputs['des_vars.v1'], 5.0 * np.ones(3), 1e-15)
+
+        with self.assertRaises(ValueError):
+            outputs['v1'] = np.ones(4)
+
+        # names outside the current context are not found.
+        outputs._names = set(['des_vars.v2'])
+        try:
+            self.assertFalse('v1' in outputs)
+            with self.assertRaises(KeyError):
+                outputs['v1']
+        finally:
+            outputs._names = outputs._views
+
+        self.assertTrue('v1' in outputs)
+
+    def test_ambiguous_promoted_input(self):
+        p = Problem()
+        p.model.add_subsystem('c1', ExecComp('y=2.0*x'), promotes=['x'])
+        p.model.add_subsystem('c2', ExecComp('y=3.0*x'), promotes=['x'])
+        p.setup()
+        p.final_setup()
+
+        for i in range(2):
+            with self.assertRaises(RuntimeError):
+                p.model._inputs['x']
+
     def test_dot_petsc(self):
         if not PETScVector:
             raise unittest.SkipTest("PETSc is not installed")
@@ -70,5 +123,50 @@ class TestVector(unittest.TestCase):
         self.assertEqual(new_vec.dot(p.model._outputs), 9.)
 
 
+class TestDefaultTransfer(unittest.TestCase):
+
+    def test_compile_plan(self):
+        in_inds = np.concatenate((np.arange(20), [30, 25], np.arange(40, 60)))
+        out_inds = np.concatenate((np.arange(100, 110), np.arange(0, 10), [7, 7],
+                                   np.arange(60, 80)))
+
+        slices, rest_in, rest_out = _compile_transfer_plan(in_inds, out_inds)
+
+        # the first 20 entries are two runs of 10, too short to be worth a slice copy
+        self.assertEqual(slices, [(slice(40, 60), slice(60, 80))])
+        np.testing.assert_array_equal(rest_in, in_inds[:22])
+        np.testing.assert_array_equal(rest_out, out_inds[:22])
+
+    def test_transfer(self):
+        n = 50
+        src_indices = np.concatenate((np.arange(n - 1, -1, -1), np.arange(20, n)))
+
+        p = Problem()
+        model = p.model
+        model.add_subsystem('px', IndepVarComp('x', np.arange(n, dtype=float)))
+        model.add_subsystem('whole', ExecComp('y = 2.0 * x', x=np.zeros(n), y=np.zeros(n)))
+        model.add_subsystem('part', ExecComp('y = 3.0 * x', x=np.zeros(2 * n - 20),
+                                             y=np.zeros(2 * n - 20)))
+        model.add_subsystem('obj', ExecComp('f = sum(a) + sum(b)', a=np.zeros(n),
+                                            b=np.zeros(2 * n - 20)))
+        model.connect('px.x', 'whole.x')
+        model.connect('px.x', 'part.x', src_indices=src_indices)
+        model.connect('whole.y', 'obj.a')
+        model.connect('part.y', 'obj.b')
+
+        for mode in ('fwd', 'rev'):
+            p.setup(check=False, mode=mode)
+            p.run_model()
+
+            assert_rel_error(self, p['whole.x'], np.arange(n), 1e-15)
+            assert_rel_error(self, p['part.x'], src_indices, 1e-15)
+
+            # x[20:] feeds part.x twice, and every entry feeds whole.x
+            expected = 2.0 * np.ones(n) + 3.0
+            expected[20:] += 3.0
+            J = p.compute_totals(of=['obj.f'], wrt=['px.x'])
+            assert_rel_error(self, J['obj.f', 'px.x'][0], expected, 1e-10)
+
+
 if __name__ == '__main__':
     unittest.main()
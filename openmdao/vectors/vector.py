@@ -5,7 +5,7 @@ import numpy as np
 from six import iteritems, PY3
 
 from openmdao.utils.general_utils import ensure_compatible
-from openmdao.utils.name_maps import name2abs_name
+from openmdao.utils.name_maps import prom_name2abs_name, rel_name2abs_name
 
 
 _full_slice = slice(None)
@@ -64,6 +64,9 @@ class Vector(object):
         Dictionary mapping absolute variable names to the flattened ndarray views.
     _names : set([str, ...])
         Set of variables that are relevant in the current context.
+    _name_cache : dict
+        Maps promoted or relative names to a tuple of the absolute name resolved against all
+        variables and the (promoted, relative) absolute name candidates.
     _root_vector : Vector
         Pointer to the vector owned by the root system.
     _alloc_complex : Bool
@@ -147,6 +150,7 @@ class Vector(object):
         # self._names will either be equivalent to self._views or to the
         # set of variables relevant to the current matvec product.
         self._names = self._views
+        self._name_cache = {}
 
         self._root_vector = None
         self._data = {}
@@ -337,8 +341,48 @@ class Vector(object):
         boolean
             True or False.
         """
-        abs_name = name2abs_name(self._system, name, self._names, self._typ)
-        return abs_name is not None
+        return self._name2abs_name(name) is not None
+
+    def _name2abs_name(self, name):
+        """
+        Map the given promoted or relative name to the absolute name.
+
+        The absolute name is resolved once against all variables in the vector and cached.  When
+        only a subset of the variables is relevant in the current context, the full resolution
+        rules are applied to the cached candidates.
+
+        Parameters
+        ----------
+        name : str
+            Promoted or relative variable name in the owning system's namespace.
+
+        Returns
+        -------
+        str or None
+            Absolute variable name if unique abs_name found or None otherwise.
+        """
+        try:
+            abs_name, prom_abs_name, rel_abs_name = self._name_cache[name]
+        except KeyError:
+            system = self._system
+            prom_abs_name = prom_name2abs_name(system, name, self._typ)
+            rel_abs_name = rel_name2abs_name(system, name)
+            if prom_abs_name in self._views:
+                abs_name = prom_abs_name
+            elif rel_abs_name in self._views:
+                abs_name = rel_abs_name
+            else:
+                abs_name = None
+            self._name_cache[name] = (abs_name, prom_abs_name, rel_abs_name)
+
+        names = self._names
+        if names is self._views:
+            return abs_name
+        if prom_abs_name in names:
+            return prom_abs_name
+        if rel_abs_name in names:
+            return rel_abs_name
+        return None
 
     def __getitem__(self, name):
         """
@@ -354,7 +398,12 @@ class Vector(object):
         float or ndarray
             variable value (not scaled, not dimensionless).
         """
-        abs_name = name2abs_name(self._system, name, self._names, self._typ)
+        cached = self._name_cache.get(name)
+        if cached is not None and self._names is self._views:
+            abs_name = cached[0]
+        else:
+            abs_name = self._name2abs_name(name)
+
         if abs_name is not None:
             if self._vector_info._under_complex_step:
                 if self._typ == 'input':
@@ -394,9 +443,20 @@ class Vector(object):
         value : float or list or tuple or ndarray
             variable value to set (not scaled, not dimensionless)
         """
-        abs_name = name2abs_name(self._system, name, self._names, self._typ)
+        cached = self._name_cache.get(name)
+        if cached is not None and self._names is self._views:
+            abs_name = cached[0]
+        else:
+            abs_name = self._name2abs_name(name)
+
         if abs_name is not None:
             if self._icol is None:
+                # fast path for assigning an array of the right shape.
+                if not self._vector_info._under_complex_step and isinstance(value, np.ndarray):
+                    view = self._views[abs_name]
+                    if value.shape == view.shape:
+                        view[:] = value
+                        return
                 slc = _full_slice
             else:
                 slc = (_full_slice, self._icol)